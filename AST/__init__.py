@@ -4,9 +4,15 @@ from .blocks import *
 from .comment_box import *
 from .connections import *
 from .formalparam import *
+from .dataflow_graph import DataflowGraph
+from .dependency_matrix import DependencyMatrix
+from .design_rules import AnalysisContext, DesignRule, design_rule
+from .geometry import BoxTable, LineTable
 from .path import PathDivide
+from .port_table import BlockPorts, PortTable
 from .rectangle import Rectangle
 from .program import Program
+from .project import Project
 from .variables import *
 
 DRACONIS_AST_VERSION = Program.VERSION()
\ No newline at end of file
@@ -4,7 +4,7 @@ from typing import Set
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Port:
     portID: int
     rel_connection_direction: ConnectionDirection
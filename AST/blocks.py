@@ -11,6 +11,7 @@ from .connections import (
 from typing import Dict
 from .formalparam import ParamList
 from .block_port import Port
+from .port_table import BlockPorts
 
 
 @dataclass
@@ -46,6 +47,18 @@ class Block:
             if p.rel_connection_direction == ConnectionDirection.Output
         ]
 
+    def getPortIDs(self, direction: ConnectionDirection):
+        """The IDs of the ports of the given direction, without creating Port objects for ports in a PortTable"""
+        if isinstance(self.ports, BlockPorts):
+            return self.ports.portIDs(direction)
+        return [p.portID for p in self.ports.values() if p.rel_connection_direction == direction]
+
+    def getPortConnections(self, portID: int):
+        """The IDs of the ports connected to one of the ports of the block"""
+        if isinstance(self.ports, BlockPorts):
+            return self.ports.connections(portID)
+        return self.ports[portID].connections
+
     def getID(self):
         return self.data.localID
 
@@ -109,8 +122,8 @@ class VarBlock(Block):
 
     def getFlowOverBlock(self, data_flow_dir: DataflowDirection, _unused_=None):
         ID = self.getID()
-        toPorts = (
-            self.getInPorts() if self.data.type == "outVariable" else self.getOutPorts()
+        toPorts = self.getPortIDs(
+            ConnectionDirection.Input if self.data.type == "outVariable" else ConnectionDirection.Output
         )
         if (
                 DataflowDirection.Forward == data_flow_dir
@@ -126,8 +139,8 @@ class VarBlock(Block):
             return []
         result = []
         for p in toPorts:
-            for conn in p.connections:
-                result.append((p.portID, conn))
+            for conn in self.getPortConnections(p):
+                result.append((p, conn))
         return [(ID, result)]
 
     def getBlockType(self):
@@ -214,20 +227,20 @@ class FBD_Block(Block):
         def intra_block_tracing(fromPorts, toPorts):
             result = []
             _fromPorts = (
-                [p for p in fromPorts if p.portID == restrictToPortID]
+                [p for p in fromPorts if p == restrictToPortID]
                 if restrictToPortID
                 else fromPorts
             )
             for fP in _fromPorts:
                 tmpRes = []
                 for tP in toPorts:
-                    for conn in tP.connections:
-                        tmpRes.append((tP.portID, conn))
-                result.append((fP.portID, tmpRes))
+                    for conn in self.getPortConnections(tP):
+                        tmpRes.append((tP, conn))
+                result.append((fP, tmpRes))
             return result
 
-        in_ports = self.getInPorts()
-        out_ports = self.getOutPorts()
+        in_ports = self.getPortIDs(ConnectionDirection.Input)
+        out_ports = self.getPortIDs(ConnectionDirection.Output)
         result = []
         # Basic fully-connected calculation
         # Todo: Connect to outside
@@ -1,7 +1,6 @@
 import json
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional
 
 from .ast_typing import DataflowDirection
 from utility_classes.position import GUIPosition, make_absolute_position
@@ -30,8 +29,9 @@ class ConnectionDirection(IntEnum):
 
 @dataclass
 class ConnectionData:
-    position = GUIPosition
-    connectionIndex = Optional[int]
+    # Not dataclass fields: all ConnectionData compare equal, which the connection comparisons rely on
+    # position: GUIPosition, connectionIndex: Optional[int]
+    __slots__ = ("position", "connectionIndex")
 
     def __init__(self, pos=None, connIndex=None):
         self.position = pos or make_absolute_position(-1, -1)
@@ -80,7 +80,7 @@ def test_fromConnectionData_to_json_and_back():
         assert ConnectionData.fromJSON(cd.toJSON()) == cd
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     startPoint: ConnectionData
     endPoint: ConnectionData
@@ -147,7 +147,7 @@ def trace_connection_in_dataflow_direction_list_version(
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionPoint:
     connectionDir: ConnectionDirection
     connections: list[Connection]
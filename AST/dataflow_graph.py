@@ -0,0 +1,244 @@
+from array import array
+from collections import deque
+from operator import sub
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .ast_typing import DataflowDirection
+from .blocks import FBD_Block, VarBlock
+from .connections import ConnectionDirection
+from .utilities import to_csr
+
+# Node kinds
+NODE_IN_VARIABLE = 0
+NODE_OUT_VARIABLE = 1
+NODE_BLOCK = 2
+NODE_INPUT_PORT = 3
+NODE_OUTPUT_PORT = 4
+
+
+class DataflowGraph:
+    """
+    Integer-indexed directed graph of the data flow in a code worksheet.
+
+    Nodes are the FBD blocks, their ports and the in/out variable blocks, numbered densely from 0 in
+    the order of the behaviour elements. A variable block is a single node, as it is its own port.
+    Edges point in the direction of the data flow:
+        wire: output port (or inVariable) -> input port (or outVariable)
+        over a block: input port -> block -> output port
+    Edges are stored in compressed sparse row form, in both directions: the targets of node i are
+    targets[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, node_ids: List[int], node_kinds: List[int], node_blocks: List[int], edges: Iterable):
+        # index -> localId, and localId -> index
+        self.node_ids = array("q", node_ids)
+        self.index_of: Dict[int, int] = {local_id: i for i, local_id in enumerate(node_ids)}
+        self.node_kinds = array("b", node_kinds)
+        # index -> index of the node of the block owning it
+        self.node_blocks = array("l", node_blocks)
+        edges = list(edges)
+        self.forward_offsets, self.forward_targets = to_csr(len(node_ids), edges)
+        self.backward_offsets, self.backward_targets = to_csr(len(node_ids), edges, transpose=True)
+
+    @classmethod
+    def from_behaviour_elements(cls, behaviour_elements, ports):
+        """
+        Builds the graph from the blocks of a program, after their ports have been set up.
+        Args:
+            behaviour_elements: The blocks of the program
+            ports: The PortTable of the program
+        """
+        node_ids, node_kinds, node_blocks = [], [], []
+
+        def add_node(local_id, kind, block_index):
+            node_ids.append(local_id)
+            node_kinds.append(kind)
+            node_blocks.append(block_index)
+            return len(node_ids) - 1
+
+        intra_block_edges = []
+        for block in behaviour_elements:
+            if isinstance(block, VarBlock):
+                kind = NODE_IN_VARIABLE if block.data.type == "inVariable" else NODE_OUT_VARIABLE
+                add_node(block.getID(), kind, len(node_ids))
+            elif isinstance(block, FBD_Block):
+                block_index = add_node(block.getID(), NODE_BLOCK, len(node_ids))
+                for port_id in ports.portIDsOf(block.getID()):
+                    if ports.directions[ports.slot(port_id)] == ConnectionDirection.Input:
+                        port_index = add_node(port_id, NODE_INPUT_PORT, block_index)
+                        intra_block_edges.append((port_index, block_index))
+                    else:
+                        port_index = add_node(port_id, NODE_OUTPUT_PORT, block_index)
+                        intra_block_edges.append((block_index, port_index))
+
+        index_of = {local_id: i for i, local_id in enumerate(node_ids)}
+        # Connections are stored on both ends. The receiving end knows the direction of the wire
+        wire_edges = [
+            (index_of[source_id], index_of[port_id])
+            for port_id in ports
+            if ports.directions[ports.slot(port_id)] == ConnectionDirection.Input and port_id in index_of
+            for source_id in ports.connections(port_id)
+            if source_id in index_of
+        ]
+        return DataflowGraph(node_ids, node_kinds, node_blocks, intra_block_edges + wire_edges)
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def nr_of_edges(self):
+        return len(self.forward_targets)
+
+    def successors(self, index: int):
+        return self.forward_targets[self.forward_offsets[index]:self.forward_offsets[index + 1]]
+
+    def predecessors(self, index: int):
+        return self.backward_targets[self.backward_offsets[index]:self.backward_offsets[index + 1]]
+
+    def neighbours(self, index: int, direction: DataflowDirection):
+        return self.successors(index) if direction == DataflowDirection.Forward else self.predecessors(index)
+
+    def nodes_of_kind(self, kind: int) -> List[int]:
+        return [i for i, k in enumerate(self.node_kinds) if k == kind]
+
+    def reachable(self, start_indexes: Iterable[int], direction=DataflowDirection.Forward,
+                  stop: Optional[Callable[[int], bool]] = None) -> List[int]:
+        """
+        Breadth first traversal, linear in the size of the graph.
+        Args:
+            start_indexes: The node indexes to start from
+            direction: Follow the data flow (Forward), or go against it (Backward)
+            stop: Optional predicate on node indexes. The traversal does not continue past nodes matching it
+
+        Returns: The indexes of all reached nodes, including the start nodes, in order of discovery
+        """
+        offsets, targets = (
+            (self.forward_offsets, self.forward_targets)
+            if direction == DataflowDirection.Forward
+            else (self.backward_offsets, self.backward_targets)
+        )
+        visited = bytearray(len(self.node_ids))
+        result = []
+        queue = deque()
+        for i in start_indexes:
+            if not visited[i]:
+                visited[i] = 1
+                result.append(i)
+                queue.append(i)
+        while queue:
+            i = queue.popleft()
+            if stop is not None and stop(i):
+                continue
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if not visited[j]:
+                    visited[j] = 1
+                    result.append(j)
+                    queue.append(j)
+        return result
+
+    def islands(self) -> List[List[int]]:
+        """The weakly connected components of the graph, as lists of node indexes"""
+        component = array("l", [-1] * len(self.node_ids))
+        result = []
+        for start in range(len(self.node_ids)):
+            if component[start] != -1:
+                continue
+            component[start] = len(result)
+            members = [start]
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                for j in (*self.successors(i), *self.predecessors(i)):
+                    if component[j] == -1:
+                        component[j] = len(result)
+                        members.append(j)
+                        stack.append(j)
+            result.append(sorted(members))
+        return result
+
+    def topological_order(self) -> List[int]:
+        """
+        Kahn's algorithm: node indexes, each after all its predecessors.
+        Nodes on a cycle, and nodes only reachable over a cycle, are left out.
+        """
+        offsets, targets = self.forward_offsets, self.forward_targets
+        in_degree = array("l", map(sub, self.backward_offsets[1:], self.backward_offsets[:-1]))
+        ready = [i for i, d in enumerate(in_degree) if d == 0]
+        result = []
+        while ready:
+            i = ready.pop()
+            result.append(i)
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    ready.append(j)
+        return result
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Tarjan's algorithm, with an explicit stack instead of recursion, linear in the size of the graph.
+        Returns: The strongly connected components, as sorted lists of node indexes.
+        Every component comes after all components it has edges to, i.e., in reverse topological order.
+        """
+        nr_of_nodes = len(self.node_ids)
+        offsets, targets = self.forward_offsets, self.forward_targets
+        order = array("l", [-1] * nr_of_nodes)
+        low = array("l", [0] * nr_of_nodes)
+        on_stack = bytearray(nr_of_nodes)
+        stack = []
+        result = []
+        counter = 0
+        for root in range(nr_of_nodes):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            # (node, position of its next edge in targets)
+            work = [(root, offsets[root])]
+            while work:
+                i, edge = work[-1]
+                if edge < offsets[i + 1]:
+                    work[-1] = (i, edge + 1)
+                    j = targets[edge]
+                    if order[j] == -1:
+                        order[j] = low[j] = counter
+                        counter += 1
+                        stack.append(j)
+                        on_stack[j] = 1
+                        work.append((j, offsets[j]))
+                    elif on_stack[j] and order[j] < low[i]:
+                        low[i] = order[j]
+                    continue
+                work.pop()
+                if work and low[i] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[i]
+                if low[i] == order[i]:
+                    component = []
+                    while True:
+                        j = stack.pop()
+                        on_stack[j] = 0
+                        component.append(j)
+                        if j == i:
+                            break
+                    result.append(sorted(component))
+        return result
+
+    def cycles(self) -> List[List[int]]:
+        """
+        The feedback loops: the strongly connected components containing a cycle, i.e., of more than one node,
+        or a node with an edge to itself. Ordered by their smallest node index
+        """
+        if not self.has_cycle():
+            # Topological sorting is cheaper than finding the components
+            return []
+        return sorted(
+            c for c in self.strongly_connected_components() if len(c) > 1 or c[0] in self.successors(c[0])
+        )
+
+    def has_cycle(self) -> bool:
+        """The graph is acyclic if and only if all nodes can be put in topological order"""
+        return len(self.topological_order()) != len(self.node_ids)
+
+    def ids(self, indexes: Iterable[int]) -> List[int]:
+        return [self.node_ids[i] for i in indexes]
@@ -0,0 +1,89 @@
+from typing import Dict, List
+
+from .dataflow_graph import DataflowGraph, NODE_IN_VARIABLE, NODE_OUT_VARIABLE
+
+
+class DependencyMatrix:
+    """
+    Which sources reach which outputs of a program.
+
+    Rows are the output expressions, in the order of the outVariable blocks. Columns are the source
+    expressions: first every variable of the variable sheet, by its index in the sheet, then the
+    remaining expressions of inVariable blocks (constants, unknown names) in block order.
+    Each row is a Python int used as bitset over the columns.
+    """
+
+    def __init__(self, sources: List[str], outputs: List[str], rows: List[int]):
+        self.sources = sources
+        self.source_index: Dict[str, int] = {s: i for i, s in enumerate(sources)}
+        self.outputs = outputs
+        self.output_index: Dict[str, int] = {o: i for i, o in enumerate(outputs)}
+        self.rows = rows
+
+    @classmethod
+    def from_graph(cls, graph: DataflowGraph, behaviour_id_map, variable_names: List[str]):
+        """
+        Builds the matrix in a single pass over the strongly connected components of the graph in
+        topological order, each component receiving the union of the bitsets of its predecessors.
+        """
+        sources = list(dict.fromkeys(variable_names))
+        source_index = {s: i for i, s in enumerate(sources)}
+
+        def expr_of(node):
+            return behaviour_id_map[graph.node_ids[node]].getVarExpr()
+
+        bits = [0] * len(graph)
+        for node in graph.nodes_of_kind(NODE_IN_VARIABLE):
+            expr = expr_of(node)
+            if expr not in source_index:
+                source_index[expr] = len(sources)
+                sources.append(expr)
+            bits[node] = 1 << source_index[expr]
+
+        # Feedback loops are condensed into a single node: every node of a loop reaches all others
+        for component in reversed(graph.strongly_connected_components()):
+            component_bits = 0
+            for i in component:
+                component_bits |= bits[i]
+                for j in graph.predecessors(i):
+                    component_bits |= bits[j]
+            for i in component:
+                bits[i] = component_bits
+
+        output_rows = dict()
+        for node in graph.nodes_of_kind(NODE_OUT_VARIABLE):
+            expr = expr_of(node)
+            # An output written by several blocks depends on the sources of all of them
+            output_rows[expr] = output_rows.get(expr, 0) | bits[node]
+        return DependencyMatrix(sources, list(output_rows), list(output_rows.values()))
+
+    def _columns(self, bitset: int) -> List[str]:
+        result = []
+        while bitset:
+            low_bit = bitset & -bitset
+            result.append(self.sources[low_bit.bit_length() - 1])
+            bitset ^= low_bit
+        return result
+
+    def depends_on(self, output: str, source: str) -> bool:
+        i = self.source_index.get(source, None)
+        return i is not None and output in self.output_index and bool(self.rows[self.output_index[output]] >> i & 1)
+
+    def sources_of(self, output: str) -> List[str]:
+        """The sources the output depends on, in column order"""
+        return self._columns(self.rows[self.output_index[output]])
+
+    def outputs_of(self, source: str) -> List[str]:
+        """The outputs depending on the source, in row order"""
+        bit = 1 << self.source_index[source]
+        return [o for o, row in zip(self.outputs, self.rows) if row & bit]
+
+    def used_sources(self) -> List[str]:
+        """The sources which reach at least one output, in column order"""
+        used = 0
+        for row in self.rows:
+            used |= row
+        return self._columns(used)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {o: self._columns(row) for o, row in zip(self.outputs, self.rows)}
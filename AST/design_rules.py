@@ -0,0 +1,269 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from checks.rule_utility_functions import prefix_collisions
+from .ast_typing import ValueType
+from .language_detection import string_is_in_language
+
+# The analysis artifacts rules can consume, by name: how each is obtained from the program
+ARTIFACTS: Dict[str, Callable] = {
+    "metrics": lambda program: program.getMetrics(),
+    "var_sheet": lambda program: program.varHeader,
+    "variables": lambda program: program.varHeader.getAllVariables(),
+    "comments": lambda program: program.comments,
+    "unsafe_flows": lambda program: program.checkSafeDataFlow(),
+    "dependency_matrix": lambda program: program.getDependencyMatrix(),
+}
+
+
+@dataclass(frozen=True)
+class DesignRule:
+    """
+    A rule of the design rule report. evaluate is called with the artifacts the rule consumes,
+    in the order they are declared, and returns the [name, verdict, justification] of the rule
+    """
+    name: str
+    artifacts: Tuple[str, ...]
+    evaluate: Callable[..., List[str]]
+
+
+# All design rules, by name, in the order of the report
+RULES: Dict[str, DesignRule] = dict()
+
+
+def design_rule(name: str, *artifacts: str):
+    """Registers the decorated function as the evaluation of a design rule, consuming the named artifacts"""
+    unknown = [a for a in artifacts if a not in ARTIFACTS]
+    if unknown:
+        raise ValueError(f"Design rule {name} consumes unknown artifacts: {unknown}")
+
+    def register(evaluate):
+        RULES[name] = DesignRule(name, artifacts, evaluate)
+        return evaluate
+
+    return register
+
+
+class AnalysisContext:
+    """
+    The artifacts of one program, and the results of the rules evaluated against it.
+    Both are computed on first use only, and shared by all rules. The rules are evaluated from several threads
+    with jobs > 1, once their artifacts are computed: computing them fills the analysis cache of the program.
+    Rules are evaluated with their default parameters, unless options gives keyword arguments for them,
+    e.g. {"FBD.Naming.Uniqueness": {"symbol_lengths": (8, 16, 31, 63)}}.
+    """
+
+    def __init__(self, program, options: Optional[Dict[str, Dict]] = None):
+        self.program = program
+        self.options = dict() if options is None else options
+        self._artifacts = dict()
+        self._results = dict()
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled, a new one is created on unpickling
+        return {k: v for k, v in self.__dict__.items() if k != "_lock"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def artifact(self, name: str):
+        if name not in self._artifacts:
+            with self._lock:
+                if name not in self._artifacts:
+                    self._artifacts[name] = ARTIFACTS[name](self.program)
+        return self._artifacts[name]
+
+    def evaluate(self, rule_name: str) -> List[str]:
+        if rule_name not in self._results:
+            rule = RULES[rule_name]
+            result = rule.evaluate(*[self.artifact(a) for a in rule.artifacts], **self.options.get(rule_name, {}))
+            with self._lock:
+                self._results.setdefault(rule_name, result)
+        return self._results[rule_name]
+
+    def evaluate_rules(self, rule_names: Optional[Iterable[str]] = None, jobs: int = 1) -> List[List[str]]:
+        """
+        Args:
+            rule_names: The rules to evaluate, all rules if None
+            jobs: Number of threads evaluating rules concurrently
+
+        Returns: The [name, verdict, justification] of each rule, in the order of rule_names
+        """
+        rule_names = list(RULES) if rule_names is None else list(rule_names)
+        unknown = [n for n in rule_names if n not in RULES]
+        if unknown:
+            raise ValueError(f"Unknown design rules: {unknown}")
+        if jobs > 1 and len(rule_names) > 1:
+            for name in dict.fromkeys(a for n in rule_names for a in RULES[n].artifacts):
+                self.artifact(name)
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                return list(executor.map(self.evaluate, rule_names))
+        return [self.evaluate(n) for n in rule_names]
+
+
+def evaluate_rule(ruleName, defaultVerdict, defaultJustification, evaluate_func):
+    verdict = defaultVerdict
+    justification = defaultJustification
+    results = evaluate_func()
+    if any(results):
+        verdict = "Fail"
+        justification = "\n".join(results)
+    return [ruleName, verdict, justification]
+
+
+@design_rule("FBD.MetricRule.TooManyInterfaceVariables", "metrics")
+def evaluate_variable_limit_rule(metrics, varLimit=40):
+    ruleName = "FBD.MetricRule.TooManyInterfaceVariables"
+    verdict = "Pass"
+    interface_variables = metrics["NrInputVariables"] + metrics["NrOutputVariables"]
+    justification = (f"The number of interface variables ({interface_variables}) "
+                     f"does not exceed chosen limit of {varLimit}")
+
+    if interface_variables > varLimit:
+        verdict = "Fail"
+        justification = (f"number of interface variables ({interface_variables}) "
+                         f"exceeds chosen limit of {varLimit}")
+    return [ruleName, verdict, justification]
+
+
+@design_rule("FBD.DataFlow.SafenessProperty", "unsafe_flows")
+def evaluate_safeness_data_flow(unsafe_flows):
+    ruleName = "FBD.DataFlow.SafenessProperty"
+    verdict = "Pass"
+    justification = (
+        f"No unjustified conversion between safe and unsafe data detected."
+    )
+    return evaluate_rule(ruleName, verdict, justification, lambda: unsafe_flows)
+
+
+@design_rule("FBD.Variables.GroupCohesion", "var_sheet")
+def evaluate_var_group_cohesion_rules(var_sheet):
+    ruleName = "FBD.Variables.GroupCohesion"
+    verdict = "Pass"
+    justification = (
+        "Variables are properly sorted into inputs and outputs groups"
+    )
+    return evaluate_rule(ruleName, verdict, justification, var_sheet.evaluate_cohesion_of_sheet)
+
+
+@design_rule("FBD.Variables.GroupStructure", "var_sheet")
+def evaluate_var_group_structure_rules(var_sheet):
+    ruleName = "FBD.Variables.GroupStructure"
+    verdict = "Pass"
+    justification = "The mandatory groups (Inputs and Outputs) exists.\nAt least one input and output variable is defined"
+    return evaluate_rule(ruleName, verdict, justification, var_sheet.evaluate_structure_of_var_sheet)
+
+
+# The symbol table entry lengths the naming uniqueness rule checks by default
+SYMBOL_LENGTH_LIMITS = (30,)
+
+
+def check_variable_naming_uniqueness(variables, max_lengths_to_check: Iterable[int]):
+    return check_naming_uniqueness([v.name for v in variables], max_lengths_to_check)
+
+
+def check_naming_uniqueness(names: Iterable[str], max_lengths_to_check: Iterable[int]):
+    """For each limit some names collide at: the reason, and the sorted list of the colliding names"""
+    result = []
+    for length, non_unique_names in prefix_collisions(names, max_lengths_to_check).items():
+        if non_unique_names:
+            result.append(f"Compilers supporting symbol table entry lengths of {length} "
+                          f"or less would be unable to tell some of these names apart")
+            result.append(non_unique_names)
+    return result
+
+
+def naming_uniqueness_lines(results):
+    """The result of a naming uniqueness check as justification lines, with the colliding names one per line"""
+    return [r if isinstance(r, str) else "\n".join(r) for r in results]
+
+
+@design_rule("FBD.Naming.Uniqueness", "variables")
+def evaluate_variable_uniqueness_rules(variables, symbol_lengths=SYMBOL_LENGTH_LIMITS):
+    rulename = "FBD.Naming.Uniqueness"
+    verdict = "Pass"
+    justification = "The variable names are suitably unique to be told apart by compilers"
+    return evaluate_rule(rulename, verdict, justification,
+                         lambda: naming_uniqueness_lines(check_variable_naming_uniqueness(variables, symbol_lengths)))
+
+
+@design_rule("FBD.Variable.UnusedVariables", "dependency_matrix", "variables")
+def evaluate_variables_unused_rule(dependency_matrix, variables):
+    def find_unused_variables():
+        # Variables are used if they are an output, or reach an output
+        res = set(dependency_matrix.outputs)
+        # Constants cannot be variables
+        res.update(s for s in dependency_matrix.used_sources() if "#" not in s)
+        # Get all variable names that are of primitive type
+        all_vars_prim = set()
+        for v in variables:
+            if v.valueType == ValueType.CUSTOM_FBD:
+                continue
+            all_vars_prim.add(v.getName())
+        # Variable is unused if its name does not appear in S
+        difference = all_vars_prim - res
+        return difference
+
+    vars_unused = find_unused_variables()
+
+    rulename = "FBD.Variable.UnusedVariables"
+    verdict = "Fail" if vars_unused else "Pass"
+    justification = f"The following variables are unused:\n{'<br>'.join(vars_unused)}" if vars_unused else "No variables are unused"
+    return [rulename, verdict, justification]
+
+
+def check_useless_initializations(variables):
+    def expression_is_equal_to_zeroed(expr: str):
+        return "FALSE" in expr or re.fullmatch(r"^([A-Z0-9]+#)?0$", expr)
+
+    name_initializer_list = [(v.getName(), v.initVal) for v in variables if
+                             v.initVal is not None]
+    zero_initialized_variables = [name for name, init in name_initializer_list if
+                                  expression_is_equal_to_zeroed(init)]
+    if not zero_initialized_variables:
+        return []
+    result = ["The following variables are unnecessarily initialized to zero:\n"]
+    result.append("\n\t".join(zero_initialized_variables))
+    return result
+
+
+@design_rule("FBD.Variables.Initialization", "variables")
+def evaluate_initialization_rule(variables):
+    ruleName = "FBD.Variables.Initialization"
+    verdict = "Pass"
+    justification = "Given that the memory always starts zeroed out, no useless initializations are done"
+    return evaluate_rule(ruleName, verdict, justification, lambda: check_useless_initializations(variables))
+
+
+@design_rule("FBD.DesignRule.VariableDescriptionLang", "variables")
+def evaluate_language_rule_variables(all_vars):
+    ruleName = "FBD.DesignRule.VariableDescriptionLang"
+    verdict = "Pass"
+    justification = f"The descriptions of variables are written in English"
+    described = [v for v in all_vars if v.description is not None]
+    test = string_is_in_language([v.description for v in described], lang="en")
+    if test:  # if test is not none, and test is not empty list
+        verdict = "Fail"
+        justification = (f"The following variables have descriptions "
+                         f"that are not in english:\n" +
+                         "\n".join([described[i].description for i in test]))
+    return [ruleName, verdict, justification]
+
+
+@design_rule("FBD.DesignRule.CommentLang", "comments")
+def evaluate_language_rule_comments(all_comments):
+    ruleName = "FBD.DesignRule.CommentLang"
+    verdict = "Pass"
+    justification = f"The comments are written in English"
+    test = string_is_in_language([c.content for c in all_comments], lang="en")
+    if test:  # if test is not none, and test is not empty list
+        verdict = "Fail"
+        justification = (f"The following variables have descriptions "
+                         f"that are not in english:\n" +
+                         "\n".join([all_comments[i].content for i in test]))
+    return [ruleName, verdict, justification]
@@ -9,7 +9,7 @@ from .rectangle import Rectangle
 import json
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class FBDObjData:
     localID: int
     type: str
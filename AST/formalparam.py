@@ -7,7 +7,7 @@ from .connections import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class FormalParam:
     name: str
     connectionPoint: ConnectionPoint
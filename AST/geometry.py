@@ -0,0 +1,121 @@
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from utility_classes.point import Point
+from .rectangle import Rectangle
+
+
+class CoordinateTable(Sequence):
+    """
+    Rows of 4 integer coordinates in one flat array: the coordinates of row i are coordinates[4 * i:4 * i + 4].
+    Bulk operations run over the whole array at once, instead of over Point objects.
+    """
+
+    def __init__(self, coordinates: Iterable[int] = ()):
+        self.coordinates = array("q", coordinates)
+        if len(self.coordinates) % 4:
+            raise ValueError(f"Not a table of 4 coordinates per row: {len(self.coordinates)} coordinates")
+
+    def __len__(self):
+        return len(self.coordinates) // 4
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._view(*self.coordinates[4 * index:4 * index + 4])
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self.coordinates == other.coordinates
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _view(self, c0, c1, c2, c3):
+        raise NotImplementedError("Implement in Child classes")
+
+    def rows(self) -> Iterator[Tuple[int, int, int, int]]:
+        """The coordinates of each row as a tuple, without creating Point objects"""
+        coordinates = iter(self.coordinates)
+        return zip(coordinates, coordinates, coordinates, coordinates)
+
+    def append(self, c0: int, c1: int, c2: int, c3: int):
+        self.coordinates.extend((c0, c1, c2, c3))
+
+    def scaled(self, factor: int):
+        """A copy with all coordinates multiplied by an integer factor"""
+        return type(self)(map(factor.__mul__, self.coordinates))
+
+    def extent(self) -> Optional[Point]:
+        """The largest x and the largest y of all coordinates, or None for an empty table"""
+        if not self.coordinates:
+            return None
+        return Point(max(self.coordinates[0::2]), max(self.coordinates[1::2]))
+
+
+class LineTable(CoordinateTable):
+    """
+    The lines of a code worksheet: start x, start y, end x, end y per line.
+    As a Sequence, each line is a (start Point, end Point) pair, as in the list of lines it replaces.
+    """
+
+    @classmethod
+    def fromPoints(cls, lines: Iterable[Tuple[Point, Point]]):
+        return cls(c for start, end in lines for c in (start.x, start.y, end.x, end.y))
+
+    def _view(self, start_x, start_y, end_x, end_y):
+        return Point(start_x, start_y), Point(end_x, end_y)
+
+
+class BoxTable(CoordinateTable):
+    """
+    Bounding boxes: left, top, right, bottom per box, optionally with the localId of the element of each box.
+    As a Sequence, each box is a Rectangle.
+    """
+
+    def __init__(self, coordinates: Iterable[int] = (), ids: Iterable[int] = ()):
+        super().__init__(coordinates)
+        self.ids = array("q", ids)
+        self.row_of: Dict[int, int] = {ID: i for i, ID in enumerate(self.ids)}
+
+    @classmethod
+    def fromRectangles(cls, rectangles: Iterable[Rectangle], ids: Iterable[int] = ()):
+        return cls((c for r in rectangles for c in r.getAsTuple()), ids)
+
+    def __eq__(self, other):
+        if isinstance(other, BoxTable):
+            return self.coordinates == other.coordinates and self.ids == other.ids
+        return super().__eq__(other)
+
+    def _view(self, left, top, right, bottom):
+        return Rectangle.fromTuple(left, top, right, bottom)
+
+    def scaled(self, factor: int):
+        return BoxTable(map(factor.__mul__, self.coordinates), self.ids)
+
+    def extent(self) -> Optional[Point]:
+        """The largest right and the largest bottom of all boxes, or None for an empty table"""
+        if not self.coordinates:
+            return None
+        return Point(max(self.coordinates[2::4]), max(self.coordinates[3::4]))
+
+    def boundingBox(self, rows: Iterable[int]) -> Rectangle:
+        """The smallest Rectangle around the boxes of the given rows"""
+        rows = list(rows)
+        if not rows:
+            raise ValueError("No boxes to enclose")
+        c = self.coordinates
+        return Rectangle.fromTuple(
+            min(c[4 * i] for i in rows),
+            min(c[4 * i + 1] for i in rows),
+            max(c[4 * i + 2] for i in rows),
+            max(c[4 * i + 3] for i in rows),
+        )
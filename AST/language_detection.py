@@ -0,0 +1,100 @@
+import functools
+import re
+from typing import Iterable, List, Optional
+
+from langdetect import DetectorFactory, detect
+from langdetect.lang_detect_exception import LangDetectException
+
+# English function words which are not (common) words of other languages either. Words such as a, an, in, on, so,
+# no, of, was, is, for, to or over are left out, as they are just as common in German, Spanish, Dutch or Scandinavian texts
+ENGLISH_STOP_WORDS = frozenset("""
+the and that this these those with which when where what who why how would should could their they them there
+then than from have has having been being does doing into about after before between through during until above
+below because while other only some such very your you our must itself its both further each not but if it up out
+off down own same too here we she his him had were
+""".split())
+
+# The share of stop words a text must at least have to be obviously English
+MIN_STOP_WORD_RATIO = 0.25
+
+WORD_RE = re.compile(r"[a-z]+")
+
+
+def normalise(text: str) -> str:
+    """The cache key of a text: runs of whitespace collapsed, leading and trailing whitespace removed"""
+    return " ".join(text.split())
+
+
+def is_obviously_english(text: str, max_words=12) -> bool:
+    """
+    Cheap pre-filter: a short ASCII text with at least two English stop words, making up at least
+    MIN_STOP_WORD_RATIO of its words, is English. The probabilistic detector is unreliable on short texts anyway.
+    """
+    if not text.isascii():
+        return False
+    words = WORD_RE.findall(text.lower())
+    if not words or len(words) > max_words:
+        return False
+    nr_of_stop_words = sum(1 for w in words if w in ENGLISH_STOP_WORDS)
+    return nr_of_stop_words >= 2 and nr_of_stop_words >= MIN_STOP_WORD_RATIO * len(words)
+
+
+class LanguageDetector:
+    """
+    Language detection with langdetect, deterministic and cached.
+    Results are cached by the normalised text in an LRU cache, as the same descriptions recur across POUs.
+    Obviously English short texts (see is_obviously_english) are not passed to langdetect.
+    """
+
+    def __init__(self, maxsize=16384, prefilter=True):
+        # langdetect is only deterministic with a fixed seed
+        DetectorFactory.seed = 0
+        self.prefilter = prefilter
+        self._detect_normalised = functools.lru_cache(maxsize=maxsize)(self._detect_uncached)
+
+    def _detect_uncached(self, text: str) -> Optional[str]:
+        if not text:
+            return None
+        if self.prefilter and is_obviously_english(text):
+            return "en"
+        try:
+            return detect(text)
+        except LangDetectException:
+            # E.g. a text without letters
+            return None
+
+    def detect(self, text: str) -> Optional[str]:
+        """The language code of the text, such as 'en', or None if it cannot be detected"""
+        return self._detect_normalised(normalise(text))
+
+    def detect_all(self, texts: Iterable[str]) -> List[Optional[str]]:
+        """The languages of many texts at once. Each distinct normalised text is only detected once"""
+        keys = [normalise(t) for t in texts]
+        languages = {k: self._detect_normalised(k) for k in dict.fromkeys(keys)}
+        return [languages[k] for k in keys]
+
+    def cache_info(self):
+        return self._detect_normalised.cache_info()
+
+    def cache_clear(self):
+        self._detect_normalised.cache_clear()
+
+
+# Shared by all programs, so descriptions recurring in a project are only detected once
+LANGUAGE_DETECTOR = LanguageDetector()
+
+
+def string_is_in_language(strings_to_check: List[str], lang: str, detector: LanguageDetector = LANGUAGE_DETECTOR):
+    """
+    Returns: None if the strings, taken together, are in the language. Otherwise, the indexes of the strings
+    which are not in the language on their own, which may be none of them. Strings whose language cannot be
+    detected, e.g. numbers, are never reported
+    """
+    all_content = " ".join(strings_to_check)
+    if all_content.strip() == "":
+        # If there is not content, the language cannot be verified
+        return None
+    if detector.detect(all_content) != lang:
+        return [i for i, detected in enumerate(detector.detect_all(strings_to_check))
+                if detected is not None and detected != lang]
+    return None
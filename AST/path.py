@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Iterator, List, Optional, Set, Tuple
 
 
 @dataclass()
@@ -46,6 +46,167 @@ class PathDivide:
     def flatten(self):
         return PathDivide.unpack_pathlist(self.paths)
 
+    # Traces share their subtraces: the same PathDivide object can be nested at many places.
+    # The functions below work on this DAG directly, visiting each PathDivide once,
+    # instead of on the list of all paths, which is exponential in the number of divides.
+
+    @classmethod
+    def is_divide(cls, element):
+        return isinstance(element, PathDivide) or "PathDivide" in str(element.__class__)
+
+    @classmethod
+    def _walk_paths(cls, pathList, prefix, descend: Optional[Callable[["PathDivide"], bool]] = None) -> Iterator[list]:
+        """
+        Yields the paths of iter_paths, skipping the divides descend rejects.
+        The walk uses an explicit stack of the partly walked paths, so the nesting of divides is not limited
+        by the recursion limit.
+        """
+        # Per level of nesting: [paths, index of the path, index of the next element, path so far, path has divides]
+        stack = [[pathList, 0, 0, None, False, prefix]]
+        while stack:
+            frame = stack[-1]
+            paths, path_index, element_index, accList, has_divides, frame_prefix = frame
+            if accList is None:
+                if path_index == len(paths):
+                    stack.pop()
+                    continue
+                accList = list(frame_prefix)
+            p = paths[path_index]
+            divide = None
+            while element_index < len(p):
+                p_e = p[element_index]
+                element_index += 1
+                if PathDivide.is_divide(p_e):
+                    has_divides = True
+                    if descend is None or descend(p_e):
+                        divide = p_e
+                        break
+                else:
+                    accList.append(p_e)
+            if divide is not None:
+                # Continue this path after the paths of the divide, which extend the path so far
+                frame[1:5] = [path_index, element_index, accList, has_divides]
+                stack.append([divide.paths, 0, 0, None, False, accList])
+                continue
+            if len(accList) > len(frame_prefix) and not has_divides:
+                yield accList
+            frame[1:5] = [path_index + 1, 0, None, False]
+
+    @classmethod
+    def iter_paths(cls, pathList, prefix=None) -> Iterator[list]:
+        """Yields the same paths as unpack_pathlist, one at a time"""
+        return PathDivide._walk_paths(pathList, prefix or [])
+
+    @classmethod
+    def sources(cls, pathList) -> List:
+        """
+        The distinct last elements of the paths of unpack_pathlist, in order of first occurrence.
+        For a backward trace, these are the sources the traced output depends on.
+        """
+        result = dict()
+        visited = set()
+        stack = list(reversed(pathList))
+        while stack:
+            e = stack.pop()
+            if PathDivide.is_divide(e):
+                if id(e) not in visited:
+                    visited.add(id(e))
+                    stack.extend(reversed(e.paths))
+                continue
+            divides = [p_e for p_e in e if PathDivide.is_divide(p_e)]
+            if divides:
+                # Elements before a divide are prefixes, elements after it are not part of any path
+                stack.extend(reversed(divides))
+            elif e:
+                result[e[-1]] = None
+        return list(result)
+
+    @classmethod
+    def _divides_in_post_order(cls, pathList) -> List["PathDivide"]:
+        """Every distinct PathDivide nested in the paths, each after all PathDivides nested in it"""
+        order = []
+        seen = set()
+        stack = [(p_e, False) for p in pathList for p_e in p if PathDivide.is_divide(p_e)]
+        while stack:
+            divide, expanded = stack.pop()
+            if expanded:
+                order.append(divide)
+                continue
+            if id(divide) in seen:
+                continue
+            seen.add(id(divide))
+            stack.append((divide, True))
+            stack.extend((p_e, False) for p in divide.paths for p_e in p if PathDivide.is_divide(p_e))
+        return order
+
+    @classmethod
+    def source_sets(cls, pathList) -> dict:
+        """For every PathDivide nested in the paths, keyed by its id: the set of its sources"""
+        result = dict()
+        for divide in PathDivide._divides_in_post_order(pathList):
+            divide_sources = set()
+            for p in divide.paths:
+                divides = [p_e for p_e in p if PathDivide.is_divide(p_e)]
+                if divides:
+                    for d in divides:
+                        divide_sources.update(result[id(d)])
+                elif p:
+                    divide_sources.add(p[-1])
+            result[id(divide)] = divide_sources
+        return result
+
+    @classmethod
+    def iter_paths_to(cls, pathList, target, source_sets=None, prefix=None) -> Iterator[list]:
+        """
+        Yields the paths of iter_paths that end in target, in the same order.
+        Divides that cannot reach the target are skipped, using source_sets (see PathDivide.source_sets).
+        """
+        source_sets = PathDivide.source_sets(pathList) if source_sets is None else source_sets
+        for path in PathDivide._walk_paths(pathList, prefix or [], lambda divide: target in source_sets[id(divide)]):
+            if path[-1] == target:
+                yield path
+
+    @classmethod
+    def edges(cls, pathList) -> Set[Tuple]:
+        """The pairs of consecutive elements of all paths of unpack_pathlist"""
+        result = set()
+        # id(divide) -> first elements of its paths. Divides without any path have no entry
+        firsts = dict()
+
+        def add_path(p) -> List:
+            """Adds the edges of a single path, returns the first elements of its unpacked paths"""
+            accList = []
+            path_firsts = []
+            NoDividingPath = True
+            for p_e in p:
+                if PathDivide.is_divide(p_e):
+                    NoDividingPath = False
+                    divide_firsts = firsts.get(id(p_e), None)
+                    if divide_firsts is None:
+                        continue
+                    result.update(zip(accList, accList[1:]))
+                    if accList:
+                        result.update((accList[-1], f) for f in divide_firsts)
+                        path_firsts.append(accList[0])
+                    else:
+                        path_firsts.extend(divide_firsts)
+                else:
+                    accList.append(p_e)
+            if accList and NoDividingPath:
+                result.update(zip(accList, accList[1:]))
+                path_firsts.append(accList[0])
+            return path_firsts
+
+        for divide in PathDivide._divides_in_post_order(pathList):
+            divide_firsts = set()
+            for p in divide.paths:
+                divide_firsts.update(add_path(p))
+            if divide_firsts:
+                firsts[id(divide)] = divide_firsts
+        for p in pathList:
+            add_path(p)
+        return result
+
 
 def test_can_flatten_pathdivide_to_path_sequences():
     assert PathDivide.unpack_pathlist([[1, 2], [3, 4]]) == [[1, 2], [3, 4]]
@@ -0,0 +1,198 @@
+from array import array
+from collections.abc import Mapping
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utility_classes.point import Point
+from .block_port import Port
+from .connections import ConnectionDirection
+from .utilities import to_csr
+
+# block_of value of IDs which are not a port
+NO_BLOCK = -1
+
+# The arrays are indexed by compacted IDs instead (see PortTable.slots), if the largest ID exceeds
+# SPARSE_FACTOR times the number of ports by more than SPARSE_MIN_SIZE
+SPARSE_FACTOR = 4
+SPARSE_MIN_SIZE = 1024
+
+
+class PortTable(Mapping):
+    """
+    The ports of a program, in parallel arrays indexed by the slot of the port, slot(ID).
+    Ports share their ID space with the blocks, so the arrays are usually dense, and the slot of a port is its localId:
+        block_of[slot]: the localId of the block owning the port, or NO_BLOCK if ID is not a port
+        directions[slot]: the ConnectionDirection of the port, relative to its block
+        pos_x[slot], pos_y[slot]: the position of the port, relative to its block
+    The connections are stored in compressed sparse row form, on both ends of every wire: the IDs connected to
+    a port are connection_targets[connection_offsets[slot]:connection_offsets[slot + 1]], in ascending order.
+    If the IDs are sparse, e.g. a single huge localId, the arrays would be sized by the largest ID instead of the
+    number of ports. The ports are then given consecutive slots, in ascending order of their IDs, in slots.
+
+    As a Mapping, the table is a read-only view port ID -> Port, in the order the ports were set up, as the dict
+    it replaces. Port objects are only created when asked for, hot paths use the arrays directly.
+    """
+
+    def __init__(self, port_ids: List[int] = (), block_ids: List[int] = (), directions: List[int] = (),
+                 xs: List[int] = (), ys: List[int] = (), wire_starts: List[int] = (), wire_ends: List[int] = ()):
+        """
+        The ports are given as parallel lists, and so are the wires, to not create an object per port or wire.
+        Args:
+            port_ids, block_ids, directions, xs, ys: Per port, its ID, the ID of its block, its ConnectionDirection
+                and relative position. The ports of a block must be consecutive.
+                For a port ID given more than once, the first is used
+            wire_starts, wire_ends: The IDs of the two ports of each wire. Wires are stored on both ends
+        """
+        if len(set(port_ids)) != len(port_ids):
+            seen = set()
+            first = [i for i, p in enumerate(port_ids) if not (p in seen or seen.add(p))]
+            port_ids, block_ids, directions, xs, ys = (
+                [column[i] for i in first] for column in (port_ids, block_ids, directions, xs, ys)
+            )
+        size = 1 + max(port_ids, default=-1)
+        # Slot of each port ID, None if the slots are the IDs
+        self.slots: Optional[Dict[int, int]] = None
+        slots_of_ports = port_ids
+        if size > SPARSE_FACTOR * len(port_ids) + SPARSE_MIN_SIZE:
+            self.slots = {ID: slot for slot, ID in enumerate(sorted(port_ids))}
+            size = len(port_ids)
+            slots_of_ports = [self.slots[ID] for ID in port_ids]
+        self.block_of = array("q", [NO_BLOCK]) * size
+        self.directions = bytearray(size)
+        self.pos_x = array("q", [0]) * size
+        self.pos_y = array("q", [0]) * size
+        for column, values in [(self.block_of, block_ids), (self.directions, directions),
+                               (self.pos_x, xs), (self.pos_y, ys)]:
+            for slot, value in zip(slots_of_ports, values):
+                column[slot] = value
+        # Port IDs in order, and for each block the range of its ports in it
+        self.order = array("q", port_ids)
+        self.block_ranges: Dict[int, Tuple[int, int]] = dict()
+        start = 0
+        for end in range(1, len(block_ids) + 1):
+            if end == len(block_ids) or block_ids[end] != block_ids[start]:
+                self.block_ranges[block_ids[start]] = (start, end)
+                start = end
+
+        for port_id, connected_id in zip(wire_starts, wire_ends):
+            if connected_id not in self:
+                raise ValueError(f"Port {port_id} is connected to {connected_id}, which is not a port of the worksheet")
+        # In ascending order of the connected IDs
+        if self.slots is None:
+            self.connection_offsets, self.connection_targets = to_csr(
+                size, chain(zip(wire_starts, wire_ends), zip(wire_ends, wire_starts))
+            )
+        else:
+            slot_starts = [self.slots[ID] for ID in wire_starts]
+            slot_ends = [self.slots[ID] for ID in wire_ends]
+            self.connection_offsets, target_slots = to_csr(
+                size, chain(zip(slot_starts, slot_ends), zip(slot_ends, slot_starts))
+            )
+            ids = sorted(self.slots)
+            self.connection_targets = array("q", [ids[slot] for slot in target_slots])
+        self._ports: Dict[int, Port] = dict()
+
+    def __getstate__(self):
+        # The created Port objects are not stored
+        return {k: v for k, v in self.__dict__.items() if k != "_ports"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._ports = dict()
+
+    def __contains__(self, portID):
+        if self.slots is not None:
+            return portID in self.slots
+        return isinstance(portID, int) and 0 <= portID < len(self.block_of) and self.block_of[portID] != NO_BLOCK
+
+    def slot(self, portID: int) -> int:
+        """The index of a port in the arrays"""
+        return portID if self.slots is None else self.slots[portID]
+
+    def __getitem__(self, portID) -> Port:
+        port = self._ports.get(portID, None)
+        if port is None:
+            if portID not in self:
+                raise KeyError(portID)
+            slot = self.slot(portID)
+            port = Port(
+                portID=portID,
+                blockID=self.block_of[slot],
+                rel_connection_direction=ConnectionDirection(self.directions[slot]),
+                rel_position=Point(self.pos_x[slot], self.pos_y[slot]),
+                connections=set(self.connections(portID)),
+            )
+            self._ports[portID] = port
+        return port
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def blockID(self, portID: int) -> int:
+        return self.block_of[self.slot(portID)]
+
+    def direction(self, portID: int) -> ConnectionDirection:
+        return ConnectionDirection(self.directions[self.slot(portID)])
+
+    def connections(self, portID: int):
+        """The IDs of the ports connected to the port"""
+        slot = self.slot(portID)
+        return self.connection_targets[self.connection_offsets[slot]:self.connection_offsets[slot + 1]]
+
+    def portIDsOf(self, blockID: int) -> List[int]:
+        """The IDs of the ports of a block, in order"""
+        start, end = self.block_ranges.get(blockID, (0, 0))
+        return self.order[start:end].tolist()
+
+    def viewOf(self, blockID: int) -> "BlockPorts":
+        return BlockPorts(self, blockID)
+
+
+class BlockPorts(Mapping):
+    """The ports of one block of a PortTable, as a read-only view port ID -> Port"""
+
+    __slots__ = ("table", "blockID")
+
+    def __init__(self, table: PortTable, blockID: int):
+        self.table = table
+        self.blockID = blockID
+
+    def __getstate__(self):
+        return self.table, self.blockID
+
+    def __setstate__(self, state):
+        self.table, self.blockID = state
+
+    def __contains__(self, portID):
+        return portID in self.table and self.table.blockID(portID) == self.blockID
+
+    def __getitem__(self, portID) -> Port:
+        if portID not in self:
+            raise KeyError(portID)
+        return self.table[portID]
+
+    def __iter__(self):
+        return iter(self.table.portIDsOf(self.blockID))
+
+    def __len__(self):
+        start, end = self.table.block_ranges.get(self.blockID, (0, 0))
+        return end - start
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def portIDs(self, direction: ConnectionDirection) -> List[int]:
+        table = self.table
+        directions = table.directions
+        if table.slots is None:
+            return [p for p in table.portIDsOf(self.blockID) if directions[p] == direction]
+        return [p for p in table.portIDsOf(self.blockID) if directions[table.slots[p]] == direction]
+
+    def connections(self, portID: int):
+        return self.table.connections(portID)
@@ -1,25 +1,44 @@
-import functools
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 
-from langdetect import DetectorFactory, detect, detect_langs
-
-from checks.rule_utility_functions import unique
 from utility_classes.point import Point
 from . import ast_typing
 from .ast_typing import DataflowDirection, ParameterType, SafeClass, ValueType
 from .blocks import FBD_Block, VarBlock, Block
+from .dataflow_graph import DataflowGraph, NODE_BLOCK, NODE_INPUT_PORT, NODE_IN_VARIABLE, NODE_OUT_VARIABLE
+from .dependency_matrix import DependencyMatrix
 from .path import PathDivide
 from .comment_box import CommentBox
+from .design_rules import AnalysisContext
+from .geometry import BoxTable, LineTable
 from .utilities import indexOrNone
 from .variables import VariableWorkSheet, VariableLine
-from .block_port import Port
+from .port_table import PortTable
 from utility_classes.delta import ChangeType, Delta
 
 
+# Attributes that are derived from the code worksheet. See Program.defer_code_worksheet
+CODE_WORKSHEET_ATTRIBUTES = (
+    "behaviourElements",
+    "behaviour_id_map",
+    "lines",
+    "comments",
+    "ports",
+    "backward_flow",
+    "forward_flow",
+    "dataflow_graph",
+    "dependency_matrix",
+)
+
+# Analyses whose results only depend on one of the worksheets. See Program.carry_over_analyses
+CODE_WORKSHEET_ANALYSES = ("BlockBoxes", "CommentBoxes", "Loops", "LoopInputs")
+VARIABLE_WORKSHEET_ANALYSES = ("VarInfo",)
+
+
 def remove_dups_preserve_order(aList: List):
     res = []
     adds = {}
@@ -38,14 +57,14 @@ class Program:
     behaviour_id_map: Dict[int, FBD_Block]
     backward_flow: Optional[Dict[str, List[int]]]
     forward_flow: Optional[Dict[str, List[int]]]
-    lines: List[Tuple[Point, Point]]
+    lines: LineTable
     comments: List[CommentBox]
 
     @classmethod
     def VERSION(cls):
         MAJOR = 0
         MINOR = 4
-        REVISION = 0
+        REVISION = 6
         return (MAJOR, MINOR, REVISION)
 
     def toJSON(self):
@@ -91,15 +110,121 @@ class Program:
     ):
         self.progName = name
         self.varHeader = varWorkSheet
+        # Changes through the mutators of the sheet invalidate the program
+        varWorkSheet.add_owner(self)
         self.behaviourElements = behaviourElementList or []
-        self.lines = lines or []
+        self.lines = lines if isinstance(lines, LineTable) else LineTable.fromPoints(lines or [])
         self.behaviour_id_map = behaviourIDMap or {}
 
         # These values are computed after construction
         self.backward_flow = None
         self.forward_flow = None
 
-        self.ports = {}
+        self.ports = PortTable()
+        self.dataflow_graph = None
+        self.dependency_matrix = None
+        # Results of analyses, by analysis name. See Program.invalidate
+        self.analysis_cache = {}
+
+    def defer_code_worksheet(self, loader):
+        """
+        Drops all data of the code worksheet, leaving only the variable interface.
+        The first time any of the code worksheet attributes is used, loader(self) is called to set
+        behaviourElements, behaviour_id_map, lines and comments, followed by the post parsing analysis.
+        If either raises, the code worksheet stays deferred, and the next use raises the error again.
+        Returns:
+            No return value - will mutate the instance object
+        """
+        for attribute in CODE_WORKSHEET_ATTRIBUTES:
+            self.__dict__.pop(attribute, None)
+        self.analysis_cache = {}
+        self._code_worksheet_lock = threading.RLock()
+        self._code_worksheet_loader = loader
+
+    def is_code_worksheet_loaded(self):
+        return "_code_worksheet_loader" not in self.__dict__
+
+    def __getstate__(self):
+        # Locks cannot be pickled, a new one is created on unpickling
+        return {k: v for k, v in self.__dict__.items() if k != "_code_worksheet_lock"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.varHeader.add_owner(self)
+        if "_code_worksheet_loader" in state:
+            self._code_worksheet_lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, i.e., those dropped by defer_code_worksheet
+        lock = self.__dict__.get("_code_worksheet_lock", None)
+        if lock is None or name not in CODE_WORKSHEET_ATTRIBUTES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with lock:
+            # Another thread may have loaded the code worksheet while this one was waiting
+            if name in self.__dict__:
+                return self.__dict__[name]
+            loader = self.__dict__.get("_code_worksheet_loader", None)
+            if loader is None or self.__dict__.get("_code_worksheet_loading", False):
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            self._code_worksheet_loading = True
+            try:
+                self.backward_flow = None
+                self.forward_flow = None
+                self.ports = PortTable()
+                self.dataflow_graph = None
+                self.dependency_matrix = None
+                loader(self)
+                self.post_parsing_analysis()
+            except BaseException:
+                # Nothing of a partial load is kept
+                for attribute in CODE_WORKSHEET_ATTRIBUTES:
+                    self.__dict__.pop(attribute, None)
+                self.analysis_cache = {}
+                raise
+            finally:
+                del self.__dict__["_code_worksheet_loading"]
+            del self.__dict__["_code_worksheet_loader"]
+            del self.__dict__["_code_worksheet_lock"]
+        return getattr(self, name)
+
+    def invalidate(self):
+        """
+        Drops all results derived from the program: the data flows, the dataflow graph, the dependency matrix,
+        the indexes of the variable sheet, and the results of analyses such as metrics and rule checks.
+        To be called after mutating the variable sheet or the code worksheet of the program.
+        The ports are not derived again, post_parsing_analysis does that after changes of the code worksheet.
+        Returns:
+            No return value - will mutate the instance object
+        """
+        self.analysis_cache = {}
+        self.varHeader.invalidate_indexes()
+        if self.is_code_worksheet_loaded():
+            self.backward_flow = None
+            self.forward_flow = None
+            self.dataflow_graph = None
+            self.dependency_matrix = None
+
+    def _cached_analysis(self, name, analyse):
+        """
+        Runs analyse() once, until the program is invalidated.
+        The cached result is shared by all callers, and must not be modified.
+        """
+        if name not in self.analysis_cache:
+            self.analysis_cache[name] = analyse()
+        return self.analysis_cache[name]
+
+    def carry_over_analyses(self, previous: "Program", same_variable_worksheet: bool, same_code_worksheet: bool):
+        """
+        Takes over the cached results of previous for the analyses that only depend on a worksheet both programs
+        share. The other analyses are run again when used.
+        Returns:
+            No return value - will mutate the instance object
+        """
+        names = (VARIABLE_WORKSHEET_ANALYSES if same_variable_worksheet else ()) + (
+            CODE_WORKSHEET_ANALYSES if same_code_worksheet else ())
+        for name in names:
+            if name in previous.analysis_cache:
+                self.analysis_cache[name] = previous.analysis_cache[name]
 
     def post_parsing_analysis(self):
         """
@@ -107,72 +232,72 @@ class Program:
         Returns:
             No return value - will mutate the instance object
         """
+        self.invalidate()
 
         def set_up_ports() -> None:
             """
-            Sets up and connects all the ports mapping
+            Sets up the table of all ports, and connects them
             Returns:
                 No return value - Modifies the instance object
             """
+            port_ids, block_ids, directions, xs, ys = [], [], [], [], []
+            wire_starts, wire_ends = [], []
 
             def addPortConnectionToBlock(blockID, portID, connection):
-                targetPort = self.ports.get(portID, None)
-                if targetPort is None:
-                    targetPort = Port(
-                        portID=portID,
-                        blockID=blockID,
-                        rel_connection_direction=connection.connectionDir,
-                        rel_position=Point(
-                            connection.data.position.x, connection.data.position.y
-                        ),
-                        connections=set(),
-                    )
-                    self.ports[portID] = targetPort
-                    self.behaviour_id_map[blockID].ports[portID] = targetPort
+                position = connection.data.position
+                port_ids.append(portID)
+                block_ids.append(blockID)
+                directions.append(connection.connectionDir)
+                xs.append(position.x)
+                ys.append(position.y)
                 for conn in connection.connections:
                     start_point = conn.startPoint.connectionIndex
                     otherPoint = start_point if start_point is not None else conn.endPoint.connectionIndex
-                    targetPort.connections.add(otherPoint)
-
-            # First, fill all forwards connections
-            fbd_blocks = [
-                block
-                for block in self.behaviourElements
-                if isinstance(block, FBD_Block)
-            ]
-            for block in fbd_blocks:
-                for ID, conn in [
-                    (c.ID, c.connectionPoint) for c in block.getInputVars()
-                ]:
-                    addPortConnectionToBlock(block.getID(), ID, conn)
-                for ID, conn in [
-                    (c.ID, c.connectionPoint) for c in block.getOutputVars()
-                ]:
-                    addPortConnectionToBlock(block.getID(), ID, conn)
-            output_blocks = [
-                block for block in self.behaviourElements if isinstance(block, VarBlock)
-            ]
-            for block in output_blocks:
-                addPortConnectionToBlock(
-                    block.getID(), block.getID(), block.outConnection
-                )
-
-            ports = list(self.ports.items())
-            for p_id, p_data in ports:
-                for conn in p_data.connections:
-                    startPort = self.ports.get(conn, None)
-                    startPort.connections.add(p_id)
+                    wire_starts.append(portID)
+                    wire_ends.append(otherPoint)
+
+            # First, all function blocks, then the variable blocks
+            var_blocks = []
+            for block in self.behaviourElements:
+                if isinstance(block, FBD_Block):
+                    blockID = block.getID()
+                    for c in block.getInputVars() + block.getOutputVars():
+                        addPortConnectionToBlock(blockID, c.ID, c.connectionPoint)
+                elif isinstance(block, VarBlock):
+                    var_blocks.append(block)
+            for block in var_blocks:
+                addPortConnectionToBlock(block.getID(), block.getID(), block.outConnection)
+
+            # Connections are stored on both ends
+            self.ports = PortTable(port_ids, block_ids, directions, xs, ys, wire_starts, wire_ends)
+            for block in self.behaviourElements:
+                block.ports = self.ports.viewOf(block.getID())
 
         def rescale_graphical_details():
             # Lines are in their own coordinate space.
             # To ease work during rendering, they are moved once into the model's space
-            self.lines = [(
-                Point(line[0].x * 2, line[0].y * 2),
-                (Point(line[1].x * 2, line[1].y * 2)),
-            ) for line in self.lines]
+            lines = self.lines if isinstance(self.lines, LineTable) else LineTable.fromPoints(self.lines)
+            self.lines = lines.scaled(2)
 
         set_up_ports()
         rescale_graphical_details()
+        self.dataflow_graph = DataflowGraph.from_behaviour_elements(self.behaviourElements, self.ports)
+
+    def getDataflowGraph(self) -> DataflowGraph:
+        """The data flow graph of the code worksheet. Built on first use for programs not set up by the parser"""
+        if self.dataflow_graph is None:
+            self.dataflow_graph = DataflowGraph.from_behaviour_elements(self.behaviourElements, self.ports)
+        return self.dataflow_graph
+
+    def getDependencyMatrix(self) -> DependencyMatrix:
+        """Which sources reach which outputs. Computed on first use"""
+        if self.dependency_matrix is None:
+            self.dependency_matrix = DependencyMatrix.from_graph(
+                self.getDataflowGraph(),
+                self.behaviour_id_map,
+                [v.getName() for v in self.varHeader.getAllVariables()],
+            )
+        return self.dependency_matrix
 
     def getVarGroups(self):
         return self.varHeader.varGroups
@@ -194,26 +319,29 @@ class Program:
         def list_to_name_dict(allVars: list[VariableLine]):
             return {v.name: v for v in allVars}
 
-        res = dict()
-        res["OutputVariables"] = list_to_name_dict(
-            self.varHeader.getVarsByType(ParameterType.OutputVar)
-        )
-        res["InputVariables"] = list_to_name_dict(
-            self.varHeader.getVarsByType(ParameterType.InputVar)
-        )
-        res["InternalVariables"] = list_to_name_dict(
-            self.varHeader.getVarsByType(ParameterType.InternalVar)
-        )
-        res["Safeness"] = dict(
-            [
-                (
-                    name_type[0],
-                    SafeClass.Safe if "SAFE" in name_type[1] else SafeClass.Unsafe,
-                )
-                for name_type in self.getVarDataColumns("name", "valueType")
-            ]
-        )
-        return res
+        def analyse():
+            res = dict()
+            res["OutputVariables"] = list_to_name_dict(
+                self.varHeader.getVarsByType(ParameterType.OutputVar)
+            )
+            res["InputVariables"] = list_to_name_dict(
+                self.varHeader.getVarsByType(ParameterType.InputVar)
+            )
+            res["InternalVariables"] = list_to_name_dict(
+                self.varHeader.getVarsByType(ParameterType.InternalVar)
+            )
+            res["Safeness"] = dict(
+                [
+                    (
+                        name_type[0],
+                        SafeClass.Safe if "SAFE" in name_type[1] else SafeClass.Unsafe,
+                    )
+                    for name_type in self.getVarDataColumns("name", "valueType")
+                ]
+            )
+            return res
+
+        return self._cached_analysis("VarInfo", analyse)
 
     def getVarDataColumns(self, *args):
         """
@@ -230,62 +358,141 @@ class Program:
         """
 
         def getFieldContent(fieldList, element):
-            theVars = vars(element)
-            return [str(theVars.get(k, None)) for k in fieldList]
+            return [str(getattr(element, k, None)) for k in fieldList]
 
         _fields = (
             VariableLine.__dict__["__annotations__"].keys() if len(args) == 0 else args
         )
         return [getFieldContent(_fields, e) for e in self.varHeader.getAllVariables()]
 
+    def getBlockBoxes(self) -> BoxTable:
+        """The bounding boxes of the blocks, by their IDs"""
+        return self._cached_analysis("BlockBoxes", lambda: BoxTable.fromRectangles(
+            [b.getBoundingBox() for b in self.behaviourElements], [b.getID() for b in self.behaviourElements]
+        ))
+
+    def getCommentBoxes(self) -> BoxTable:
+        return self._cached_analysis(
+            "CommentBoxes", lambda: BoxTable.fromRectangles([c.bounding_box for c in self.comments])
+        )
+
+    def getExtent(self, min_size=0) -> Point:
+        """The bottom right corner of the code worksheet: the largest x and y of the blocks, lines and comments"""
+        extents = [self.getBlockBoxes().extent(), self.lines.extent(), self.getCommentBoxes().extent()]
+        return Point(
+            max([min_size] + [e.x for e in extents if e is not None]),
+            max([min_size] + [e.y for e in extents if e is not None]),
+        )
+
     def hasPotentialInternalState(self):
         return len(self.varHeader.getVarsByType(ParameterType.InternalVar)) > 0
 
-    def performBackTraceFromBlock(self, bID, trace_from_portID=None):
+    def performBackTraceFromBlock(self, bID, trace_from_portID=None, memo=None):
+        """
+        Traces the data flow backwards from a block, or from the block owning a port.
+        Args:
+            bID: The ID of the block or port to start from
+            trace_from_portID: Restricts the trace to start from this output port of the block
+            memo: Optional dict of already computed subtraces, keyed by (ID, portID). Sharing it between calls
+                avoids tracing shared upstream networks more than once
+
+        Returns: The IDs on the path, in backwards order. Where the flow splits into several
+        inputs, the path ends in a PathDivide holding the trace of each input.
+
+        The traversal uses an explicit stack, so the depth of a network is not limited by the recursion limit.
+        Chains of single input blocks are walked in a loop, and only the subtraces starting at a
+        dividing block are memoized.
+        Feedback loops (see getLoops) are condensed: the trace steps from the port or block where it reaches
+        the loop directly to the wires entering the loop from outside, whichever its blocks they are connected to.
+        """
+
         def appendIfNotInListEnd(l, elem):
             if not l or l[-1] != elem:
                 l.append(elem)
 
-        b = (
-                self.behaviour_id_map.get(bID, None)
-                or self.behaviour_id_map[self.ports[bID].blockID]
-        )
-        result = []
-        # flow is a list of tuples of (startPort, [(endPorts, end_connection_ports)])
-        flow = b.getFlowOverBlock(DataflowDirection.Backward, trace_from_portID)
-        if not flow:
-            return [bID]
-        elif len(flow) == 1:  # The number of output ports is one
-            startPort, connectionPorts = flow[0]
-            appendIfNotInListEnd(result, startPort)
-
-            if len(connectionPorts) == 1:  # The number of input ports is one
-                appendIfNotInListEnd(result, connectionPorts[0][0])
-                appendIfNotInListEnd(result, connectionPorts[0][1])
-                recurse = self.performBackTraceFromBlock(
-                    connectionPorts[0][1], connectionPorts[0][1]
-                )
-                for r in recurse:
-                    appendIfNotInListEnd(result, r)
-            else:
-                recurse = [
-                    (
-                        toPort,
-                        self.performBackTraceFromBlock(connectingPort, connectingPort),
-                    )
-                    for toPort, connectingPort in connectionPorts
-                ]
+        def flow_of(key):
+            ID, portID = key
+            b = (
+                    self.behaviour_id_map.get(ID, None)
+                    or self.behaviour_id_map[self.ports.blockID(ID)]
+            )
+            # flow is a list of tuples of (startPort, [(endPorts, end_connection_ports)])
+            return b.getFlowOverBlock(DataflowDirection.Backward, portID)
+
+        loop_inputs = self.getLoopInputs()
+
+        def walk(key):
+            """
+            Follows the flow from key as long as it does not divide.
+            Returns the path up to the divide, and the [(toPort, key of the connecting port)] of the divide, if any
+            """
+            path = []
+            visited = set()
+            while True:
+                if key in memo:
+                    for e in memo[key]:
+                        appendIfNotInListEnd(path, e)
+                    return path, None
+                if key in visited:
+                    # Feedback loop, not known to the dataflow graph
+                    appendIfNotInListEnd(path, key[0])
+                    return path, None
+                visited.add(key)
+                if key[0] in loop_inputs:
+                    startPort, connectionPorts = key[0], loop_inputs[key[0]]
+                    if not connectionPorts:
+                        # A loop without any inputs from outside
+                        appendIfNotInListEnd(path, startPort)
+                        return path, None
+                else:
+                    flow = flow_of(key)
+                    if not flow:
+                        appendIfNotInListEnd(path, key[0])
+                        return path, None
+                    if len(flow) > 1:
+                        return path, None
+                    startPort, connectionPorts = flow[0]
+                appendIfNotInListEnd(path, startPort)
+                if len(connectionPorts) != 1:  # The number of input ports is not one
+                    return path, [(toPort, (conn, conn)) for toPort, conn in connectionPorts]
+                toPort, conn = connectionPorts[0]
+                appendIfNotInListEnd(path, toPort)
+                appendIfNotInListEnd(path, conn)
+                key = (conn, conn)
+
+        memo = {} if memo is None else memo
+        root = (bID, trace_from_portID)
+        walks = {}
+        stack = [root]
+        while stack:
+            key = stack[-1]
+            if key in memo:
+                stack.pop()
+                continue
+            in_progress = key in walks
+            if not in_progress:
+                walks[key] = walk(key)
+            path, divide = walks[key]
+            missing = [] if in_progress or divide is None else [
+                k for _, k in divide if k not in memo and k not in walks
+            ]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            if divide is not None:
                 dividing_paths = []
-                for toPort, r in recurse:
-                    _recurse = []
-                    appendIfNotInListEnd(_recurse, toPort)
-                    for _r in r:
+                for toPort, k in divide:
+                    # A subtrace still in progress is a feedback loop, which ends at the port
+                    subtrace = memo[k] if k in memo else [k[0]]
+                    _recurse = [toPort]
+                    for _r in subtrace:
                         appendIfNotInListEnd(_recurse, _r)
                     dividing_paths.append(_recurse)
-                result.append(PathDivide(dividing_paths))
-            return result
-
-        return result
+                path.append(PathDivide(dividing_paths))
+            memo[key] = path
+            del walks[key]
+        return memo[root]
 
     def getBackwardTrace(self):
         """
@@ -312,8 +519,10 @@ class Program:
 
         def performTrace(start_blocks):
             result = dict()
+            # Upstream networks shared by several outputs are traced only once
+            memo = dict()
             for b in start_blocks:
-                result[b.getVarExpr()] = self.performBackTraceFromBlock(b.getID())
+                result[b.getVarExpr()] = self.performBackTraceFromBlock(b.getID(), memo=memo)
             return result
 
         # Check if value is memoized, if so - return memoized version
@@ -344,14 +553,18 @@ class Program:
             if self.forward_flow is not None:
                 return self.forward_flow
 
-            flattened_flow = [
-                e for e in [PathDivide.unpack_pathlist([f]) for f in back_flow.values()]
-            ]
             interface_blocks = [
                 e for e in self.behaviourElements if e.getBlockType() == "Port"
             ]
             # Assumption: We care only about inports
             start_blocks = [b for b in interface_blocks if b.data.type == "inVariable"]
+            # Computed once for all inports: which sources each divide of the traces leads to,
+            # and the traces leading to each source, in the order of the outports
+            source_sets = [(paths, PathDivide.source_sets([paths])) for paths in back_flow.values()]
+            traces_by_source = dict()
+            for paths, outport_source_sets in source_sets:
+                for source in PathDivide.sources([paths]):
+                    traces_by_source.setdefault(source, []).append((paths, outport_source_sets))
             result = dict()
 
             # Add all results to entry with key 'expr
@@ -366,16 +579,14 @@ class Program:
                 if result.get(expr, None) is None:
                     result[expr] = []  # Initialize a new list to fill up with paths
 
-                # Extract related paths from backward flow
-                for outport_pathlist in flattened_flow:
-                    for path in outport_pathlist:
-                        # Find if path contains the ID of interest, and where
-                        i = indexOrNone(path, ID)
-                        if i is not None:
-                            # slice so that ID is at end, then reverse
-                            _res = path[: (i + 1)]
-                            _res.reverse()
-                            result[expr].append(_res)
+                # Inports are sources of the backward flow: only the backward paths ending in the inport
+                # are visited, skipping every part of the traces which does not lead to it
+                for paths, outport_source_sets in traces_by_source.get(ID, []):
+                    for path in PathDivide.iter_paths_to([paths], ID, outport_source_sets):
+                        # slice so that ID is at end, then reverse
+                        _res = path[: (indexOrNone(path, ID) + 1)]
+                        _res.reverse()
+                        result[expr].append(_res)
             self.forward_flow = result
             return result
 
@@ -386,13 +597,11 @@ class Program:
             return ComputeForwardFlowFromBack(backwards)
 
     def getDependencyPathsByName(self):
-        backward_trace = dict()
-        for name, paths in self.getBackwardTrace().items():
-            backward_trace[name] = remove_dups_preserve_order([
-                self.behaviour_id_map[e[-1]].expr.expr
-                for e in PathDivide.unpack_pathlist([paths])
-            ])
-        return backward_trace
+        """
+        For each output: the expressions (variables and constants) it depends on, each listed once in
+        the column order of the dependency matrix
+        """
+        return self._cached_analysis("DependencyPathsByName", lambda: self.getDependencyMatrix().to_dict())
 
     def num_of_elements(self):
         def get_all_connection_pairs():
@@ -426,25 +635,27 @@ class Program:
         return self.varHeader.getFirstVariableByName(varName)
 
     def getMetrics(self):
-        res = dict()
-        res["NrOfVariables"] = len(self.varHeader.getAllVariables())
+        def analyse():
+            res = dict()
+            res["NrOfVariables"] = len(self.varHeader.getAllVariables())
 
-        blocks = [
-            e for e in self.behaviourElements if "FunctionBlock" in e.getBlockType()
-        ]
-        res["NrOfFuncBlocks"] = len(blocks)
-        res["NrInputVariables"] = len(
-            self.varHeader.getVarsByType(ParameterType.InputVar)
-        )
-        res["NrOutputVariables"] = len(
-            self.varHeader.getVarsByType(ParameterType.OutputVar)
-        )
-        res["NrOfFeedbackVariables"] = len([v for v in self.varHeader.getAllVariables() if v.isFeedback])
+            blocks = [
+                e for e in self.behaviourElements if "FunctionBlock" in e.getBlockType()
+            ]
+            res["NrOfFuncBlocks"] = len(blocks)
+            res["NrInputVariables"] = len(
+                self.varHeader.getVarsByType(ParameterType.InputVar)
+            )
+            res["NrOutputVariables"] = len(
+                self.varHeader.getVarsByType(ParameterType.OutputVar)
+            )
+            res["NrOfFeedbackVariables"] = len([v for v in self.varHeader.getAllVariables() if v.isFeedback])
 
-        backwards_flow = self.getDependencyPathsByName()
-        res["VariableTypeComplexity"] = self.compute_variables_complexity()
-        res["IsPotentiallyImpure"] = self.hasPotentialInternalState()
-        return res
+            res["VariableTypeComplexity"] = self.compute_variables_complexity()
+            res["IsPotentiallyImpure"] = self.hasPotentialInternalState()
+            return res
+
+        return self._cached_analysis("Metrics", analyse)
 
     @classmethod
     def getMetricsExplanations(cls):
@@ -464,6 +675,11 @@ class Program:
         return res
 
     def checkSafeDataFlow(self):
+        """
+        Unsafe data must not reach an output which is not of an unsafe type, unless it is converted on the way.
+        Computed on the dataflow graph, without enumerating the paths through it.
+        Returns: A message for each unsafe input and safe output it reaches, in the order of the outputs
+        """
 
         def block_is_safe_filter(aBlock: Block):
             return "EN_IN" in aBlock.getName()
@@ -484,38 +700,85 @@ class Program:
                     return False
                 return res
 
-        def safeness_is_filtered(pathIDs: List[int]):
-            # going backwards from the source, if one of the IDs maps to a unsafe->safe conversion
-            blocks_on_path = [actualBlock for actualBlock in [self.behaviour_id_map.get(i) for i in pathIDs]
-                              if actualBlock is not None]
-            return any([block_is_safe_filter(b) for b in blocks_on_path])
-
-        safeness_properties = self.getVarInfo()["Safeness"]
-        outDependencies = self.getBackwardTrace()
-        result = []
-        for name, depNodeIDs in outDependencies.items():
-            safeFact = safeness_properties.get(name, None)
-            if safeFact == SafeClass.Unsafe:
-                continue
-            # The output shall be safe - check that direct dependencies are safe
-            nameDependencyPaths = PathDivide.unpack_pathlist([outDependencies[name]])
-            for p in nameDependencyPaths:
-                source = self.behaviour_id_map.get(p[-1], None)
-                if source is None:
-                    # Source does not exist in mapping
+        def analyse():
+            safeness_properties = self.getVarInfo()["Safeness"]
+            graph = self.getDataflowGraph()
+            elements = [self.behaviour_id_map.get(local_id) for local_id in graph.node_ids]
+
+            def is_safe_filter(i):
+                # Data passing a block converting unsafe to safe data is safe from there on
+                return elements[i] is not None and block_is_safe_filter(elements[i])
+
+            safe_outputs = {
+                i for i in graph.nodes_of_kind(NODE_OUT_VARIABLE)
+                if safeness_properties.get(elements[i].getVarExpr(), None) != SafeClass.Unsafe and not is_safe_filter(i)
+            }
+            # output name -> unsafe input expressions reaching it, in order
+            unsafe_sources = dict()
+            for source in graph.nodes_of_kind(NODE_IN_VARIABLE):
+                if is_safe_filter(source):
                     continue
-                if source.getBlockType() == "Port":
-                    expr = source.getVarExpr()
-                    if not exprIsConsideredSafe(safeness_properties, expr):
-                        if safeness_is_filtered(p):
-                            continue
-                        result.append(
-                            f"Unsafe data ('{expr}') flowing to safe output ('{name}')"
-                        )
-        return result
+                reached_outputs = [i for i in graph.reachable([source], stop=is_safe_filter) if i in safe_outputs]
+                if not reached_outputs:
+                    continue
+                expr = elements[source].getVarExpr()
+                if exprIsConsideredSafe(safeness_properties, expr):
+                    continue
+                for i in reached_outputs:
+                    unsafe_sources.setdefault(elements[i].getVarExpr(), dict())[expr] = None
+            result = []
+            for name in dict.fromkeys(elements[i].getVarExpr() for i in graph.nodes_of_kind(NODE_OUT_VARIABLE)):
+                for expr in unsafe_sources.get(name, ()):
+                    result.append(f"Unsafe data ('{expr}') flowing to safe output ('{name}')")
+            return result
+
+        return self._cached_analysis("SafeDataFlow", analyse)
+
+    def getLoops(self) -> List[List[int]]:
+        """
+        The feedback loops of the code worksheet: the strongly connected components of the dataflow graph
+        which contain a cycle.
+        Returns: For each loop, the IDs of the blocks and ports in it
+        """
+
+        def analyse():
+            graph = self.getDataflowGraph()
+            return [graph.ids(loop) for loop in graph.cycles()]
+
+        return self._cached_analysis("Loops", analyse)
+
+    def getLoopInputs(self) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        For the ID of every block and port on a feedback loop: the wires entering the loop from outside,
+        as (input port, connected port) pairs, where the input port belongs to one of the blocks of the loop.
+        """
+
+        def analyse():
+            graph = self.getDataflowGraph()
+            result = dict()
+            for loop in self.getLoops():
+                loop = [graph.index_of[ID] for ID in loop]
+                members = set(loop)
+                inputs = [
+                    (graph.node_ids[port], graph.node_ids[source])
+                    for block in sorted({graph.node_blocks[i] for i in loop})
+                    for port in graph.predecessors(block)
+                    if graph.node_kinds[port] == NODE_INPUT_PORT
+                    for source in graph.predecessors(port)
+                    if source not in members
+                ]
+                for i in loop:
+                    result[graph.node_ids[i]] = inputs
+            return result
 
-    def getLoopedBackBlocks(self):
-        forward_flow = self.forward_flow
+        return self._cached_analysis("LoopInputs", analyse)
+
+    def getLoopedBackBlocks(self) -> List[List[int]]:
+        """
+        Returns: For each feedback loop (see getLoops), the IDs of the function blocks in it
+        """
+        graph = self.getDataflowGraph()
+        return [[ID for ID in loop if graph.node_kinds[graph.index_of[ID]] == NODE_BLOCK] for loop in self.getLoops()]
 
     def compute_deltas2(self, other_program):
         def find_variable_changes():
@@ -662,20 +925,21 @@ class Program:
         return [v for v in vals if predicate(v)]
 
     def get_dependencies_names(self):
-        backward_trace = {}
-        all_input_variable_names = [v.getName() for v in
-                                    self.varHeader.getVarsByType(ParameterType.InputVar)]
-
-        for name, paths in self.getBackwardTrace().items():
-            deps_candidates = [
-                self.behaviour_id_map[e[-1]].expr.expr
-                for e in PathDivide.unpack_pathlist([paths])
-            ]
-            filtered_candidates = Program.filter_values_on_predicate(deps_candidates,
-                                                                     functools.partial(
-                                                                         lambda v: v in all_input_variable_names))
-            backward_trace[name] = filtered_candidates
-        return backward_trace
+        """
+        For each output: the input variables it depends on, each listed once in the order of the
+        variable sheet. Earlier versions listed a variable once for every path it reached the output by.
+        """
+
+        def analyse():
+            dependency_matrix = self.getDependencyMatrix()
+            all_input_variable_names = {v.getName() for v in
+                                        self.varHeader.getVarsByType(ParameterType.InputVar)}
+            return {
+                name: [v for v in dependency_matrix.sources_of(name) if v in all_input_variable_names]
+                for name in dependency_matrix.outputs
+            }
+
+        return self._cached_analysis("DependenciesNames", analyse)
 
     def __str__(self):
         return f"Program: {self.progName}\nVariables:\n{self.varHeader}"
@@ -702,225 +966,41 @@ class Program:
             res = f"{res}\n{name:40}{verdict:4}: {justification}\n"
         return res
 
-    def check_rules(self) -> List[List[str]]:
-        metrics = self.getMetrics()
-
-        def evaluate_rule(
-                ruleName, defaultVerdict, defaultJustification, evaluate_func
-        ):
-            verdict = defaultVerdict
-            justification = defaultJustification
-            results = evaluate_func()
-            if any(results):
-                verdict = "Fail"
-                justification = "\n".join(results)
-            return [ruleName, verdict, justification]
-
-        def string_is_in_language(strings_to_check, lang):
-            DetectorFactory.seed = 0
-            all_content = " ".join(strings_to_check)
-            if all_content.strip() == "":
-                # If there is not content, the language cannot be verified
-                return None
-            detected_lang = detect(all_content)  # Try to detect the language of the description
-
-            if detected_lang != lang:  # If it's not same as lang
-                return [i for i in range(len(strings_to_check)) if detect(strings_to_check[i]) != lang]
-            return None
-
-        def evaluate_language_rule_variables():
-            ruleName = "FBD.DesignRule.VariableDescriptionLang"
-            verdict = "Pass"
-            justification = f"The descriptions of variables are written in English"
-            all_vars = self.varHeader.getAllVariables()
-            test = string_is_in_language([v.description for v in all_vars if v.description is not None], lang="en")
-            if test:  # if test is not none, and test is not empty list
-                verdict = "Fail"
-                justification = (f"The following variables have descriptions "
-                                 f"that are not in english:\n" +
-                                 "\n".join([all_vars[i].description for i in test]))
-            return [ruleName, verdict, justification]
-
-        def evaluate_language_rule_comments():
-            ruleName = "FBD.DesignRule.CommentLang"
-            verdict = "Pass"
-            justification = f"The comments are written in English"
-            all_comments = self.comments
-            test = string_is_in_language([c.content for c in all_comments], lang="en")
-            if test:  # if test is not none, and test is not empty list
-                verdict = "Fail"
-                justification = (f"The following variables have descriptions "
-                                 f"that are not in english:\n" +
-                                 "\n".join([all_comments[i].content for i in test]))
-            return [ruleName, verdict, justification]
-
-        def evaluate_variable_limit_rule(metrics, varLimit):
-            ruleName = "FBD.MetricRule.TooManyInterfaceVariables"
-            verdict = "Pass"
-            interface_variables = metrics["NrInputVariables"] + metrics["NrOutputVariables"]
-            justification = (f"The number of interface variables ({interface_variables}) "
-                             f"does not exceed chosen limit of {varLimit}")
-
-            if interface_variables > varLimit:
-                verdict = "Fail"
-                justification = (f"number of interface variables ({interface_variables}) "
-                                 f"exceeds chosen limit of {varLimit}")
-            return [ruleName, verdict, justification]
-
-        def evaluate_safeness_data_flow():
-            ruleName = "FBD.DataFlow.SafenessProperty"
-            verdict = "Pass"
-            justification = (
-                f"No unjustified conversion between safe and unsafe data detected."
-            )
-            return evaluate_rule(
-                ruleName, verdict, justification, self.checkSafeDataFlow
-            )
+    def getAnalysisContext(self) -> AnalysisContext:
+        """The artifacts shared by the design rules, and their results. Dropped when the program is invalidated"""
+        return self._cached_analysis("AnalysisContext", lambda: AnalysisContext(self))
 
-        def check_useless_initializations(aProgram: Program):
-            def expression_is_equal_to_zeroed(expr: str):
-                return "FALSE" in expr or re.fullmatch(r"^([A-Z0-9]+#)?0$", expr)
-
-            allVars = aProgram.varHeader.getAllVariables()
-            name_initializer_list = [(v.getName(), v.initVal) for v in allVars if
-                                     v.initVal is not None]
-            zero_initialized_variables = [name for name, init in name_initializer_list if
-                                          expression_is_equal_to_zeroed(init)]
-            if not zero_initialized_variables:
-                return []
-            result = ["The following variables are unnecessarily initialized to zero:\n"]
-            result.append("\n\t".join(zero_initialized_variables))
-            return result
-
-        def evaluate_initialization_rule():
-            ruleName = "FBD.Variables.Initialization"
-            verdict = "Pass"
-            justification = "Given that the memory always starts zeroed out, no useless initializations are done"
-
-            return evaluate_rule(
-                ruleName, verdict, justification, functools.partial(check_useless_initializations, self)
-            )
-
-        def evaluate_var_group_cohesion_rules():
-            ruleName = "FBD.Variables.GroupCohesion"
-            verdict = "Pass"
-            justification = (
-                "Variables are properly sorted into inputs and outputs groups"
-            )
-            return evaluate_rule(
-                ruleName,
-                verdict,
-                justification,
-                self.varHeader.evaluate_cohesion_of_sheet,
-            )
-
-        def evaluate_var_group_structure_rules():
-            ruleName = "FBD.Variables.GroupStructure"
-            verdict = "Pass"
-            justification = "The mandatory groups (Inputs and Outputs) exists.\nAt least one input and output variable is defined"
-            return evaluate_rule(
-                ruleName,
-                verdict,
-                justification,
-                self.varHeader.evaluate_structure_of_var_sheet,
-            )
-
-        def check_variable_naming_uniqueness(aProgram, max_length_to_check):
-            def find_in_list_from_start_index(e, l, startI):
-                for i in range(startI, len(l)):
-                    if l[i] == e:
-                        return i
-                return None
-
-            violations = []
-            variable_names = [v.name for v in aProgram.varHeader.getAllVariables()]
-            stripped_variable_names = list(map(lambda e: e[:max_length_to_check], variable_names))
-            if unique(stripped_variable_names):
-                return []
-            else:
-                result = []
-                non_unique_signals = set()
-                for it, name in enumerate(stripped_variable_names):
-                    found_name_index = find_in_list_from_start_index(name, stripped_variable_names, it + 1)
-                    if found_name_index:
-                        non_unique_signals.add(variable_names[it])
-                        non_unique_signals.add(variable_names[found_name_index])
-                if len(non_unique_signals) > 0:
-                    result = [f"Compilers supporting symbol table entry lengths of {max_length_to_check} "
-                              f"or less would be unable to tell some of these names apart"]
-                    result.extend([sorted([name for name in non_unique_signals])])
-                return result
-
-        def evaluate_variable_uniqueness_rules():
-            rulename = "FBD.Naming.Uniqueness"
-            verdict = "Pass"
-            justification = "The variable names are suitably unique to be told apart by compilers"
-            return evaluate_rule(
-                rulename,
-                verdict,
-                justification,
-                functools.partial(check_variable_naming_uniqueness, self,
-                                  30))
-
-        def evaluate_variables_unused_rule():
-            def find_unused_variables():
-                # Get value names from the forwards flow, join together to string S
-                dependency_path_names = self.getDependencyPathsByName()
-                res = set()
-                for k, v in dependency_path_names.items():
-                    # Key by definition is a variable name
-                    res.add(k)
-                    for paths in v:
-                        inputval = paths
-
-                        # Remove constants
-                        if "#" in inputval:
-                            continue
-                        res.add(inputval)
-                # Get all variable names that are of primitive type
-                all_vars_prim = set()
-                all_vars = self.varHeader.getAllVariables()
-                for v in all_vars:
-                    if v.valueType == ValueType.CUSTOM_FBD:
-                        continue
-                    all_vars_prim.add(v.getName())
-                # Variable is unused if its name does not appear in S
-                difference = all_vars_prim - res
-                return difference
-
-            vars_unused = find_unused_variables()
-
-            rulename = "FBD.Variable.UnusedVariables"
-            verdict = "Fail" if vars_unused else "Pass"
-            justification = f"The following variables are unused:\n{'<br>'.join(vars_unused)}" if vars_unused else "No variables are unused"
-            return [rulename, verdict, justification]
-
-        result = []
-        result.append(evaluate_variable_limit_rule(metrics, 40))
-        result.append(evaluate_safeness_data_flow())
-        result.append(evaluate_var_group_cohesion_rules())
-        result.append(evaluate_var_group_structure_rules())
-        result.append(evaluate_variable_uniqueness_rules())
-        result.append(evaluate_variables_unused_rule())
-        result.append(evaluate_initialization_rule())
-        result.append(evaluate_language_rule_variables())
-        result.append(evaluate_language_rule_comments())
-
-        return result
+    def check_rules(self, rule_names: Optional[List[str]] = None, jobs: int = 1,
+                    options: Optional[Dict[str, Dict]] = None) -> List[List[str]]:
+        """
+        Evaluates the design rules (see design_rules.RULES).
+        Args:
+            rule_names: The names of the rules to evaluate, all rules if None
+            jobs: Number of threads evaluating rules concurrently
+            options: Keyword arguments of rules, by rule name (see AnalysisContext). Results with options are
+                not cached
 
+        Returns: The [name, verdict, justification] of each rule, in the order of rule_names
+        """
+        if options:
+            return AnalysisContext(self, options).evaluate_rules(rule_names, jobs)
+        if rule_names is not None:
+            return self.getAnalysisContext().evaluate_rules(rule_names, jobs)
+        return self._cached_analysis("Rules", lambda: self.getAnalysisContext().evaluate_rules(None, jobs))
 
 def extract_from_program(value: str, target_program: Program):
     def extract_metric(metric_value):
         return target_program.getMetrics()[metric_value]
 
     def extract_interface(request_value):
-        vars = target_program.getVarInfo()
-        return {
-            "VarGroupNames": [g.groupName for g in target_program.getVarGroups()],
-            "InputVariables": [v for v in vars["InputVariables"]],
-            "OuputVariables": [v for v in vars["OutputVariables"]],
-            "VariableNames": [v.getName() for v in target_program.varHeader.getAllVariables()]
-        }.get(request_value, [])
+        # Only the requested value is computed
+        extractor = {
+            "VarGroupNames": lambda: [g.groupName for g in target_program.getVarGroups()],
+            "InputVariables": lambda: [v for v in target_program.getVarInfo()["InputVariables"]],
+            "OuputVariables": lambda: [v for v in target_program.getVarInfo()["OutputVariables"]],
+            "VariableNames": lambda: [v.getName() for v in target_program.varHeader.getAllVariables()]
+        }.get(request_value, list)
+        return extractor()
 
     value_without_dunder = value.strip("__")
     metric_match = re.match(r"^metric\[(.*?)\]$", value_without_dunder)
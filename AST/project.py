@@ -0,0 +1,195 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from .ast_typing import ParameterType
+from .blocks import FBD_Block
+from .dataflow_graph import DataflowGraph, NODE_BLOCK, NODE_INPUT_PORT, NODE_OUTPUT_PORT
+from .dependency_matrix import DependencyMatrix
+from .design_rules import SYMBOL_LENGTH_LIMITS, check_naming_uniqueness, evaluate_rule, naming_uniqueness_lines
+from .language_detection import LANGUAGE_DETECTOR, LanguageDetector
+from .program import Program
+
+
+class Project:
+    """
+    The POUs of a project, by name, and the calls between them: function blocks of a program whose type
+    is another POU of the project, i.e., instances of user function blocks (ValueType.CUSTOM_FBD).
+
+    Each POU is summarised by the input variables each of its output variables depends on.
+    The summaries are composed bottom-up over the call graph: inside a caller, an output of an instance
+    only depends on the inputs of the instance its summary names, instead of on all of them.
+    Summaries are computed once and cached, so querying a caller does not re-analyse its callees.
+    """
+
+    def __init__(self, programs: Iterable[Program]):
+        self.programs: Dict[str, Program] = dict()
+        for program in programs:
+            if program.progName in self.programs:
+                logging.warning(f"POU '{program.progName}' is defined more than once. Using the first definition")
+                continue
+            self.programs[program.progName] = program
+        self._calls: Dict[str, Dict[int, str]] = dict()
+        self._summaries: Dict[str, Dict[str, List[str]]] = dict()
+
+    def getProgram(self, name: str) -> Program:
+        return self.programs[name]
+
+    def setProgram(self, program: Program):
+        """Adds a POU to the project, or replaces the POU of the same name, e.g. after it was changed"""
+        is_new = program.progName not in self.programs
+        self.programs[program.progName] = program
+        # A new POU may turn blocks of any other POU into instances of it
+        self.invalidate(None if is_new else program.progName)
+
+    def getCalls(self, name: str) -> Dict[int, str]:
+        """The instances of POUs of the project in the given POU: block ID -> name of the instantiated POU"""
+        if name not in self._calls:
+            self._calls[name] = {
+                b.getID(): b.data.type
+                for b in self.programs[name].behaviourElements
+                if isinstance(b, FBD_Block) and b.data.type in self.programs
+            }
+        return self._calls[name]
+
+    def getCallGraph(self) -> Dict[str, List[str]]:
+        """For each POU: the distinct POUs it instantiates, in order of the blocks"""
+        return {name: list(dict.fromkeys(self.getCalls(name).values())) for name in self.programs}
+
+    def getDependencySummary(self, name: str) -> Dict[str, List[str]]:
+        """
+        For each output variable of the POU: the input variables of the POU it depends on,
+        through the instances of other POUs of the project, in order of the variable sheet.
+        Recursive instantiations, which IEC 61131-3 does not allow, are treated as depending on all inputs.
+        """
+        in_progress = set()
+        # Explicit stack of POUs whose summary is needed, callees are summarised before their callers
+        stack = [name]
+        while stack:
+            current = stack[-1]
+            if current in self._summaries:
+                stack.pop()
+                continue
+            missing = [c for c in dict.fromkeys(self.getCalls(current).values())
+                       if c not in self._summaries and c not in in_progress]
+            if missing and current not in in_progress:
+                in_progress.add(current)
+                stack.extend(missing)
+                continue
+            stack.pop()
+            self._summaries[current] = self._summarise(current)
+            in_progress.discard(current)
+        return self._summaries[name]
+
+    def getInfluencingInputs(self, name: str, output: str) -> List[str]:
+        """The input variables of the POU influencing the given output, through nested function blocks"""
+        return self.getDependencySummary(name).get(output, [])
+
+    def getLanguages(self, detector: LanguageDetector = LANGUAGE_DETECTOR) -> Dict[str, Optional[str]]:
+        """
+        The detected language of every variable description and comment of all POUs, classified in one batch.
+        Descriptions recurring across POUs are only detected once, and the language rules of the POUs
+        are then answered from the cache of the detector.
+        """
+        texts = [
+            text
+            for program in self.programs.values()
+            for text in [v.description for v in program.varHeader.getAllVariables() if v.description is not None]
+                        + [c.content for c in program.comments]
+        ]
+        return dict(zip(texts, detector.detect_all(texts)))
+
+    def getGlobalSymbols(self) -> List[str]:
+        """
+        The symbols of the project as a compiler linking all POUs sees them: the names of the POUs,
+        and the variables of each POU qualified by its name, as POU.variable
+        """
+        return list(self.programs) + [
+            f"{name}.{v.getName()}" for name, program in self.programs.items()
+            for v in program.varHeader.getAllVariables()
+        ]
+
+    def checkNamingUniqueness(self, symbol_lengths: Iterable[int] = SYMBOL_LENGTH_LIMITS) -> List[str]:
+        """
+        The naming uniqueness rule over the global symbols of all POUs, instead of the variables of one POU.
+        Returns: The [name, verdict, justification] of the rule
+        """
+        symbols = self.getGlobalSymbols()
+        return evaluate_rule("FBD.Naming.ProjectUniqueness", "Pass",
+                             "The POU and variable names are suitably unique to be told apart by compilers",
+                             lambda: naming_uniqueness_lines(check_naming_uniqueness(symbols, symbol_lengths)))
+
+    def invalidate(self, name: Optional[str] = None):
+        """
+        Drops the cached calls and summary of the given POU (after it was changed or replaced), and the summaries
+        of all POUs instantiating it, directly or indirectly. Without a name, all cached data is dropped.
+        """
+        if name is None:
+            self._calls.clear()
+            self._summaries.clear()
+            return
+        self._calls.pop(name, None)
+        callers = {n: set(calls) for n, calls in self.getCallGraph().items()}
+        stale = [name]
+        while stale:
+            current = stale.pop()
+            self._summaries.pop(current, None)
+            stale.extend(n for n, calls in callers.items() if current in calls and n in self._summaries)
+
+    def _summarise(self, name: str) -> Dict[str, List[str]]:
+        program = self.programs[name]
+        graph = program.getDataflowGraph()
+        port_dependencies = self._port_dependencies(program, graph)
+
+        # The flow over an instance goes directly from its input ports to the output ports depending on them
+        edges = [
+            (i, j)
+            for i in range(len(graph))
+            if not (graph.node_kinds[i] == NODE_BLOCK and graph.node_ids[i] in port_dependencies)
+            for j in graph.successors(i)
+            if not (graph.node_kinds[j] == NODE_BLOCK and graph.node_ids[j] in port_dependencies)
+        ]
+        for block_dependencies in port_dependencies.values():
+            for out_port, in_ports in block_dependencies.items():
+                edges.extend((graph.index_of[p], graph.index_of[out_port]) for p in in_ports)
+        composed_graph = DataflowGraph(graph.node_ids, graph.node_kinds, graph.node_blocks, edges)
+
+        input_names = [v.getName() for v in program.varHeader.getVarsByType(ParameterType.InputVar)]
+        output_names = [v.getName() for v in program.varHeader.getVarsByType(ParameterType.OutputVar)]
+        matrix = DependencyMatrix.from_graph(
+            composed_graph, program.behaviour_id_map, [v.getName() for v in program.varHeader.getAllVariables()]
+        )
+        inputs = set(input_names)
+        return {
+            o: [s for s in matrix.sources_of(o) if s in inputs] if o in matrix.output_index else []
+            for o in output_names
+        }
+
+    def _port_dependencies(self, program: Program, graph: DataflowGraph) -> Dict[int, Dict[int, List[int]]]:
+        """
+        For each instance with a known summary: output port ID -> the input port IDs it depends on.
+        Ports whose formal parameter is unknown to the summary depend on all input ports, as for any other block.
+        """
+        result = dict()
+        for block_id, callee in self.getCalls(program.progName).items():
+            summary = self._summaries.get(callee, None)
+            if summary is None:
+                # Recursive instantiation
+                continue
+            block = program.behaviour_id_map[block_id]
+            block_index = graph.index_of[block_id]
+            in_ports = [graph.node_ids[p] for p in graph.predecessors(block_index)
+                        if graph.node_kinds[p] == NODE_INPUT_PORT]
+            in_ports_by_name = {p.name: p.ID for p in block.getInputVars() + block.getInOutVars()}
+            block_dependencies = dict()
+            for out_port in graph.successors(block_index):
+                if graph.node_kinds[out_port] != NODE_OUTPUT_PORT:
+                    continue
+                out_id = graph.node_ids[out_port]
+                formal_name = next((p.name for p in block.getOutputVars() if p.ID == out_id), None)
+                if formal_name in summary:
+                    block_dependencies[out_id] = [in_ports_by_name[i] for i in summary[formal_name]
+                                                  if in_ports_by_name.get(i, None) in in_ports]
+                else:
+                    block_dependencies[out_id] = in_ports
+            result[block_id] = block_dependencies
+        return result
@@ -6,7 +6,7 @@ from utility_classes.point import Point
 from .utilities import swap_in_string
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Rectangle:
     top_left: Point
     bot_right: Point
@@ -1,3 +1,8 @@
+from array import array
+from collections import Counter
+from itertools import accumulate, repeat
+
+
 def swap_in_string(s, s1, s2):
     dummyString = "€€€&&ASDFGHJK"
     return (
@@ -35,3 +40,22 @@ def indexOrNone(aList, elem, startIndex=0):
         if aList[i] == elem:
             return i
     return None
+
+
+def to_csr(size, pairs, transpose=False):
+    """
+    Compressed sparse row form of distinct (row, value) pairs, with rows and values in range(size):
+    the values of row i are values[offsets[i]:offsets[i + 1]], in ascending order.
+    The pairs are sorted as integers row * size + value, which creates far less objects than sorting tuples.
+    With transpose, the pairs are read as (value, row).
+
+    Returns: offsets, values as integer arrays
+    """
+    if transpose:
+        keys = sorted({value * size + row for row, value in pairs})
+    else:
+        keys = sorted({row * size + value for row, value in pairs})
+    counts = Counter(map(size.__rfloordiv__, keys))
+    offsets = array("q", accumulate(map(counts.get, range(size), repeat(0)), initial=0))
+    values = array("q", map(size.__rmod__, keys))
+    return offsets, values
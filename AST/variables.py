@@ -1,4 +1,5 @@
 import json
+import weakref
 from dataclasses import dataclass
 from random import Random
 from typing import Optional
@@ -8,7 +9,7 @@ import pytest
 from .ast_typing import ParameterType, ValueType
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableLine:
     name: str
     paramType: ParameterType
@@ -163,6 +164,18 @@ class VariableGroup:
 class VariableWorkSheet:
     varGroups: list[VariableGroup]
 
+    def __post_init__(self):
+        self._index = None
+        self._owners = []
+
+    def __getstate__(self):
+        # The indexes are cheap to rebuild, and are not worth storing in the program cache.
+        # Owners register themselves again when they are unpickled
+        state = dict(self.__dict__)
+        state["_index"] = None
+        state["_owners"] = []
+        return state
+
     def toJSON(self):
         groups_json_str = ",".join([g.toJSON() for g in self.varGroups])
         json_result = f"""[{groups_json_str}]"""
@@ -173,21 +186,75 @@ class VariableWorkSheet:
         vgs = json.loads(json_string)
         return [VariableGroup.fromJSON(vg) for vg in vgs]
 
+    def invalidate_indexes(self):
+        """
+        Drops the lookup indexes, so that they are rebuilt on next use.
+        addVariable, removeVariable and addVariableGroup call it, and invalidate the owners of the sheet as well.
+        Any other change of the sheet must be followed by Program.invalidate, which calls it: adding, removing or
+        replacing groups or lines in varGroups or varLines directly, or changing the name or type of a variable
+        line in place.
+        """
+        self._index = None
+
+    def add_owner(self, owner):
+        """
+        Registers an object, e.g. the Program of the sheet, whose invalidate() is called after each change
+        through addVariable, removeVariable and addVariableGroup. Owners are not kept alive by the sheet
+        """
+        owners = [r for r in getattr(self, "_owners", []) if r() is not None]
+        if not any(r() is owner for r in owners):
+            owners.append(weakref.ref(owner))
+        self._owners = owners
+
+    def _changed(self):
+        self.invalidate_indexes()
+        for owner_ref in getattr(self, "_owners", []):
+            owner = owner_ref()
+            if owner is not None:
+                owner.invalidate()
+
+    def _indexes(self):
+        """(all variables, name -> first variable, type -> variables), built on first use after an invalidation"""
+        index = getattr(self, "_index", None)
+        if index is None:
+            all_variables = [v for group in self.varGroups for v in group.varLines]
+            by_name = dict()
+            by_type = dict()
+            for v in all_variables:
+                by_name.setdefault(v.name, v)
+                by_type.setdefault(v.paramType, []).append(v)
+            index = (all_variables, by_name, by_type)
+            self._index = index
+        return index
+
+    def addVariableGroup(self, group: VariableGroup):
+        self.varGroups.append(group)
+        self._changed()
+
+    def addVariable(self, groupName: str, variable: VariableLine):
+        group = next((g for g in self.varGroups if g.groupName == groupName), None)
+        if group is None:
+            raise ValueError(f"No variable group named '{groupName}'")
+        group.varLines.append(variable)
+        self._changed()
+
+    def removeVariable(self, variable: VariableLine):
+        group = next((g for g in self.varGroups if any(v is variable for v in g.varLines)), None)
+        if group is None:
+            raise ValueError(f"Variable '{variable.name}' is not in the sheet")
+        group.varLines = [v for v in group.varLines if v is not variable]
+        self._changed()
+
     def getAllVariables(self):
-        result = []
-        for group in self.varGroups:
-            result.extend(group.varLines)
-        return result
+        """All variables in sheet order. The list is shared between calls and must not be modified"""
+        return self._indexes()[0]
 
     def getFirstVariableByName(self, name):
-        allVars = self.getAllVariables()
-        for v in allVars:
-            if name == v.name:
-                return v
-        return None
+        return self._indexes()[1].get(name, None)
 
     def getVarsByType(self, vType: ParameterType):
-        return [e for e in self.getAllVariables() if e.paramType == vType]
+        """The variables of the given type, in sheet order. The list is shared between calls and must not be modified"""
+        return self._indexes()[2].get(vType, [])
 
     def __str__(self):
         return "\n".join([str(vg) for vg in self.varGroups])
@@ -1,3 +1,52 @@
-from django.test import TestCase
+import os
+import sys
+import tempfile
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from .models import BlockModel, ProjectModel
+from .utility_functions import make_project
+
+sys.path.append(os.path.join(os.path.abspath(os.path.dirname(__file__)), "../../draconis_parser/test"))
+from synthetic_programs import SyntheticPOU
+
+
+def pou_calling(name, callee=None):
+    """A program passing its input to its output, over an instance of the callee if given"""
+    pou = SyntheticPOU(name, "FUNCTION_BLOCK" if callee is None else "PROGRAM")
+    pou.add_variable("VAR_INPUT", "I", description="Input")
+    pou.add_variable("VAR_OUTPUT", "O", description="Output")
+    source = pou.in_variable("I")
+    if callee is not None:
+        source = pou.block(callee, [source], input_names=["I"], output_names=["O"], instance_name=f"{callee}_1")[0]
+    pou.out_variable("O", source)
+    return pou.render()
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class MakeProjectTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The app is shipped without migrations, so the test database has no tables for its models
+        with connection.schema_editor() as editor:
+            editor.create_model(ProjectModel)
+            editor.create_model(BlockModel)
+        super().setUpClass()
+
+    def upload(self, project, name, content):
+        BlockModel.create(name, SimpleUploadedFile(f"{name}.pou", content.encode("utf-8")), {}, {}, project).save()
+
+    def test_project_is_made_from_the_uploaded_programs_of_the_project(self):
+        project = ProjectModel.create("Line")
+        project.save()
+        other_project = ProjectModel.create("Other")
+        other_project.save()
+        self.upload(project, "Top", pou_calling("Top", "Inner"))
+        self.upload(project, "Inner", pou_calling("Inner"))
+        self.upload(other_project, "Unrelated", pou_calling("Unrelated"))
+
+        parsed_project = make_project(project)
+        self.assertEqual(sorted(parsed_project.programs), ["Inner", "Top"])
+        self.assertEqual(parsed_project.getCallGraph(), {"Top": ["Inner"], "Inner": []})
@@ -9,12 +9,13 @@ from typing import List
 
 from django.db.models.fields.files import FieldFile
 
-from .models import ReportModel, MetricsModel, BlockModel, SVGModel
+from .models import ReportModel, MetricsModel, BlockModel, SVGModel, ProjectModel
 from PIL import Image, ImageChops
 
 sys.path.append(os.path.join(os.path.abspath(os.path.dirname(__file__)), "../.."))
 from draconis_parser.renderer import render_program_to_svg, generate_image_of_program
-from draconis_parser.helper_functions import parse_pou_content, parse_pou_file
+from draconis_parser.helper_functions import parse_pou_content, parse_pou_file, parse_project_contents
+from draconis_parser import Project
 
 DEFAULT_RENDER_SCALE = 5.0
 
@@ -204,6 +205,14 @@ def analyse(program_content):
     return aProgram, backward_trace, reports, variable_info
 
 
+def make_project(project_model: ProjectModel) -> Project:
+    """Parses the uploaded programs of a project, resolving instances of function blocks to the programs defining them"""
+    models = BlockModel.objects.filter(project=project_model).order_by("id")
+    return parse_project_contents(
+        (m.program_name, get_file_content_as_single_string(m.program_content)) for m in models
+    )
+
+
 def get_file_content_as_single_string(file_field: FieldFile):
     return "\n".join([str(s, "UTF-8") for s in file_field.readlines()])
 
@@ -1,4 +1,5 @@
 import functools
+import multiprocessing
 from pathlib import Path
 import os
 import sys
@@ -7,12 +8,13 @@ import re
 import logging
 
 from functools import partial
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 logging.basicConfig(level=logging.DEBUG)
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
-from checks.check_interface import PLACEHOLDERS, ALLOWED_ACTIONS_NAMES, allowed_actions_map, \
-    reserved_value_input_mapper
+from checks.check_interface import PLACEHOLDERS, ALLOWED_ACTIONS_NAMES, INPUT_PLACEHOLDER, INPUT_PLACEHOLDER_LIST, \
+    allowed_actions_map
 
 from AST.program import extract_from_program
 
@@ -28,19 +30,28 @@ class Rule:
         self.constraint = constraint
         self.aCheck = lambda cons, prog: None
         self.data_source = lambda prog: []
+        # The name of the data source, rules of the same data source share the data extracted from a program
+        self.data_source_str = None
+
     def check_against_program(self, prog):
         """
         Runs the rule against the provided program.
 
         returns: The list of data elements that failed the rule
         """
-        datas = self.data_source(prog)
-        to_check = partial(self.aCheck, datas)
-        rule_failed_on_data = []
-        for d in datas:
-            if to_check(d):
-                rule_failed_on_data.append(str(d))
-        return rule_failed_on_data
+        return self.check_data(self.data_source(prog))
+
+    def check_data(self, datas):
+        """
+        Runs the rule against all elements of a data list in one call.
+        A constraint which only refers to the whole list is evaluated once, instead of once per element.
+
+        returns: The list of data elements that failed the rule
+        """
+        if INPUT_PLACEHOLDER not in self.constraint:
+            return [str(d) for d in datas] if datas and self.aCheck(datas, None) else []
+        check = self.aCheck
+        return [str(d) for d in datas if check(datas, d)]
 
     @classmethod
     def parse_data_source(cls, data_source: str):
@@ -51,8 +62,14 @@ class Rule:
 
     @classmethod
     def parse(
-            cls, rule_name, rule_constraint, data_source_str, _defines_map=None, abbreviations_map=None
+            cls, rule_name, rule_constraint, data_source_str, _defines_map=None, abbreviations_map=None,
+            actions_map=None
     ):
+        """
+        The constraint is compiled once, to a function of the data list and the data element checked.
+        actions_map: The functions constraints may call (see check_interface.allowed_actions_map). Built from
+            abbreviations_map if not given; a RuleSet shares one between its rules
+        """
         def handle_custom_syntax(constraint: str):
             """
             Parses some custom syntax related to arguments
@@ -108,18 +125,29 @@ class Rule:
             rule_constraint = handle_custom_syntax(rule_constraint)
         res = Rule(rule_name, rule_constraint)
         _data_source = cls.parse_data_source(data_source_str)
-        res.aCheck = lambda datas, e: eval(
-            rule_constraint,
-            allowed_actions_map(abbreviations_map),
-            reserved_value_input_mapper(datas, e)
-        )
+        if actions_map is None:
+            actions_map = allowed_actions_map(abbreviations_map)
+        try:
+            code = compile(f"lambda {INPUT_PLACEHOLDER_LIST}, {INPUT_PLACEHOLDER}: ({rule_constraint})",
+                           f"<rule {rule_name}>", "eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid syntax in constraint {rule_name}: {rule_constraint}") from e
+        res.aCheck = eval(code, actions_map)
         res.data_source = _data_source
+        res.data_source_str = data_source_str
         return res
 
 
 class RuleSet:
     def __init__(self) -> None:
         self.rules = []
+        # The JSON the rule set was read from, if any. Compiled rules cannot be pickled, so it is pickled instead
+        self.json_string = None
+
+    def __reduce__(self):
+        if self.json_string is None:
+            raise TypeError("Only rule sets read from JSON can be pickled")
+        return RuleSet.from_json_string, (self.json_string,)
 
     @classmethod
     def parse_rule_file(cls, aRuleFile: os.PathLike):
@@ -153,19 +181,21 @@ class RuleSet:
 
         data = json.loads(json_string)
         ruleset = RuleSet()
+        ruleset.json_string = json_string
         rules = data.get("Rules", None)
         defines_map = data.get("Defines", None)
         abbreviations_map = data.get("Abbreviations", None)
         data_source_map = data.get("DataSource", None)
         assert rules is not None and rules != {}
 
+        actions_map = allowed_actions_map(abbreviations_map)
         for rule_name, rule_constraint in rules.items():
             err = "\n".join(e for e in [error_check_constraint(rule_name, rule_constraint),
                                         check_valid_properties(rule_constraint)] if e)
             if err:
                 raise ValueError(err)
             ruleset.rules.append(
-                Rule.parse(rule_name, rule_constraint, data_source_map, defines_map, abbreviations_map)
+                Rule.parse(rule_name, rule_constraint, data_source_map, defines_map, abbreviations_map, actions_map)
             )
         assert data_source_map is not None and data_source_map != {}
         return ruleset
@@ -175,9 +205,91 @@ class RuleSet:
 
     def check_program(self, prog):
         res = []
-        for r in self.rules:
-            res.extend([f"{r.name}: {v}" for v in r.check_against_program(prog)])
+        for rule_name, violations in self.check_program_by_rule(prog):
+            res.extend([f"{rule_name}: {v}" for v in violations])
         return res
 
+    def check_program_by_rule(self, prog) -> List[Tuple[str, List[str]]]:
+        """
+        The name of each rule, and the data elements that failed it.
+        Each distinct data source is extracted from the program once, and shared by all rules using it.
+        """
+        return self.check_data_sources_by_rule(self.extract_data_sources(prog))
+
+    def _data_source_keys(self) -> List:
+        # Rules without a named data source do not share their data, they are keyed by their index instead
+        return [i if r.data_source_str is None else r.data_source_str for i, r in enumerate(self.rules)]
+
+    def extract_data_sources(self, prog) -> Dict:
+        """The data of each distinct data source of the rules, as extracted from the program"""
+        datas = dict()
+        for key, r in zip(self._data_source_keys(), self.rules):
+            if key not in datas:
+                datas[key] = r.data_source(prog)
+        return datas
+
+    def check_data_sources_by_rule(self, datas: Dict) -> List[Tuple[str, List[str]]]:
+        """The name of each rule, and the data elements that failed it, given the data of extract_data_sources"""
+        return [(r.name, r.check_data(datas[key])) for key, r in zip(self._data_source_keys(), self.rules)]
+
+    def check_programs(self, programs: Iterable, jobs=1) -> Iterator[Tuple[str, str, List[str]]]:
+        """
+        Checks the rules against many programs, e.g. to audit the naming conventions of a whole project.
+        Args:
+            programs: Programs, or paths of POU files, which are parsed where they are checked
+            jobs: Number of worker processes checking programs in parallel. The rule set is sent to each
+                worker once, so it must have been read from JSON. Workers are sent the paths, or the data
+                extracted from the programs, never the programs themselves
+
+        Yields: (program, rule name, failed data elements) for each program and rule, in the order of the programs
+            and the rules. The program is named by its path if given as a path, by its name otherwise.
+            Files that cannot be parsed are logged and left out.
+        """
+        if jobs <= 1:
+            for program in programs:
+                yield from check_program_records(self, program)
+            return
+
+        def worker_task(program):
+            if isinstance(program, (str, os.PathLike)):
+                return program
+            return program.progName, self.extract_data_sources(program)
+
+        with multiprocessing.Pool(jobs, initializer=_set_worker_ruleset, initargs=(self,)) as pool:
+            for records in pool.imap(_check_program_in_worker, map(worker_task, programs), chunksize=1):
+                yield from records
+
     def get_rule_names(self):
         return [r.name for r in self.rules]
+
+
+def check_program_records(ruleset: RuleSet, program) -> List[Tuple[str, str, List[str]]]:
+    """The (program, rule name, failed data elements) records of a program or POU file (see RuleSet.check_programs)"""
+    if isinstance(program, (str, os.PathLike)):
+        from draconis_parser.helper_functions import parse_pou_file
+        name = str(program)
+        try:
+            program = parse_pou_file(name)
+        except Exception as e:
+            logging.error(f"Failure during parse process of {name}. {e}")
+            return []
+    else:
+        name = program.progName
+    return [(name, rule_name, violations) for rule_name, violations in ruleset.check_program_by_rule(program)]
+
+
+# The rule set of a worker process of RuleSet.check_programs
+_worker_ruleset = None
+
+
+def _set_worker_ruleset(ruleset: RuleSet):
+    global _worker_ruleset
+    _worker_ruleset = ruleset
+
+
+def _check_program_in_worker(task):
+    if isinstance(task, tuple):
+        name, datas = task
+        return [(name, rule_name, violations)
+                for rule_name, violations in _worker_ruleset.check_data_sources_by_rule(datas)]
+    return check_program_records(_worker_ruleset, task)
@@ -2,6 +2,7 @@ from typing import List, Set
 import networkx as nx
 
 from AST import PathDivide, Port
+from AST.dataflow_graph import DataflowGraph, NODE_BLOCK
 from draconis_parser import Program
 
 
@@ -19,9 +20,7 @@ def graph_from_program(prog: Program):
     all_edges = set()
     traces = prog.getBackwardTrace()
     for out_var_name, path in traces.items():
-        flat_paths = PathDivide.unpack_pathlist([path])
-        curr_edges = path_list_to_graph_edges([flat_paths])
-        all_edges = all_edges.union(curr_edges)
+        all_edges = all_edges.union(PathDivide.edges([path]))
 
     for edgeF, edgeT in all_edges:
         resultGraph.add_edge(edgeF, edgeT)
@@ -32,6 +31,18 @@ def islands_from_graph(graph: nx.Graph):
     return {i + 1: island for i, island in enumerate(nx.connected_components(graph))}
 
 
+def islands_from_dataflow_graph(graph: DataflowGraph):
+    """
+    The connected networks of a data flow graph, numbered from 1 in the order of the worksheet,
+    as sets of port IDs. Variable blocks are their own port
+    """
+    block_nodes = set(graph.nodes_of_kind(NODE_BLOCK))
+    return {
+        i + 1: set(graph.ids(n for n in island if n not in block_nodes))
+        for i, island in enumerate(graph.islands())
+    }
+
+
 def islands_from_program(prog: Program, display="IDs"):
     def blockID_to_display_name(ID):
         port = prog.ports.get(ID, None)
@@ -42,7 +53,7 @@ def islands_from_program(prog: Program, display="IDs"):
         name = block.getName()
         return f"{name}_{port.blockID}"
 
-    islands = islands_from_graph(graph_from_program(prog))
+    islands = islands_from_dataflow_graph(prog.getDataflowGraph())
     if display == "Names":
         return {i: set(map(blockID_to_display_name, v)) for i, v in islands.items()}
     else:
@@ -1,6 +1,5 @@
-import functools
 from typing import Set, Dict
-from AST import Program, FBD_Block, Rectangle
+from AST import Program
 from graph_utilities import islands_from_program
 
 
@@ -16,16 +15,8 @@ def check_position_of_networks(prog: Program):
         Returns:
         """
         converted_to_blockIDs = {i: set(map(lambda e: prog.ports[e].blockID, v)) for i, v in networks.items()}
-        converted_to_block_boxes = {i: list(map(lambda e: prog.behaviour_id_map[e].getBoundingBox().getAsTuple(), v)) for i, v
-                                    in converted_to_blockIDs.items()}
-        converted_to_bounding_boxes = {}
-        for i, boxes in converted_to_block_boxes.items():
-            left = functools.reduce(min, map(lambda e: e[0], boxes))
-            top = functools.reduce(min, map(lambda e: e[1], boxes))
-            right = functools.reduce(max, map(lambda e: e[2], boxes))
-            bottom = functools.reduce(max, map(lambda e: e[3], boxes))
-            converted_to_bounding_boxes[i] = Rectangle.fromTuple(left, top, right, bottom)
-        return converted_to_bounding_boxes
+        block_boxes = prog.getBlockBoxes()
+        return {i: block_boxes.boundingBox(block_boxes.row_of[e] for e in v) for i, v in converted_to_blockIDs.items()}
 
     networks = islands_from_program(prog)
     if len(networks) <= 1:
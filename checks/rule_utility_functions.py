@@ -1,5 +1,6 @@
 
-from typing import List, Dict, Tuple
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
 import re
 
 def unique(xs):
@@ -7,6 +8,25 @@ def unique(xs):
         xs = list(xs)
     return len(xs) == len(set(xs))
 
+def prefix_collisions(names: Iterable[str], lengths: Iterable[int]) -> Dict[int, List[str]]:
+    """
+    For each symbol length limit: the names (sorted) which cannot be told apart from another name
+    when truncated to that length, as by a compiler only storing the first characters of a symbol.
+
+    Names are bucketed by their truncated prefix, from the shortest limit up. A name alone in its bucket
+    is unique at all longer limits as well, so only the colliding names are bucketed again.
+    Takes O(len(names) * len(lengths)) time, instead of comparing all pairs of names.
+    """
+    candidates = list(names)
+    result = dict()
+    for length in sorted(set(lengths)):
+        buckets = defaultdict(list)
+        for name in candidates:
+            buckets[name[:length]].append(name)
+        candidates = [name for bucket in buckets.values() if len(bucket) > 1 for name in bucket]
+        result[length] = sorted(set(candidates))
+    return result
+
 def any_match(pat, s):
     return bool(re.search(pat, s))
 
@@ -0,0 +1,86 @@
+import os
+import statistics
+import sys
+import time
+
+source_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "..")
+if source_path not in sys.path:
+    sys.path.append(source_path)
+import pytest
+
+from .. import constraint_rules
+from ..check_interface import allowed_actions_map, reserved_value_input_mapper
+from ..constraint_rules import RuleSet
+
+LENGTH_RULES = """{
+    "DataSource": "VariableNames",
+    "Defines": {"SigLenMin": "10", "SigLenMax": "20"},
+    "Rules": {
+        "TooManySignals": "len(__inputlist__)>40",
+        "SignalNameIsTooShort": "len(__input__)<##SigLenMin##",
+        "SignalNameIsIsTooLong": "len(__input__)>##SigLenMax##",
+        "NotUnique": "unique(__inputlist__) == False"
+    }
+}"""
+
+
+def variable_names(n):
+    return [f"Signal_{'x' * (i % 25)}_{i}" for i in range(n)]
+
+
+def eval_per_element(rule, datas):
+    """The evaluation rules used before constraints were compiled, kept as the reference"""
+    return [str(d) for d in datas
+            if eval(rule.constraint, allowed_actions_map(None), reserved_value_input_mapper(datas, d))]
+
+
+@pytest.mark.parametrize("nr_of_names", [0, 1, 41, 500])
+def test_compiled_rules_equal_eval_per_element(nr_of_names):
+    datas = variable_names(nr_of_names)
+    for rule in RuleSet.from_json_string(LENGTH_RULES).rules:
+        assert rule.check_data(datas) == eval_per_element(rule, datas)
+
+
+def test_actions_map_is_built_once_per_rule_set(monkeypatch):
+    calls = []
+    monkeypatch.setattr(constraint_rules, "allowed_actions_map",
+                        lambda abbreviations: calls.append(abbreviations) or allowed_actions_map(abbreviations))
+    ruleset = RuleSet.from_json_string(LENGTH_RULES)
+    for rule in ruleset.rules:
+        rule.check_data(variable_names(100))
+    assert calls == [None]
+
+
+def test_list_only_constraint_is_evaluated_once():
+    rule = next(r for r in RuleSet.from_json_string(LENGTH_RULES).rules if r.name == "TooManySignals")
+    calls = []
+    check = rule.aCheck
+    rule.aCheck = lambda datas, e: calls.append(e) or check(datas, e)
+    assert rule.check_data(variable_names(50)) == variable_names(50)
+    assert calls == [None]
+
+
+def test_given_invalid_syntax_shall_not_parse():
+    with pytest.raises(ValueError) as excinfo:
+        RuleSet.from_json_string('{ "Rules": {"Broken": "len(__input__) >"}, "DataSource": "VariableNames" }')
+    assert "Invalid syntax" in str(excinfo.value)
+
+
+def check_times(datas, repetitions=5):
+    """Median times of checking the rules against the data, compiled and with eval per element"""
+    rules = RuleSet.from_json_string(LENGTH_RULES).rules
+    compiled, evaluated = [], []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        [r.check_data(datas) for r in rules]
+        compiled.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        [eval_per_element(r, datas) for r in rules]
+        evaluated.append(time.perf_counter() - start)
+    return statistics.median(compiled), statistics.median(evaluated)
+
+
+if __name__ == "__main__":
+    for n in [1000, 2000, 5000]:
+        compiled, evaluated = check_times(variable_names(n))
+        print(f"{n} variables: compiled {compiled:.4f}s, eval per element {evaluated:.4f}s")
@@ -8,6 +8,7 @@ if source_path not in sys.path:
     sys.path.append(source_path)
 if draconis_path not in sys.path:
     sys.path.append(draconis_path)
+from .. import constraint_rules
 from ..constraint_rules import RuleSet
 from AST.program import Program, extract_from_program
 from draconis_parser.helper_functions import parse_pou_file
@@ -65,3 +66,63 @@ def test_given_normal_and_defined_rule_version_results_are_equal(programs, rule_
     equal_no_ordering(ruleset_normal.get_rule_names(), ruleset_defs.get_rule_names())
     for prog in programs.values():
         equal_no_ordering(ruleset_normal.check_program(prog), set(ruleset_defs.check_program(prog)))
+
+
+def test_check_programs_streams_the_violations_of_check_program(programs, rule_files):
+    ruleset = RuleSet.parse_rule_file(rule_files["Length"])
+    records = list(ruleset.check_programs(programs.values()))
+    nr_of_rules = len(ruleset.rules)
+    for i, prog in enumerate(programs.values()):
+        program_records = records[i * nr_of_rules:(i + 1) * nr_of_rules]
+        assert [(p, r) for p, r, _ in program_records] == [(prog.progName, r) for r in ruleset.get_rule_names()]
+        assert [f"{r}: {v}" for _, r, vs in program_records for v in vs] == ruleset.check_program(prog)
+
+
+def test_check_programs_parses_paths_in_worker_processes(rule_files, caplog):
+    ruleset = RuleSet.parse_rule_file(rule_files["Length"])
+    test_dir = os.path.join(THIS_DIR, "test_programs")
+    paths = [os.path.join(test_dir, f) for f in ["MultiANDer.pou", "Missing.pou", "MultiANDerLongNames.pou"]]
+    sequential = list(ruleset.check_programs(paths))
+    assert sequential == list(ruleset.check_programs(paths, jobs=2))
+    assert [p for p, _, _ in sequential] == [paths[0]] * 3 + [paths[2]] * 3
+    assert "Missing.pou" in caplog.text
+
+
+def test_check_programs_sends_the_data_of_analysed_programs_to_worker_processes(programs, rule_files):
+    ruleset = RuleSet.parse_rule_file(rule_files["Length"])
+    for prog in programs.values():
+        prog.check_rules()
+    sequential = list(ruleset.check_programs(programs.values()))
+    assert sequential == list(ruleset.check_programs(programs.values(), jobs=2))
+
+
+def test_each_data_source_is_extracted_once_per_program(programs, rule_files, monkeypatch):
+    calls = []
+    monkeypatch.setattr(constraint_rules, "extract_from_program",
+                        lambda value, prog: calls.append(value) or extract_from_program(value, prog))
+    ruleset = RuleSet.parse_rule_file(rule_files["Length"])
+    list(ruleset.check_programs(programs.values()))
+    assert calls == ["VariableNames"] * len(programs)
+
+
+if __name__ == "__main__":
+    import glob
+    import time
+    ruleset = RuleSet.parse_rule_file(load_rule_files()["Length"])
+    pou_files = sorted(glob.glob(os.path.join(draconis_path, "draconis_parser", "test", "**", "*.pou"),
+                                 recursive=True))
+    fleet = pou_files * 20
+    start = time.perf_counter()
+    for f in fleet:
+        try:
+            ruleset.check_program(parse_pou_file(f))
+        except Exception:
+            pass
+    print(f"{len(fleet)} POU files, one at a time: {time.perf_counter() - start:.2f}s")
+    # Worker processes can only be faster with more than one core
+    print(f"{os.cpu_count()} cores")
+    for jobs in sorted({1, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        records = list(ruleset.check_programs(fleet, jobs=jobs))
+        print(f"{len(fleet)} POU files, check_programs with {jobs} jobs: {time.perf_counter() - start:.2f}s "
+              f"({len(records)} records)")
@@ -56,12 +56,13 @@ def test_given_multiple_islands_can_identify_each():
 
 def test_given_program_with_multiple_networks_can_identify_each_with_element_names_and_ids(programs):
     prog = programs["feedback_example"]
+    # Networks are numbered in the order of the worksheet
     expected_with_qualified_names = {1: {"Output_Feedback_6", "ADD_S_3", "Input_A_4", "Input_B_5"},
-                                     2: {"Output_asd_18", "ADD_15", "Input_In1_16", "Input_hello_17"},
-                                     3: {"Output_B_8", "Input_Feedback_7"}}
+                                     2: {"Output_B_8", "Input_Feedback_7"},
+                                     3: {"Output_asd_18", "ADD_15", "Input_In1_16", "Input_hello_17"}}
     expected_with_IDs = {1: {0, 1, 2, 4, 5, 6},
-                         2: {12, 13, 14, 16, 17, 18},
-                         3: {8, 7}}
+                         2: {8, 7},
+                         3: {12, 13, 14, 16, 17, 18}}
     assert expected_with_IDs == islands_from_program(prog)
     assert expected_with_qualified_names == islands_from_program(prog, display="Names")
 
@@ -76,5 +77,5 @@ def test_check_can_identify_graphically_misaligned_networks(programs):
     assert [] == check_position_of_networks(conforming_multi_network_program)
 
     # Negative Cases
-    assert ["Network 2 is misaligned. Networks shall be positioned top-to-bottom and left-to-right"] == \
+    assert ["Network 3 is misaligned. Networks shall be positioned top-to-bottom and left-to-right"] == \
            check_position_of_networks(nonconforming_multi_network)
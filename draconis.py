@@ -6,6 +6,7 @@ import tempfile
 import requests
 
 from draconis_parser.helper_functions import parse_pou_file
+from draconis_parser.program_cache import ProgramCache
 from draconis_parser.renderer import render_program_to_svg, self_contained_style_header
 
 def upload_single_model(server, model_path, metrics_path, project_name):
@@ -42,11 +43,11 @@ def batch_upload(target_data, server):
             print(metrics_file_path)
 
 
-def render_model(model_file, result_svg_path):
+def render_model(model_file, result_svg_path, cache=None):
     if not (os.path.isfile(model_file)):
         return None
 
-    aProgram = parse_pou_file(model_file)
+    aProgram = parse_pou_file(model_file, cache=cache)
     w, h, svg_content = render_program_to_svg(aProgram, scale=7.0)
     style_css = self_contained_style_header()
     result_fp = result_svg_path + ".html"
@@ -81,6 +82,8 @@ def main():
     parser.add_argument("--project-name", required=False,
                                     default="UNKNOWN",
                                     help="Name of project to associate models with")
+    parser.add_argument("--program-cache-dir", required=False, default=None,
+                        help="Directory for caching parsed programs between runs. Unchanged files are not re-parsed")
     subparsers = parser.add_subparsers(dest="command")
 
     upload_parser = subparsers.add_parser("upload", help="Upload analyses to server")
@@ -102,6 +105,7 @@ def main():
     render_parser.add_argument('--models-directory', required=True, help="Path to model file")
 
     args = parser.parse_args()
+    cache = ProgramCache(args.program_cache_dir) if args.program_cache_dir else None
 
     if args.command == "upload":
         # Load and parse the JSON file specified in --target
@@ -140,7 +144,7 @@ def main():
         add_metrics(args.model, args.metrics_file, args.server)
 
     if args.command == "render":
-        res_path = render_model(args.model_path, args.output_path)
+        res_path = render_model(args.model_path, args.output_path, cache)
         if res_path is not None:
             print("Render created at " + res_path)
         else:
@@ -150,7 +154,8 @@ def main():
         all_files = os.listdir(args.models_directory)
         pou_files = [f for f in all_files if os.path.splitext(f)[1] == ".pou"]
         for pou in pou_files:
-            res_path = render_model(os.path.join(args.models_directory, pou), os.path.join(args.models_directory, pou + ".svg"))
+            res_path = render_model(os.path.join(args.models_directory, pou), os.path.join(args.models_directory, pou + ".svg"),
+                                    cache)
             if res_path is None:
                 print(f"Failed during render of {pou}")
                 continue
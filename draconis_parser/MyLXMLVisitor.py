@@ -0,0 +1,325 @@
+import io
+import logging
+import re
+import sys
+
+from lxml import etree
+
+from draconis_parser import CommentBox
+from draconis_parser import ParameterType
+from draconis_parser import FBDObjData
+from Web_GUI import Point, Rectangle
+from AST.blocks import Expr, VarBlock, FBD_Block
+from AST.geometry import LineTable
+from draconis_parser import (
+    ConnectionDirection,
+    ConnectionData,
+    Connection,
+    ConnectionPoint,
+)
+from draconis_parser import FormalParam, ParamList
+from utility_classes.position import GUIPosition, make_absolute_position, make_relative_position
+
+
+def tag_name(element):
+    """The tag name of an lxml element, without any namespace URI"""
+    return element.tag.rpartition("}")[2]
+
+
+def child_elements(element):
+    """All child nodes that are elements, i.e., skipping XML comments and processing instructions"""
+    return [c for c in element if isinstance(c.tag, str)]
+
+
+# The markup of an XML document: comments, CDATA sections, processing instructions and declarations,
+# end tags, and start tags. A '<' cannot occur anywhere else in well-formed XML
+MARKUP = re.compile(
+    r"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>|<!.*?>|</[^>]*>|<(?:[^>\"']|\"[^\"]*\"|'[^']*')*>", re.S
+)
+# Whitespace inside a tag, outside of attribute values
+TAG_WHITESPACE = re.compile(r"(\"[^\"]*\"|'[^']*')|[ \t\r\n]+")
+
+
+def markup_kind(text):
+    """'end', 'start', 'empty' (a self-closing start tag) or 'other' for a match of MARKUP"""
+    if text.startswith("</"):
+        return "end"
+    if text.startswith(("<!", "<?")):
+        return "other"
+    return "empty" if text.endswith("/>") else "start"
+
+
+class SourceStartTags:
+    """
+    Finds the start tags of a document in its source text, by their position in document order.
+    The source is only scanned as far as needed, and once: positions must be requested in increasing order.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self._matches = MARKUP.finditer(source)
+        self._count = 0
+        self._last = None
+
+    def start_tag(self, ordinal: int):
+        """The match of the start tag of the element at the given position, counted from 0"""
+        while self._count <= ordinal:
+            m = next(self._matches)
+            if markup_kind(m.group()) in ("start", "empty"):
+                self._count += 1
+                self._last = m
+        return self._last
+
+    def content_text(self, ordinal: int):
+        """
+        The text ANTLR's getText() gives for the content of the element at the given position:
+        the source text as written, with whitespace inside tags dropped.
+        """
+        start = self.start_tag(ordinal)
+        if markup_kind(start.group()) == "empty":
+            return ""
+        depth = 1
+        for m in MARKUP.finditer(self.source, start.end()):
+            kind = markup_kind(m.group())
+            depth += {"start": 1, "end": -1}.get(kind, 0)
+            if depth == 0:
+                content = self.source[start.end():m.start()]
+                return MARKUP.sub(
+                    lambda t: t.group() if markup_kind(t.group()) == "other"
+                    else TAG_WHITESPACE.sub(lambda w: w.group(1) or "", t.group()),
+                    content,
+                )
+        raise ValueError(f"Element at {start.start()} is not closed")
+
+
+class MyLXMLVisitor:
+    """
+    Code worksheet parser built on lxml's incremental parser.
+
+    Produces the same elements, local ID map, lines and comments as MyXMLVisitor.
+    The document is consumed with iterparse, one top-level FBD node at a time,
+    and each node is discarded as soon as it has been handled.
+    """
+
+    def __init__(self):
+        self.elements = []
+        self.local_id_map = {}
+        self.lines = LineTable()
+        self.comments = []
+        # The start tags of the document in its source, and the top-level node being handled with its position
+        # among them. Used for the text of comments, which is kept as written
+        self.source_start_tags = None
+        self.top_level_element = None
+        self.top_level_ordinal = None
+
+    def visitDocument(self, input_codeWorkSheet: str):
+        self.elements = []
+        # The worksheet claims to be utf-16, but has already been decoded by the time it gets here
+        source = io.BytesIO(input_codeWorkSheet.encode("utf-8"))
+        self.source_start_tags = SourceStartTags(input_codeWorkSheet)
+        depth = 0
+        nr_of_start_tags = 0
+        root_name = None
+        for event, element in etree.iterparse(source, events=("start", "end"), encoding="utf-8"):
+            if event == "start":
+                if depth == 0:
+                    root_name = tag_name(element)
+                    if "FBD" != root_name:
+                        logging.warning(f"{element} is not parsed - tag name:{root_name}")
+                elif depth == 1:
+                    self.top_level_element, self.top_level_ordinal = element, nr_of_start_tags
+                nr_of_start_tags += 1
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and "FBD" == root_name:
+                self.visitElement(element)
+                # Free the handled node, together with any already handled siblings
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+        self.source_start_tags = self.top_level_element = self.top_level_ordinal = None
+        return None
+
+    def visitElement(self, element):
+        def get_value_or_none(d: dict, v, f):
+            return f(d.get(v)) if d.get(v, None) else None
+
+        name = tag_name(element)
+        # Attribute dictionaries end up in the AST, e.g. as data of formal parameters:
+        # share the strings repeated across elements instead of keeping a copy per element
+        attrs = {sys.intern(k): sys.intern(v) for k, v in element.attrib.items()}
+        result = None
+        if "block" == name:
+            self.elements.append(self.ppx_parse_block(attrs, element))
+        elif "inVariable" == name:
+            self.elements.append(self.ppx_parse_VarBlock(attrs, element, "in"))
+        elif "outVariable" == name:
+            self.elements.append(self.ppx_parse_VarBlock(attrs, element, "out"))
+        elif "connectionPointIn" == name:
+            result = self.ppx_parse_ConnectionPoint(element, ConnectionDirection.Input)
+        elif "connectionPointOut" == name:
+            result = self.ppx_parse_ConnectionPoint(element, ConnectionDirection.Output)
+        elif "expression" == name:
+            result = self.ppx_parse_expression(element)
+        elif "FBD" == name:
+            for e in child_elements(element):
+                self.visitElement(e)
+        elif "line" == name:
+            start_x, start_y, end_x, end_y = map(
+                int,
+                (attrs["beginX"], attrs["beginY"], attrs["endX"], attrs["endY"]),
+            )
+            self.lines.append(start_x, start_y, end_x, end_y)
+            result = attrs
+        elif "addData" == name:
+            result = self.parse_addData_node(element)
+        elif "data" == name:
+            result = [self.visitElement(e) for e in child_elements(element)]
+        elif "connectedFormalparameter" == name:
+            result = get_value_or_none(attrs, "refLocalId", int)
+        elif "fp" == name:
+            result = int(attrs["localId"])
+        elif "relPosition" == name:
+            result = make_relative_position(int(attrs.get("x", -1)), int(attrs.get("y", -1)))
+        elif "position" == name:
+            result = make_absolute_position(int(attrs.get("x", -1)), int(attrs.get("y", -1)))
+        elif "connection" == name:
+            result = self.ppx_parse_Connection(element, attrs)
+        elif "inputVariables" == name:
+            result = ParamList(ParameterType.InputVar, self.ppx_parse_variables(element))
+        elif "outputVariables" == name:
+            result = ParamList(ParameterType.OutputVar, self.ppx_parse_variables(element))
+        elif "inOutVariables" == name:
+            result = ParamList(ParameterType.InOutVar, self.ppx_parse_variables(element))
+        elif "variable" == name:
+            result = self.ppx_parse_formal_variable(attrs, element)
+        elif "comment" == name:
+            self.comments.append(self.ppx_parse_comment(attrs, element))
+        elif "content" == name:
+            result = self.ppx_parse_comment_content(element)
+        else:
+            logging.warning(f"{element} is not parsed - tag name:{name}")
+        return result, name, attrs
+
+    def ppx_parse_block(self, blockParams: dict[str, str], element):
+        blockElements = [self.visitElement(e)[0] for e in child_elements(element)]
+        varBlocks = [e for e in blockElements if isinstance(e, ParamList)]
+        inVars = [e for e in varBlocks if e.varType == ParameterType.InputVar]
+        inOutVars = [e for e in varBlocks if e.varType == ParameterType.InOutVar]
+        outVars = [e for e in varBlocks if e.varType == ParameterType.OutputVar]
+        GUI_position_top_left = [e for e in blockElements if isinstance(e, GUIPosition)][0]
+        position_top_left = Point(GUI_position_top_left.x, GUI_position_top_left.y)
+        size = Point(int(blockParams["width"]), int(blockParams["height"]))
+        bounding_box = Rectangle(position_top_left, position_top_left + size)
+        result = FBD_Block(
+            FBDObjData(int(blockParams["localId"]), blockParams["typeName"], bounding_box),
+            {},
+            [inVars[0], inOutVars[0], outVars[0]],
+        )
+        self.local_id_map[int(blockParams["localId"])] = result
+        return result
+
+    def ppx_parse_VarBlock(self, outVarArgs, element, direction="in"):
+        blockElements = [self.visitElement(e)[0] for e in child_elements(element)]
+        GUI_position_top_left = [e for e in blockElements if isinstance(e, GUIPosition)][0]
+        expr = [e for e in blockElements if isinstance(e, Expr)][0]
+        connection_points = [e for e in blockElements if isinstance(e, ConnectionPoint)][0]
+        localId = int(outVarArgs["localId"])
+        height, width = int(outVarArgs["height"]), int(outVarArgs["width"])
+        upper_left_point = Point(GUI_position_top_left.x, GUI_position_top_left.y)
+        lower_right_point = upper_left_point + Point(width, height)
+        blockData = FBDObjData(localId, direction + "Variable", Rectangle(upper_left_point, lower_right_point))
+        self.local_id_map[localId] = VarBlock(blockData, {}, connection_points, expr)
+        return self.local_id_map[localId]
+
+    def ppx_parse_expression(self, element):
+        exprStr = element.text
+        assert (exprStr is not None) and (exprStr != "")
+        return Expr(exprStr)
+
+    def ppx_parse_comment(self, attrs, element):
+        elements_attrib_pairs = [self.visitElement(e) for e in child_elements(element)]
+        position = elements_attrib_pairs[0][0]
+        _comment_content = elements_attrib_pairs[1][0]
+        bounding_box = Rectangle(
+            Point(position.x, position.y),
+            Point(position.x + int(attrs["width"]), position.y + int(attrs["height"])),
+        )
+        return CommentBox(bounding_box, _comment_content)
+
+    def ppx_parse_comment_content(self, element):
+        html_tag = child_elements(element)[0]
+        body_node = next(e for e in html_tag.iter() if isinstance(e.tag, str) and "body" == tag_name(e))
+        p_node = child_elements(body_node)[0]
+        # Like ANTLR's getText(), the content is kept as written, e.g. with its entity references and CDATA sections
+        p_ordinal = next(i for i, e in enumerate(self.top_level_element.iter(etree.Element)) if e is p_node)
+        return self.source_start_tags.content_text(self.top_level_ordinal + p_ordinal)
+
+    def parse_addData_node(self, addDataNode):
+        dataNodes = child_elements(addDataNode)
+        assert len(dataNodes) == 1
+        return [self.visitElement(e) for e in child_elements(dataNodes[0])]
+
+    def ppx_parse_Connection(self, element, attrs):
+        elements = child_elements(element)
+        if not elements:
+            return Connection(
+                ConnectionData(),
+                ConnectionData(pos=None, connIndex=int(attrs["refLocalId"])),
+                formalName=attrs.get("formalParameter", None),
+            )
+
+        names = [tag_name(e) for e in elements]
+        foundPositionData = any("position" in n for n in names)
+        foundAdditionalData = "addData" in names
+
+        startID = None
+        if foundPositionData and not foundAdditionalData:
+            toPosition = self.visitElement(elements[0])[0]
+            fromPosition = self.visitElement(elements[1])[0]
+        elif foundAdditionalData and not foundPositionData:
+            toPosition = make_absolute_position(-1, -1)
+            fromPosition = make_absolute_position(-1, -1)
+            startID, _, _ = self.parse_addData_node(elements[0])[0]
+        else:
+            toPosition = self.visitElement(elements[1])[0]
+            fromPosition = self.visitElement(elements[2])[0]
+            startID, _, _ = self.parse_addData_node(elements[0])[0]
+        return Connection(
+            startPoint=ConnectionData(fromPosition, startID),
+            endPoint=ConnectionData(toPosition, int(attrs["refLocalId"])),
+            formalName=attrs.get("formalParameter", None),
+        )
+
+    def ppx_parse_ConnectionPoint(self, element, conn_type):
+        connectionData = ConnectionData()
+        connections = []
+        for c in child_elements(element):
+            res, name, _ = self.visitElement(c)
+            if "position" in name.lower():
+                connectionData.position = res
+            if "connection" in name.lower():
+                connections.append(res)
+        return ConnectionPoint(conn_type, connections, connectionData)
+
+    def ppx_parse_variables(self, element):
+        """Parse a list of variables"""
+        # E.g., block is a generator taking no input, or a sink having no outputs
+        return [self.visitElement(e)[0] for e in child_elements(element)]
+
+    def ppx_parse_formal_variable(self, attrs, element):
+        elements = child_elements(element)
+        assert len(elements) == 2
+        parsed_element_results = [self.visitElement(e)[0] for e in elements]
+        connPoint = parsed_element_results[0]
+        fpData = parsed_element_results[1][0]
+        assert "fp" == fpData[1]
+
+        return FormalParam(
+            name=attrs["formalParameter"],
+            connectionPoint=connPoint,
+            ID=fpData[0],
+            data=fpData[2],
+        )
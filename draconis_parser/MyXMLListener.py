@@ -0,0 +1,292 @@
+import logging
+import sys
+
+from antlr4 import CommonTokenStream
+
+from draconis_parser import CommentBox
+from antlr_generated.python.XMLParser import XMLParser
+from antlr_generated.python.XMLParserListener import XMLParserListener
+
+from draconis_parser import ParameterType
+from draconis_parser import FBDObjData
+from Web_GUI import Point, Rectangle
+from AST.blocks import Expr, VarBlock, FBD_Block
+from AST.geometry import LineTable
+from draconis_parser import (
+    ConnectionDirection,
+    ConnectionData,
+    Connection,
+    ConnectionPoint,
+)
+from draconis_parser import FormalParam, ParamList
+from utility_classes.position import GUIPosition, make_absolute_position, make_relative_position
+from xml_text import attribute_value, element_text
+
+# Elements whose children are visited by MyXMLVisitor. Children of any other element are never looked at
+CHILD_VISITING_TAGS = {
+    "FBD", "block", "inVariable", "outVariable", "connectionPointIn", "connectionPointOut", "addData", "data",
+    "connection", "inputVariables", "outputVariables", "inOutVariables", "variable", "comment",
+}
+# Elements whose children are handled as raw markup, instead of being visited
+RAW_CONTENT_TAGS = {"content"}
+
+
+class ElementFrame:
+    """The state of an element which has been entered, but not yet exited"""
+
+    def __init__(self, ctx, mode, parent):
+        self.ctx = ctx
+        # Known once the start tag has been consumed
+        self.name = None
+        self.mode = mode
+        self.parent = parent
+        self.attrs = dict()
+        # (result, name, attrs) of visited child elements, or the frames of raw child elements
+        self.children = []
+        self.content_interval = None
+
+
+class MyXMLListener(XMLParserListener):
+    """
+    Code worksheet builder driven by the enter and exit events of the ANTLR parser.
+
+    Produces the same elements, local ID map, lines and comments as MyXMLVisitor, but the parser
+    does not build a parse tree: each element is turned into its AST object when it is exited,
+    from the already built objects of its children, after which its context can be freed.
+    """
+
+    # Element modes
+    VISITED = "visited"
+    RAW = "raw"
+    SKIPPED = "skipped"
+
+    def __init__(self, token_stream: CommonTokenStream):
+        self.token_stream = token_stream
+        self.elements = []
+        self.local_id_map = {}
+        self.lines = LineTable()
+        self.comments = []
+        self.current = None
+
+    @classmethod
+    def parse(cls, token_stream: CommonTokenStream):
+        parser = XMLParser(token_stream)
+        parser.buildParseTrees = False
+        listener = cls(token_stream)
+        parser.addParseListener(listener)
+        parser.document()
+        return listener
+
+    def child_mode(self):
+        parent = self.current
+        if parent is None:
+            return MyXMLListener.VISITED
+        parent.name = parent.ctx.blockTag.text
+        if parent.mode == MyXMLListener.VISITED and parent.name in RAW_CONTENT_TAGS:
+            return MyXMLListener.RAW
+        if parent.mode == MyXMLListener.VISITED and parent.name in CHILD_VISITING_TAGS:
+            return MyXMLListener.VISITED
+        if parent.mode == MyXMLListener.RAW:
+            return MyXMLListener.RAW
+        return MyXMLListener.SKIPPED
+
+    def enterElement(self, ctx: XMLParser.ElementContext):
+        self.current = ElementFrame(ctx, self.child_mode(), self.current)
+
+    def exitAttribute(self, ctx: XMLParser.AttributeContext):
+        # Without a parse tree, the attribute is given by its first (Name) and last (STRING) token
+        if self.current is not None:
+            # Share the strings repeated across elements, as the attributes may end up in the AST
+            self.current.attrs[sys.intern(ctx.start.text)] = sys.intern(attribute_value(ctx.stop.text))
+
+    def exitContent(self, ctx: XMLParser.ContentContext):
+        if self.current is not None:
+            self.current.content_interval = (ctx.start.tokenIndex, ctx.stop.tokenIndex)
+
+    def exitElement(self, ctx: XMLParser.ElementContext):
+        frame = self.current
+        self.current = frame.parent
+        if ctx.blockTag is None:
+            return
+        frame.name = ctx.blockTag.text
+        if frame.mode == MyXMLListener.RAW:
+            frame.parent.children.append(frame)
+        elif frame.mode == MyXMLListener.VISITED:
+            result = self.handle_element(frame)
+            # The results of the top level nodes are not needed, only their side effects
+            if frame.parent is not None and frame.parent.name != "FBD":
+                frame.parent.children.append((result, frame.name, frame.attrs))
+        # Nothing refers to the context of the element anymore
+        frame.ctx = None
+
+    def handle_element(self, frame: ElementFrame):
+        def get_value_or_none(d: dict, v, f):
+            return f(d.get(v)) if d.get(v, None) else None
+
+        name = frame.name
+        attrs = frame.attrs
+        # The children of raw content are frames, not results
+        results = [] if name in RAW_CONTENT_TAGS else [r for r, _, _ in frame.children]
+        result = None
+        if "block" == name:
+            self.elements.append(self.ppx_parse_block(attrs, results))
+        elif "inVariable" == name:
+            self.elements.append(self.ppx_parse_VarBlock(attrs, results, "in"))
+        elif "outVariable" == name:
+            self.elements.append(self.ppx_parse_VarBlock(attrs, results, "out"))
+        elif "connectionPointIn" == name:
+            result = self.ppx_parse_ConnectionPoint(frame.children, ConnectionDirection.Input)
+        elif "connectionPointOut" == name:
+            result = self.ppx_parse_ConnectionPoint(frame.children, ConnectionDirection.Output)
+        elif "expression" == name:
+            result = self.ppx_parse_expression(frame)
+        elif "FBD" == name:
+            pass
+        elif "line" == name:
+            start_x, start_y, end_x, end_y = map(
+                int,
+                (attrs["beginX"], attrs["beginY"], attrs["endX"], attrs["endY"]),
+            )
+            self.lines.append(start_x, start_y, end_x, end_y)
+            result = attrs
+        elif "addData" == name:
+            assert len(frame.children) == 1
+            result = results[0]
+        elif "data" == name:
+            result = frame.children
+        elif "connectedFormalparameter" == name:
+            result = get_value_or_none(attrs, "refLocalId", int)
+        elif "fp" == name:
+            result = int(attrs["localId"])
+        elif "relPosition" == name:
+            result = make_relative_position(int(attrs.get("x", -1)), int(attrs.get("y", -1)))
+        elif "position" == name:
+            result = make_absolute_position(int(attrs.get("x", -1)), int(attrs.get("y", -1)))
+        elif "connection" == name:
+            result = self.ppx_parse_Connection(frame.children, attrs)
+        elif "inputVariables" == name:
+            result = ParamList(ParameterType.InputVar, results)
+        elif "outputVariables" == name:
+            result = ParamList(ParameterType.OutputVar, results)
+        elif "inOutVariables" == name:
+            result = ParamList(ParameterType.InOutVar, results)
+        elif "variable" == name:
+            result = self.ppx_parse_formal_variable(attrs, results)
+        elif "comment" == name:
+            self.comments.append(self.ppx_parse_comment(attrs, results))
+        elif "content" == name:
+            result = self.ppx_parse_comment_content(frame)
+        else:
+            logging.warning(f"{frame.ctx} is not parsed - tag name:{name}")
+        return result
+
+    def ppx_parse_block(self, blockParams: dict[str, str], blockElements):
+        varBlocks = [e for e in blockElements if isinstance(e, ParamList)]
+        inVars = [e for e in varBlocks if e.varType == ParameterType.InputVar]
+        inOutVars = [e for e in varBlocks if e.varType == ParameterType.InOutVar]
+        outVars = [e for e in varBlocks if e.varType == ParameterType.OutputVar]
+        GUI_position_top_left = [e for e in blockElements if isinstance(e, GUIPosition)][0]
+        position_top_left = Point(GUI_position_top_left.x, GUI_position_top_left.y)
+        size = Point(int(blockParams["width"]), int(blockParams["height"]))
+        bounding_box = Rectangle(position_top_left, position_top_left + size)
+        result = FBD_Block(
+            FBDObjData(int(blockParams["localId"]), blockParams["typeName"], bounding_box),
+            {},
+            [inVars[0], inOutVars[0], outVars[0]],
+        )
+        self.local_id_map[int(blockParams["localId"])] = result
+        return result
+
+    def ppx_parse_VarBlock(self, outVarArgs, blockElements, direction="in"):
+        GUI_position_top_left = [e for e in blockElements if isinstance(e, GUIPosition)][0]
+        expr = [e for e in blockElements if isinstance(e, Expr)][0]
+        connection_points = [e for e in blockElements if isinstance(e, ConnectionPoint)][0]
+        localId = int(outVarArgs["localId"])
+        height, width = int(outVarArgs["height"]), int(outVarArgs["width"])
+        upper_left_point = Point(GUI_position_top_left.x, GUI_position_top_left.y)
+        lower_right_point = upper_left_point + Point(width, height)
+        blockData = FBDObjData(localId, direction + "Variable", Rectangle(upper_left_point, lower_right_point))
+        self.local_id_map[localId] = VarBlock(blockData, {}, connection_points, expr)
+        return self.local_id_map[localId]
+
+    def ppx_parse_expression(self, frame: ElementFrame):
+        exprStr = element_text(self.token_stream, frame.content_interval[0])
+        assert (exprStr is not None) and (exprStr != "")
+        return Expr(exprStr)
+
+    def ppx_parse_comment(self, attrs, comment_elements):
+        position = comment_elements[0]
+        _comment_content = comment_elements[1]
+        bounding_box = Rectangle(
+            Point(position.x, position.y),
+            Point(position.x + int(attrs["width"]), position.y + int(attrs["height"])),
+        )
+        return CommentBox(bounding_box, _comment_content)
+
+    def ppx_parse_comment_content(self, frame: ElementFrame):
+        def find_by_tag(raw_frame, tag):
+            if tag == raw_frame.name:
+                return raw_frame
+            for c in raw_frame.children:
+                found = find_by_tag(c, tag)
+                if found is not None:
+                    return found
+            return None
+
+        html_tag = frame.children[0]
+        body_node = find_by_tag(html_tag, "body")
+        p_node = body_node.children[0]
+        return self.token_stream.getText(*p_node.content_interval)
+
+    def ppx_parse_Connection(self, connection_elements, attrs):
+        if not connection_elements:
+            return Connection(
+                ConnectionData(),
+                ConnectionData(pos=None, connIndex=int(attrs["refLocalId"])),
+                formalName=attrs.get("formalParameter", None),
+            )
+
+        names = [n for _, n, _ in connection_elements]
+        foundPositionData = any("position" in n for n in names)
+        foundAdditionalData = "addData" in names
+
+        startID = None
+        if foundPositionData and not foundAdditionalData:
+            toPosition = connection_elements[0][0]
+            fromPosition = connection_elements[1][0]
+        elif foundAdditionalData and not foundPositionData:
+            toPosition = make_absolute_position(-1, -1)
+            fromPosition = make_absolute_position(-1, -1)
+            startID, _, _ = connection_elements[0][0][0]
+        else:
+            toPosition = connection_elements[1][0]
+            fromPosition = connection_elements[2][0]
+            startID, _, _ = connection_elements[0][0][0]
+        return Connection(
+            startPoint=ConnectionData(fromPosition, startID),
+            endPoint=ConnectionData(toPosition, int(attrs["refLocalId"])),
+            formalName=attrs.get("formalParameter", None),
+        )
+
+    def ppx_parse_ConnectionPoint(self, point_elements, conn_type):
+        connectionData = ConnectionData()
+        connections = []
+        for res, name, _ in point_elements:
+            if "position" in name.lower():
+                connectionData.position = res
+            if "connection" in name.lower():
+                connections.append(res)
+        return ConnectionPoint(conn_type, connections, connectionData)
+
+    def ppx_parse_formal_variable(self, attrs, variable_elements):
+        assert len(variable_elements) == 2
+        connPoint = variable_elements[0]
+        fpData = variable_elements[1][0]
+        assert "fp" == fpData[1]
+
+        return FormalParam(
+            name=attrs["formalParameter"],
+            connectionPoint=connPoint,
+            ID=fpData[0],
+            data=fpData[2],
+        )
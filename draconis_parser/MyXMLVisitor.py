@@ -10,6 +10,7 @@ from draconis_parser import ParameterType
 from draconis_parser import FBDObjData
 from Web_GUI import Point, Rectangle
 from AST.blocks import Expr, VarBlock, FBD_Block
+from AST.geometry import LineTable
 from draconis_parser import (
     ConnectionDirection,
     ConnectionData,
@@ -18,6 +19,7 @@ from draconis_parser import (
 )
 from draconis_parser import FormalParam, ParamList
 from utility_classes.position import make_absolute_position, make_relative_position
+from xml_text import attribute_value, element_text
 
 
 class MyXMLVisitor(XMLParserVisitor):
@@ -25,7 +27,7 @@ class MyXMLVisitor(XMLParserVisitor):
         self.connections = []
         self.elements = []
         self.local_id_map = {}
-        self.lines = []
+        self.lines = LineTable()
         self.comments = []
 
     @classmethod
@@ -94,7 +96,7 @@ class MyXMLVisitor(XMLParserVisitor):
         return self.local_id_map[localId]
 
     def ppx_parse_expression(self, content):
-        exprStr = self.visitChardata(content.chardata(0))
+        exprStr = element_text(content.parser.getTokenStream(), content.start.tokenIndex)
         assert (exprStr is not None) and (exprStr != "")
         return Expr(exprStr)
 
@@ -150,7 +152,7 @@ class MyXMLVisitor(XMLParserVisitor):
                     int,
                     (attrs["beginX"], attrs["beginY"], attrs["endX"], attrs["endY"]),
                 )
-                self.lines.append((Point(start_x, start_y), Point(end_x, end_y)))
+                self.lines.append(start_x, start_y, end_x, end_y)
                 return attrs
             elif "addData" == name:
                 return self.parse_addData_node(ctx)
@@ -244,7 +246,7 @@ class MyXMLVisitor(XMLParserVisitor):
     # Visit a parse tree produced by XMLParser#attribute.
     def visitAttribute(self, ctx: XMLParser.AttributeContext):
         name = str(ctx.Name())
-        value = str(ctx.STRING()).strip('"')
+        value = attribute_value(str(ctx.STRING()))
         return name, value
 
     # Visit a parse tree produced by XMLParser#chardata.
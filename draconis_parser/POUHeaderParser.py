@@ -0,0 +1,237 @@
+import logging
+import re
+import sys
+import os
+
+this_dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if this_dirname not in sys.path:
+    sys.path.insert(0, this_dirname)
+from draconis_parser import Program, ParameterType, VariableWorkSheet, VariableLine, VariableGroup
+from AST import strToValType, strToVariableType
+
+# Token kinds, mirroring the lexer rules of grammar_definition/POU.g4
+QUOTED_STRING = "QUOTED_STRING"
+DESCRIPTION = "DESCRIPTION"
+TYPE_CONSTANT = "TYPE_CONSTANT"
+INT = "INT"
+WORD = "WORD"
+FILE_EXT = "FILE_EXT"
+SYMBOL = "SYMBOL"
+EOF = "EOF"
+
+# Alternatives are ordered so that the first match is also the longest one, as ANTLR's lexer would pick
+TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<WS>[ \t\r\n]+)
+    | (?P<QUOTED_STRING>'[^']*')
+    | (?P<DESCRIPTION>\(\*.*?\*\))
+    | (?P<TYPE_CONSTANT>[A-Z]+\#[0-9]+)
+    | (?P<INT>-?[0-9]+)
+    | (?P<WORD>[a-zA-Z][a-zA-Z0-9_]*)
+    | (?P<FILE_EXT>\.[a-zA-Z0-9_]+)
+    | (?P<SYMBOL>:=|[{}(),:;])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+VAR_TYPES = ["VAR", "VAR_INPUT", "VAR_OUTPUT"]
+POU_TYPES = ["PROGRAM", "FUNCTION_BLOCK"]
+INIT_VALUE_KEYWORDS = ["SAFETRUE", "SAFEFALSE"]
+# The keywords of the elementary, safe, derived and generic types of val_Type
+TYPE_KEYWORDS = frozenset([
+    "ANALOG", "BOOL", "BYTE", "WORD", "DWORD", "LWORD", "SINT", "INT", "DINT", "LINT", "USINT", "UINT", "UDINT",
+    "ULINT", "REAL", "LREAL", "TIME", "DATE", "DT", "TOD", "STRING", "WSTRING",
+    "SAFEANALOG", "SAFEBOOL", "SAFEBYTE", "SAFEDINT", "SAFEDWORD", "SAFEINT", "SAFESINT", "SAFETIME", "SAFEUDINT",
+    "SAFEUINT", "SAFEUSINT", "SAFEWORD",
+    "ARRAY", "DERIVED", "ENUM", "SUBRANGESIGNED", "SUBRANGEUNSIGNED", "STRUCT",
+    "ANY", "ANY_DERIVED", "ANY_ELEMENTARY", "ANY_MAGNITUDE", "ANY_NUM", "ANY_REAL", "ANY_INT", "ANY_BIT",
+    "ANY_STRING", "ANY_DATE",
+])
+# Words the ANTLR lexer turns into keyword tokens, which the grammar does not accept where it expects an ID
+KEYWORDS = TYPE_KEYWORDS | frozenset(VAR_TYPES + POU_TYPES + INIT_VALUE_KEYWORDS + [
+    "CodeWorksheet", "Type", "VariableWorksheet", "GroupDefinition", "Group", "END_VAR", "Feedback", "true", "LINE",
+])
+
+
+class POUHeaderSyntaxError(ValueError):
+    pass
+
+
+def tokenize(input_varWorkSheet: str):
+    """Splits the variable worksheet into a list of (kind, text, offset) tokens, ending with EOF"""
+    tokens = []
+    position = 0
+    length = len(input_varWorkSheet)
+    while position < length:
+        match = TOKEN_PATTERN.match(input_varWorkSheet, position)
+        if match is None:
+            raise POUHeaderSyntaxError(
+                f"Unexpected character {input_varWorkSheet[position]!r} at offset {position}"
+            )
+        kind = match.lastgroup
+        if kind != "WS":
+            tokens.append((kind, match.group(), position))
+        position = match.end()
+    tokens.append((EOF, "", length))
+    return tokens
+
+
+class POUHeaderParser:
+    """
+    Single-pass recursive-descent parser for the variable worksheet of a POU.
+
+    Accepts the language of grammar_definition/POU.g4 and builds the same
+    Program, VariableWorkSheet and VariableLine objects as MyPOUVisitor,
+    without going through the ANTLR runtime.
+    Input outside of the grammar raises a POUHeaderSyntaxError.
+    """
+
+    def __init__(self, input_varWorkSheet: str):
+        self.tokens = tokenize(input_varWorkSheet)
+        self.index = 0
+
+    def peek(self, offset=0):
+        return self.tokens[self.index + offset]
+
+    def next_is(self, text, offset=0):
+        kind, token_text, _ = self.peek(offset)
+        return kind in (WORD, SYMBOL) and token_text == text
+
+    def expect(self, text=None, kind=None):
+        token_kind, token_text, offset = self.tokens[self.index]
+        if (text is not None and (token_text != text or token_kind not in (WORD, SYMBOL, QUOTED_STRING))) or (
+                kind is not None and token_kind != kind
+        ):
+            expected = text if text is not None else kind
+            raise POUHeaderSyntaxError(f"Expected {expected} at offset {offset}, found {token_text!r}")
+        self.index += 1
+        return token_text
+
+    def expect_id(self, allowed_keywords=frozenset()):
+        """An identifier, which is not a keyword of the grammar unless allowed"""
+        token_kind, token_text, offset = self.tokens[self.index]
+        if token_kind == WORD and token_text in KEYWORDS and token_text not in allowed_keywords:
+            raise POUHeaderSyntaxError(f"Expected an identifier at offset {offset}, found keyword {token_text!r}")
+        return self.expect(kind=WORD)
+
+    def expect_one_of(self, texts):
+        token_kind, token_text, offset = self.tokens[self.index]
+        if token_kind != WORD or token_text not in texts:
+            raise POUHeaderSyntaxError(f"Expected one of {texts} at offset {offset}, found {token_text!r}")
+        self.index += 1
+        return token_text
+
+    def parseSafe_program_POU(self) -> Program:
+        self.expect_one_of(POU_TYPES)
+        name = self.expect_id()
+        variableWorkSheet = self.parseVariableWorkSheet()
+        self.parseCodeWorkSheet()
+        self.expect(kind=EOF)
+
+        # For now, we set the elements separately
+        return Program(name, variableWorkSheet, [], {})
+
+    def parseVariableWorkSheet(self):
+        for text in ["{", "VariableWorksheet", ":=", "'Variables'", "}"]:
+            self.expect(text)
+        return VariableWorkSheet(list(self.parseVarGroups()))
+
+    def parseVarGroups(self):
+        res = dict()
+        groupID, _def = self.parseGroupDef()
+        res[groupID] = _def
+        while self.next_is("{") and self.next_is("GroupDefinition", 1):
+            groupID, _def = self.parseGroupDef()
+            res[groupID] = _def
+
+        grpID, listOfVars = self.parseVarDefGroup()
+        res[grpID].varLines.extend(listOfVars)
+        while not self.next_is("{"):
+            grpID, listOfVars = self.parseVarDefGroup()
+            res[grpID].varLines.extend(listOfVars)
+        return res.values()
+
+    def parseGroupDef(self):
+        for text in ["{", "GroupDefinition", "("]:
+            self.expect(text)
+        groupID = int(self.expect(kind=INT))
+        self.expect(",")
+        groupName = self.expect(kind=QUOTED_STRING)
+        self.expect(")")
+        self.expect("}")
+        return groupID, VariableGroup(groupName.strip("'").strip(), [])
+
+    def parseVarDefGroup(self):
+        paramType = strToVariableType(self.expect_one_of(VAR_TYPES))
+        for text in ["{", "Group", "("]:
+            self.expect(text)
+        groupNr = int(self.expect(kind=INT))
+        self.expect(")")
+        self.expect("}")
+        varList = []
+        while not self.next_is("END_VAR"):
+            _var = self.parseVarLine()
+            _var.paramType = paramType
+            varList.append(_var)
+        self.expect("END_VAR")
+        return groupNr, varList
+
+    def parseVarLine(self):
+        for text in ["{", "LINE", "("]:
+            self.expect(text)
+        self.expect(kind=INT)
+        self.expect(")")
+        self.expect("}")
+        varName = self.expect_id()
+        self.expect(":")
+        valueType = self.parseVal_Type()
+        initVal = None
+        if self.next_is(":="):
+            self.index += 1
+            initVal = self.parseValTypeRule()
+        isFeedback = False
+        if self.next_is("{"):
+            for text in ["{", "Feedback", "(", "true", ")", "}"]:
+                self.expect(text)
+            isFeedback = True
+        self.expect(";")
+        desc = None
+        if self.peek()[0] == DESCRIPTION:
+            desc = self.expect(kind=DESCRIPTION).lstrip("(*").rstrip("*)").strip()
+        return VariableLine(
+            varName,
+            ParameterType.UNSET,  # property is set for the whole group
+            valueType,
+            initVal,
+            desc,
+            isFeedback,
+        )
+
+    def parseVal_Type(self):
+        type_name = self.expect_id(TYPE_KEYWORDS)
+        result = strToValType(type_name)
+        if result is None:
+            logging.warning(f"Type{type_name} could not be found in lookup")
+        return result
+
+    def parseValTypeRule(self):
+        kind, text, offset = self.peek()
+        if kind in (INT, TYPE_CONSTANT) or (kind == WORD and text in INIT_VALUE_KEYWORDS):
+            self.index += 1
+            return text
+        raise POUHeaderSyntaxError(f"Unsupported initial value {text!r} at offset {offset}")
+
+    def parseCodeWorkSheet(self):
+        # The header of the code worksheet is not used, only its shape is checked
+        for text in ["{", "CodeWorksheet", ":="]:
+            self.expect(text)
+        self.expect(kind=QUOTED_STRING)
+        self.expect(",")
+        self.expect("Type")
+        self.expect(":=")
+        self.expect(kind=QUOTED_STRING)
+        self.expect("}")
+
+
+def parse_variable_worksheet(input_varWorkSheet: str) -> Program:
+    return POUHeaderParser(input_varWorkSheet).parseSafe_program_POU()
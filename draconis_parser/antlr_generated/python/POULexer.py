@@ -0,0 +1,428 @@
+# Generated from POU.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,83,798,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,2,67,7,67,2,68,7,68,2,69,7,69,2,70,7,70,2,71,7,
+        71,2,72,7,72,2,73,7,73,2,74,7,74,2,75,7,75,2,76,7,76,2,77,7,77,2,
+        78,7,78,2,79,7,79,2,80,7,80,2,81,7,81,2,82,7,82,1,0,1,0,1,0,1,0,
+        1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,
+        1,3,1,3,1,3,1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,8,
+        1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,
+        10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,11,1,11,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,14,1,14,1,
+        14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,
+        16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,
+        17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,19,1,
+        19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,22,1,22,1,
+        23,1,23,1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,25,1,
+        25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,
+        27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,
+        30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,
+        32,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,35,1,
+        35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,
+        37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,
+        39,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,
+        43,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,
+        44,1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,
+        46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,
+        47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,
+        48,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,1,50,1,
+        50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,
+        51,1,51,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,
+        53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,
+        54,1,54,1,54,1,54,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,
+        55,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,57,1,57,1,57,1,
+        57,1,57,1,57,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,59,1,59,1,
+        59,1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,
+        60,1,60,1,60,1,60,1,60,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,
+        61,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,1,
+        62,1,62,1,62,1,63,1,63,1,63,1,63,1,64,1,64,1,64,1,64,1,64,1,64,1,
+        64,1,64,1,64,1,64,1,64,1,64,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,
+        65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,
+        66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,67,1,67,1,67,1,67,1,
+        67,1,67,1,67,1,67,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,
+        69,1,69,1,69,1,69,1,69,1,69,1,69,1,69,1,70,1,70,1,70,1,70,1,70,1,
+        70,1,70,1,70,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,
+        71,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,
+        73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,
+        75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,76,4,76,740,8,76,11,
+        76,12,76,741,1,76,1,76,1,77,1,77,5,77,748,8,77,10,77,12,77,751,9,
+        77,1,77,1,77,1,78,4,78,756,8,78,11,78,12,78,757,1,78,1,78,4,78,762,
+        8,78,11,78,12,78,763,1,79,3,79,767,8,79,1,79,4,79,770,8,79,11,79,
+        12,79,771,1,80,1,80,5,80,776,8,80,10,80,12,80,779,9,80,1,81,1,81,
+        4,81,783,8,81,11,81,12,81,784,1,82,1,82,1,82,1,82,5,82,791,8,82,
+        10,82,12,82,794,9,82,1,82,1,82,1,82,2,749,792,0,83,1,1,3,2,5,3,7,
+        4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,
+        16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,
+        27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,
+        38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,
+        49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,58,
+        117,59,119,60,121,61,123,62,125,63,127,64,129,65,131,66,133,67,135,
+        68,137,69,139,70,141,71,143,72,145,73,147,74,149,75,151,76,153,77,
+        155,78,157,79,159,80,161,81,163,82,165,83,1,0,8,3,0,9,10,13,13,32,
+        32,1,0,65,90,1,0,35,35,1,0,48,57,1,0,45,45,2,0,65,90,97,122,4,0,
+        48,57,65,90,95,95,97,122,1,0,46,46,806,0,1,1,0,0,0,0,3,1,0,0,0,0,
+        5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,
+        1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,
+        1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,
+        1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,
+        1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,
+        1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,
+        1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,
+        1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,
+        1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,
+        1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,
+        105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,
+        0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,0,123,
+        1,0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,
+        0,133,1,0,0,0,0,135,1,0,0,0,0,137,1,0,0,0,0,139,1,0,0,0,0,141,1,
+        0,0,0,0,143,1,0,0,0,0,145,1,0,0,0,0,147,1,0,0,0,0,149,1,0,0,0,0,
+        151,1,0,0,0,0,153,1,0,0,0,0,155,1,0,0,0,0,157,1,0,0,0,0,159,1,0,
+        0,0,0,161,1,0,0,0,0,163,1,0,0,0,0,165,1,0,0,0,1,167,1,0,0,0,3,175,
+        1,0,0,0,5,190,1,0,0,0,7,192,1,0,0,0,9,206,1,0,0,0,11,209,1,0,0,0,
+        13,211,1,0,0,0,15,216,1,0,0,0,17,218,1,0,0,0,19,220,1,0,0,0,21,238,
+        1,0,0,0,23,250,1,0,0,0,25,266,1,0,0,0,27,268,1,0,0,0,29,270,1,0,
+        0,0,31,276,1,0,0,0,33,284,1,0,0,0,35,293,1,0,0,0,37,303,1,0,0,0,
+        39,312,1,0,0,0,41,317,1,0,0,0,43,322,1,0,0,0,45,324,1,0,0,0,47,326,
+        1,0,0,0,49,333,1,0,0,0,51,338,1,0,0,0,53,343,1,0,0,0,55,348,1,0,
+        0,0,57,354,1,0,0,0,59,360,1,0,0,0,61,365,1,0,0,0,63,369,1,0,0,0,
+        65,374,1,0,0,0,67,379,1,0,0,0,69,385,1,0,0,0,71,390,1,0,0,0,73,396,
+        1,0,0,0,75,402,1,0,0,0,77,407,1,0,0,0,79,413,1,0,0,0,81,418,1,0,
+        0,0,83,423,1,0,0,0,85,426,1,0,0,0,87,430,1,0,0,0,89,437,1,0,0,0,
+        91,445,1,0,0,0,93,456,1,0,0,0,95,465,1,0,0,0,97,474,1,0,0,0,99,483,
+        1,0,0,0,101,493,1,0,0,0,103,501,1,0,0,0,105,510,1,0,0,0,107,519,
+        1,0,0,0,109,529,1,0,0,0,111,538,1,0,0,0,113,548,1,0,0,0,115,557,
+        1,0,0,0,117,563,1,0,0,0,119,571,1,0,0,0,121,576,1,0,0,0,123,591,
+        1,0,0,0,125,608,1,0,0,0,127,615,1,0,0,0,129,619,1,0,0,0,131,631,
+        1,0,0,0,133,646,1,0,0,0,135,660,1,0,0,0,137,668,1,0,0,0,139,677,
+        1,0,0,0,141,685,1,0,0,0,143,693,1,0,0,0,145,704,1,0,0,0,147,713,
+        1,0,0,0,149,717,1,0,0,0,151,727,1,0,0,0,153,739,1,0,0,0,155,745,
+        1,0,0,0,157,755,1,0,0,0,159,766,1,0,0,0,161,773,1,0,0,0,163,780,
+        1,0,0,0,165,786,1,0,0,0,167,168,5,80,0,0,168,169,5,82,0,0,169,170,
+        5,79,0,0,170,171,5,71,0,0,171,172,5,82,0,0,172,173,5,65,0,0,173,
+        174,5,77,0,0,174,2,1,0,0,0,175,176,5,70,0,0,176,177,5,85,0,0,177,
+        178,5,78,0,0,178,179,5,67,0,0,179,180,5,84,0,0,180,181,5,73,0,0,
+        181,182,5,79,0,0,182,183,5,78,0,0,183,184,5,95,0,0,184,185,5,66,
+        0,0,185,186,5,76,0,0,186,187,5,79,0,0,187,188,5,67,0,0,188,189,5,
+        75,0,0,189,4,1,0,0,0,190,191,5,123,0,0,191,6,1,0,0,0,192,193,5,67,
+        0,0,193,194,5,111,0,0,194,195,5,100,0,0,195,196,5,101,0,0,196,197,
+        5,87,0,0,197,198,5,111,0,0,198,199,5,114,0,0,199,200,5,107,0,0,200,
+        201,5,115,0,0,201,202,5,104,0,0,202,203,5,101,0,0,203,204,5,101,
+        0,0,204,205,5,116,0,0,205,8,1,0,0,0,206,207,5,58,0,0,207,208,5,61,
+        0,0,208,10,1,0,0,0,209,210,5,44,0,0,210,12,1,0,0,0,211,212,5,84,
+        0,0,212,213,5,121,0,0,213,214,5,112,0,0,214,215,5,101,0,0,215,14,
+        1,0,0,0,216,217,5,39,0,0,217,16,1,0,0,0,218,219,5,125,0,0,219,18,
+        1,0,0,0,220,221,5,86,0,0,221,222,5,97,0,0,222,223,5,114,0,0,223,
+        224,5,105,0,0,224,225,5,97,0,0,225,226,5,98,0,0,226,227,5,108,0,
+        0,227,228,5,101,0,0,228,229,5,87,0,0,229,230,5,111,0,0,230,231,5,
+        114,0,0,231,232,5,107,0,0,232,233,5,115,0,0,233,234,5,104,0,0,234,
+        235,5,101,0,0,235,236,5,101,0,0,236,237,5,116,0,0,237,20,1,0,0,0,
+        238,239,5,39,0,0,239,240,5,86,0,0,240,241,5,97,0,0,241,242,5,114,
+        0,0,242,243,5,105,0,0,243,244,5,97,0,0,244,245,5,98,0,0,245,246,
+        5,108,0,0,246,247,5,101,0,0,247,248,5,115,0,0,248,249,5,39,0,0,249,
+        22,1,0,0,0,250,251,5,71,0,0,251,252,5,114,0,0,252,253,5,111,0,0,
+        253,254,5,117,0,0,254,255,5,112,0,0,255,256,5,68,0,0,256,257,5,101,
+        0,0,257,258,5,102,0,0,258,259,5,105,0,0,259,260,5,110,0,0,260,261,
+        5,105,0,0,261,262,5,116,0,0,262,263,5,105,0,0,263,264,5,111,0,0,
+        264,265,5,110,0,0,265,24,1,0,0,0,266,267,5,40,0,0,267,26,1,0,0,0,
+        268,269,5,41,0,0,269,28,1,0,0,0,270,271,5,71,0,0,271,272,5,114,0,
+        0,272,273,5,111,0,0,273,274,5,117,0,0,274,275,5,112,0,0,275,30,1,
+        0,0,0,276,277,5,69,0,0,277,278,5,78,0,0,278,279,5,68,0,0,279,280,
+        5,95,0,0,280,281,5,86,0,0,281,282,5,65,0,0,282,283,5,82,0,0,283,
+        32,1,0,0,0,284,285,5,83,0,0,285,286,5,65,0,0,286,287,5,70,0,0,287,
+        288,5,69,0,0,288,289,5,84,0,0,289,290,5,82,0,0,290,291,5,85,0,0,
+        291,292,5,69,0,0,292,34,1,0,0,0,293,294,5,83,0,0,294,295,5,65,0,
+        0,295,296,5,70,0,0,296,297,5,69,0,0,297,298,5,70,0,0,298,299,5,65,
+        0,0,299,300,5,76,0,0,300,301,5,83,0,0,301,302,5,69,0,0,302,36,1,
+        0,0,0,303,304,5,70,0,0,304,305,5,101,0,0,305,306,5,101,0,0,306,307,
+        5,100,0,0,307,308,5,98,0,0,308,309,5,97,0,0,309,310,5,99,0,0,310,
+        311,5,107,0,0,311,38,1,0,0,0,312,313,5,116,0,0,313,314,5,114,0,0,
+        314,315,5,117,0,0,315,316,5,101,0,0,316,40,1,0,0,0,317,318,5,76,
+        0,0,318,319,5,73,0,0,319,320,5,78,0,0,320,321,5,69,0,0,321,42,1,
+        0,0,0,322,323,5,58,0,0,323,44,1,0,0,0,324,325,5,59,0,0,325,46,1,
+        0,0,0,326,327,5,65,0,0,327,328,5,78,0,0,328,329,5,65,0,0,329,330,
+        5,76,0,0,330,331,5,79,0,0,331,332,5,71,0,0,332,48,1,0,0,0,333,334,
+        5,66,0,0,334,335,5,79,0,0,335,336,5,79,0,0,336,337,5,76,0,0,337,
+        50,1,0,0,0,338,339,5,66,0,0,339,340,5,89,0,0,340,341,5,84,0,0,341,
+        342,5,69,0,0,342,52,1,0,0,0,343,344,5,87,0,0,344,345,5,79,0,0,345,
+        346,5,82,0,0,346,347,5,68,0,0,347,54,1,0,0,0,348,349,5,68,0,0,349,
+        350,5,87,0,0,350,351,5,79,0,0,351,352,5,82,0,0,352,353,5,68,0,0,
+        353,56,1,0,0,0,354,355,5,76,0,0,355,356,5,87,0,0,356,357,5,79,0,
+        0,357,358,5,82,0,0,358,359,5,68,0,0,359,58,1,0,0,0,360,361,5,83,
+        0,0,361,362,5,73,0,0,362,363,5,78,0,0,363,364,5,84,0,0,364,60,1,
+        0,0,0,365,366,5,73,0,0,366,367,5,78,0,0,367,368,5,84,0,0,368,62,
+        1,0,0,0,369,370,5,68,0,0,370,371,5,73,0,0,371,372,5,78,0,0,372,373,
+        5,84,0,0,373,64,1,0,0,0,374,375,5,76,0,0,375,376,5,73,0,0,376,377,
+        5,78,0,0,377,378,5,84,0,0,378,66,1,0,0,0,379,380,5,85,0,0,380,381,
+        5,83,0,0,381,382,5,73,0,0,382,383,5,78,0,0,383,384,5,84,0,0,384,
+        68,1,0,0,0,385,386,5,85,0,0,386,387,5,73,0,0,387,388,5,78,0,0,388,
+        389,5,84,0,0,389,70,1,0,0,0,390,391,5,85,0,0,391,392,5,68,0,0,392,
+        393,5,73,0,0,393,394,5,78,0,0,394,395,5,84,0,0,395,72,1,0,0,0,396,
+        397,5,85,0,0,397,398,5,76,0,0,398,399,5,73,0,0,399,400,5,78,0,0,
+        400,401,5,84,0,0,401,74,1,0,0,0,402,403,5,82,0,0,403,404,5,69,0,
+        0,404,405,5,65,0,0,405,406,5,76,0,0,406,76,1,0,0,0,407,408,5,76,
+        0,0,408,409,5,82,0,0,409,410,5,69,0,0,410,411,5,65,0,0,411,412,5,
+        76,0,0,412,78,1,0,0,0,413,414,5,84,0,0,414,415,5,73,0,0,415,416,
+        5,77,0,0,416,417,5,69,0,0,417,80,1,0,0,0,418,419,5,68,0,0,419,420,
+        5,65,0,0,420,421,5,84,0,0,421,422,5,69,0,0,422,82,1,0,0,0,423,424,
+        5,68,0,0,424,425,5,84,0,0,425,84,1,0,0,0,426,427,5,84,0,0,427,428,
+        5,79,0,0,428,429,5,68,0,0,429,86,1,0,0,0,430,431,5,83,0,0,431,432,
+        5,84,0,0,432,433,5,82,0,0,433,434,5,73,0,0,434,435,5,78,0,0,435,
+        436,5,71,0,0,436,88,1,0,0,0,437,438,5,87,0,0,438,439,5,83,0,0,439,
+        440,5,84,0,0,440,441,5,82,0,0,441,442,5,73,0,0,442,443,5,78,0,0,
+        443,444,5,71,0,0,444,90,1,0,0,0,445,446,5,83,0,0,446,447,5,65,0,
+        0,447,448,5,70,0,0,448,449,5,69,0,0,449,450,5,65,0,0,450,451,5,78,
+        0,0,451,452,5,65,0,0,452,453,5,76,0,0,453,454,5,79,0,0,454,455,5,
+        71,0,0,455,92,1,0,0,0,456,457,5,83,0,0,457,458,5,65,0,0,458,459,
+        5,70,0,0,459,460,5,69,0,0,460,461,5,66,0,0,461,462,5,79,0,0,462,
+        463,5,79,0,0,463,464,5,76,0,0,464,94,1,0,0,0,465,466,5,83,0,0,466,
+        467,5,65,0,0,467,468,5,70,0,0,468,469,5,69,0,0,469,470,5,66,0,0,
+        470,471,5,89,0,0,471,472,5,84,0,0,472,473,5,69,0,0,473,96,1,0,0,
+        0,474,475,5,83,0,0,475,476,5,65,0,0,476,477,5,70,0,0,477,478,5,69,
+        0,0,478,479,5,68,0,0,479,480,5,73,0,0,480,481,5,78,0,0,481,482,5,
+        84,0,0,482,98,1,0,0,0,483,484,5,83,0,0,484,485,5,65,0,0,485,486,
+        5,70,0,0,486,487,5,69,0,0,487,488,5,68,0,0,488,489,5,87,0,0,489,
+        490,5,79,0,0,490,491,5,82,0,0,491,492,5,68,0,0,492,100,1,0,0,0,493,
+        494,5,83,0,0,494,495,5,65,0,0,495,496,5,70,0,0,496,497,5,69,0,0,
+        497,498,5,73,0,0,498,499,5,78,0,0,499,500,5,84,0,0,500,102,1,0,0,
+        0,501,502,5,83,0,0,502,503,5,65,0,0,503,504,5,70,0,0,504,505,5,69,
+        0,0,505,506,5,83,0,0,506,507,5,73,0,0,507,508,5,78,0,0,508,509,5,
+        84,0,0,509,104,1,0,0,0,510,511,5,83,0,0,511,512,5,65,0,0,512,513,
+        5,70,0,0,513,514,5,69,0,0,514,515,5,84,0,0,515,516,5,73,0,0,516,
+        517,5,77,0,0,517,518,5,69,0,0,518,106,1,0,0,0,519,520,5,83,0,0,520,
+        521,5,65,0,0,521,522,5,70,0,0,522,523,5,69,0,0,523,524,5,85,0,0,
+        524,525,5,68,0,0,525,526,5,73,0,0,526,527,5,78,0,0,527,528,5,84,
+        0,0,528,108,1,0,0,0,529,530,5,83,0,0,530,531,5,65,0,0,531,532,5,
+        70,0,0,532,533,5,69,0,0,533,534,5,85,0,0,534,535,5,73,0,0,535,536,
+        5,78,0,0,536,537,5,84,0,0,537,110,1,0,0,0,538,539,5,83,0,0,539,540,
+        5,65,0,0,540,541,5,70,0,0,541,542,5,69,0,0,542,543,5,85,0,0,543,
+        544,5,83,0,0,544,545,5,73,0,0,545,546,5,78,0,0,546,547,5,84,0,0,
+        547,112,1,0,0,0,548,549,5,83,0,0,549,550,5,65,0,0,550,551,5,70,0,
+        0,551,552,5,69,0,0,552,553,5,87,0,0,553,554,5,79,0,0,554,555,5,82,
+        0,0,555,556,5,68,0,0,556,114,1,0,0,0,557,558,5,65,0,0,558,559,5,
+        82,0,0,559,560,5,82,0,0,560,561,5,65,0,0,561,562,5,89,0,0,562,116,
+        1,0,0,0,563,564,5,68,0,0,564,565,5,69,0,0,565,566,5,82,0,0,566,567,
+        5,73,0,0,567,568,5,86,0,0,568,569,5,69,0,0,569,570,5,68,0,0,570,
+        118,1,0,0,0,571,572,5,69,0,0,572,573,5,78,0,0,573,574,5,85,0,0,574,
+        575,5,77,0,0,575,120,1,0,0,0,576,577,5,83,0,0,577,578,5,85,0,0,578,
+        579,5,66,0,0,579,580,5,82,0,0,580,581,5,65,0,0,581,582,5,78,0,0,
+        582,583,5,71,0,0,583,584,5,69,0,0,584,585,5,83,0,0,585,586,5,73,
+        0,0,586,587,5,71,0,0,587,588,5,78,0,0,588,589,5,69,0,0,589,590,5,
+        68,0,0,590,122,1,0,0,0,591,592,5,83,0,0,592,593,5,85,0,0,593,594,
+        5,66,0,0,594,595,5,82,0,0,595,596,5,65,0,0,596,597,5,78,0,0,597,
+        598,5,71,0,0,598,599,5,69,0,0,599,600,5,85,0,0,600,601,5,78,0,0,
+        601,602,5,83,0,0,602,603,5,73,0,0,603,604,5,71,0,0,604,605,5,78,
+        0,0,605,606,5,69,0,0,606,607,5,68,0,0,607,124,1,0,0,0,608,609,5,
+        83,0,0,609,610,5,84,0,0,610,611,5,82,0,0,611,612,5,85,0,0,612,613,
+        5,67,0,0,613,614,5,84,0,0,614,126,1,0,0,0,615,616,5,65,0,0,616,617,
+        5,78,0,0,617,618,5,89,0,0,618,128,1,0,0,0,619,620,5,65,0,0,620,621,
+        5,78,0,0,621,622,5,89,0,0,622,623,5,95,0,0,623,624,5,68,0,0,624,
+        625,5,69,0,0,625,626,5,82,0,0,626,627,5,73,0,0,627,628,5,86,0,0,
+        628,629,5,69,0,0,629,630,5,68,0,0,630,130,1,0,0,0,631,632,5,65,0,
+        0,632,633,5,78,0,0,633,634,5,89,0,0,634,635,5,95,0,0,635,636,5,69,
+        0,0,636,637,5,76,0,0,637,638,5,69,0,0,638,639,5,77,0,0,639,640,5,
+        69,0,0,640,641,5,78,0,0,641,642,5,84,0,0,642,643,5,65,0,0,643,644,
+        5,82,0,0,644,645,5,89,0,0,645,132,1,0,0,0,646,647,5,65,0,0,647,648,
+        5,78,0,0,648,649,5,89,0,0,649,650,5,95,0,0,650,651,5,77,0,0,651,
+        652,5,65,0,0,652,653,5,71,0,0,653,654,5,78,0,0,654,655,5,73,0,0,
+        655,656,5,84,0,0,656,657,5,85,0,0,657,658,5,68,0,0,658,659,5,69,
+        0,0,659,134,1,0,0,0,660,661,5,65,0,0,661,662,5,78,0,0,662,663,5,
+        89,0,0,663,664,5,95,0,0,664,665,5,78,0,0,665,666,5,85,0,0,666,667,
+        5,77,0,0,667,136,1,0,0,0,668,669,5,65,0,0,669,670,5,78,0,0,670,671,
+        5,89,0,0,671,672,5,95,0,0,672,673,5,82,0,0,673,674,5,69,0,0,674,
+        675,5,65,0,0,675,676,5,76,0,0,676,138,1,0,0,0,677,678,5,65,0,0,678,
+        679,5,78,0,0,679,680,5,89,0,0,680,681,5,95,0,0,681,682,5,73,0,0,
+        682,683,5,78,0,0,683,684,5,84,0,0,684,140,1,0,0,0,685,686,5,65,0,
+        0,686,687,5,78,0,0,687,688,5,89,0,0,688,689,5,95,0,0,689,690,5,66,
+        0,0,690,691,5,73,0,0,691,692,5,84,0,0,692,142,1,0,0,0,693,694,5,
+        65,0,0,694,695,5,78,0,0,695,696,5,89,0,0,696,697,5,95,0,0,697,698,
+        5,83,0,0,698,699,5,84,0,0,699,700,5,82,0,0,700,701,5,73,0,0,701,
+        702,5,78,0,0,702,703,5,71,0,0,703,144,1,0,0,0,704,705,5,65,0,0,705,
+        706,5,78,0,0,706,707,5,89,0,0,707,708,5,95,0,0,708,709,5,68,0,0,
+        709,710,5,65,0,0,710,711,5,84,0,0,711,712,5,69,0,0,712,146,1,0,0,
+        0,713,714,5,86,0,0,714,715,5,65,0,0,715,716,5,82,0,0,716,148,1,0,
+        0,0,717,718,5,86,0,0,718,719,5,65,0,0,719,720,5,82,0,0,720,721,5,
+        95,0,0,721,722,5,73,0,0,722,723,5,78,0,0,723,724,5,80,0,0,724,725,
+        5,85,0,0,725,726,5,84,0,0,726,150,1,0,0,0,727,728,5,86,0,0,728,729,
+        5,65,0,0,729,730,5,82,0,0,730,731,5,95,0,0,731,732,5,79,0,0,732,
+        733,5,85,0,0,733,734,5,84,0,0,734,735,5,80,0,0,735,736,5,85,0,0,
+        736,737,5,84,0,0,737,152,1,0,0,0,738,740,7,0,0,0,739,738,1,0,0,0,
+        740,741,1,0,0,0,741,739,1,0,0,0,741,742,1,0,0,0,742,743,1,0,0,0,
+        743,744,6,76,0,0,744,154,1,0,0,0,745,749,5,39,0,0,746,748,9,0,0,
+        0,747,746,1,0,0,0,748,751,1,0,0,0,749,750,1,0,0,0,749,747,1,0,0,
+        0,750,752,1,0,0,0,751,749,1,0,0,0,752,753,5,39,0,0,753,156,1,0,0,
+        0,754,756,7,1,0,0,755,754,1,0,0,0,756,757,1,0,0,0,757,755,1,0,0,
+        0,757,758,1,0,0,0,758,759,1,0,0,0,759,761,7,2,0,0,760,762,7,3,0,
+        0,761,760,1,0,0,0,762,763,1,0,0,0,763,761,1,0,0,0,763,764,1,0,0,
+        0,764,158,1,0,0,0,765,767,7,4,0,0,766,765,1,0,0,0,766,767,1,0,0,
+        0,767,769,1,0,0,0,768,770,7,3,0,0,769,768,1,0,0,0,770,771,1,0,0,
+        0,771,769,1,0,0,0,771,772,1,0,0,0,772,160,1,0,0,0,773,777,7,5,0,
+        0,774,776,7,6,0,0,775,774,1,0,0,0,776,779,1,0,0,0,777,775,1,0,0,
+        0,777,778,1,0,0,0,778,162,1,0,0,0,779,777,1,0,0,0,780,782,7,7,0,
+        0,781,783,7,6,0,0,782,781,1,0,0,0,783,784,1,0,0,0,784,782,1,0,0,
+        0,784,785,1,0,0,0,785,164,1,0,0,0,786,787,5,40,0,0,787,788,5,42,
+        0,0,788,792,1,0,0,0,789,791,9,0,0,0,790,789,1,0,0,0,791,794,1,0,
+        0,0,792,793,1,0,0,0,792,790,1,0,0,0,793,795,1,0,0,0,794,792,1,0,
+        0,0,795,796,5,42,0,0,796,797,5,41,0,0,797,166,1,0,0,0,10,0,741,749,
+        757,763,766,771,777,784,792,1,6,0,0
+    ]
+
+class POULexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    T__1 = 2
+    T__2 = 3
+    T__3 = 4
+    T__4 = 5
+    T__5 = 6
+    T__6 = 7
+    T__7 = 8
+    T__8 = 9
+    T__9 = 10
+    T__10 = 11
+    T__11 = 12
+    T__12 = 13
+    T__13 = 14
+    T__14 = 15
+    T__15 = 16
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    T__22 = 23
+    T__23 = 24
+    T__24 = 25
+    T__25 = 26
+    T__26 = 27
+    T__27 = 28
+    T__28 = 29
+    T__29 = 30
+    T__30 = 31
+    T__31 = 32
+    T__32 = 33
+    T__33 = 34
+    T__34 = 35
+    T__35 = 36
+    T__36 = 37
+    T__37 = 38
+    T__38 = 39
+    T__39 = 40
+    T__40 = 41
+    T__41 = 42
+    T__42 = 43
+    T__43 = 44
+    T__44 = 45
+    T__45 = 46
+    T__46 = 47
+    T__47 = 48
+    T__48 = 49
+    T__49 = 50
+    T__50 = 51
+    T__51 = 52
+    T__52 = 53
+    T__53 = 54
+    T__54 = 55
+    T__55 = 56
+    T__56 = 57
+    T__57 = 58
+    T__58 = 59
+    T__59 = 60
+    T__60 = 61
+    T__61 = 62
+    T__62 = 63
+    T__63 = 64
+    T__64 = 65
+    T__65 = 66
+    T__66 = 67
+    T__67 = 68
+    T__68 = 69
+    T__69 = 70
+    T__70 = 71
+    T__71 = 72
+    T__72 = 73
+    T__73 = 74
+    T__74 = 75
+    T__75 = 76
+    WS = 77
+    QUOTED_STRING = 78
+    TYPE_CONSTANT = 79
+    INT = 80
+    ID = 81
+    FILE_EXT = 82
+    DESCRIPTION = 83
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'PROGRAM'", "'FUNCTION_BLOCK'", "'{'", "'CodeWorksheet'", "':='", 
+            "','", "'Type'", "'''", "'}'", "'VariableWorksheet'", "''Variables''", 
+            "'GroupDefinition'", "'('", "')'", "'Group'", "'END_VAR'", "'SAFETRUE'", 
+            "'SAFEFALSE'", "'Feedback'", "'true'", "'LINE'", "':'", "';'", 
+            "'ANALOG'", "'BOOL'", "'BYTE'", "'WORD'", "'DWORD'", "'LWORD'", 
+            "'SINT'", "'INT'", "'DINT'", "'LINT'", "'USINT'", "'UINT'", 
+            "'UDINT'", "'ULINT'", "'REAL'", "'LREAL'", "'TIME'", "'DATE'", 
+            "'DT'", "'TOD'", "'STRING'", "'WSTRING'", "'SAFEANALOG'", "'SAFEBOOL'", 
+            "'SAFEBYTE'", "'SAFEDINT'", "'SAFEDWORD'", "'SAFEINT'", "'SAFESINT'", 
+            "'SAFETIME'", "'SAFEUDINT'", "'SAFEUINT'", "'SAFEUSINT'", "'SAFEWORD'", 
+            "'ARRAY'", "'DERIVED'", "'ENUM'", "'SUBRANGESIGNED'", "'SUBRANGEUNSIGNED'", 
+            "'STRUCT'", "'ANY'", "'ANY_DERIVED'", "'ANY_ELEMENTARY'", "'ANY_MAGNITUDE'", 
+            "'ANY_NUM'", "'ANY_REAL'", "'ANY_INT'", "'ANY_BIT'", "'ANY_STRING'", 
+            "'ANY_DATE'", "'VAR'", "'VAR_INPUT'", "'VAR_OUTPUT'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "WS", "QUOTED_STRING", "TYPE_CONSTANT", "INT", "ID", "FILE_EXT", 
+            "DESCRIPTION" ]
+
+    ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
+                  "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
+                  "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
+                  "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
+                  "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
+                  "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
+                  "T__50", "T__51", "T__52", "T__53", "T__54", "T__55", 
+                  "T__56", "T__57", "T__58", "T__59", "T__60", "T__61", 
+                  "T__62", "T__63", "T__64", "T__65", "T__66", "T__67", 
+                  "T__68", "T__69", "T__70", "T__71", "T__72", "T__73", 
+                  "T__74", "T__75", "WS", "QUOTED_STRING", "TYPE_CONSTANT", 
+                  "INT", "ID", "FILE_EXT", "DESCRIPTION" ]
+
+    grammarFileName = "POU.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
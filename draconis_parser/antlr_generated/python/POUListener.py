@@ -0,0 +1,174 @@
+# Generated from POU.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .POUParser import POUParser
+else:
+    from POUParser import POUParser
+
+# This class defines a complete listener for a parse tree produced by POUParser.
+class POUListener(ParseTreeListener):
+
+    # Enter a parse tree produced by POUParser#safe_program_POU.
+    def enterSafe_program_POU(self, ctx:POUParser.Safe_program_POUContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#safe_program_POU.
+    def exitSafe_program_POU(self, ctx:POUParser.Safe_program_POUContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#pou_type.
+    def enterPou_type(self, ctx:POUParser.Pou_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#pou_type.
+    def exitPou_type(self, ctx:POUParser.Pou_typeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#codeWorkSheet.
+    def enterCodeWorkSheet(self, ctx:POUParser.CodeWorkSheetContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#codeWorkSheet.
+    def exitCodeWorkSheet(self, ctx:POUParser.CodeWorkSheetContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#variableWorkSheet.
+    def enterVariableWorkSheet(self, ctx:POUParser.VariableWorkSheetContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#variableWorkSheet.
+    def exitVariableWorkSheet(self, ctx:POUParser.VariableWorkSheetContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#varGroups.
+    def enterVarGroups(self, ctx:POUParser.VarGroupsContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#varGroups.
+    def exitVarGroups(self, ctx:POUParser.VarGroupsContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#groupDefs.
+    def enterGroupDefs(self, ctx:POUParser.GroupDefsContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#groupDefs.
+    def exitGroupDefs(self, ctx:POUParser.GroupDefsContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#groupDef.
+    def enterGroupDef(self, ctx:POUParser.GroupDefContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#groupDef.
+    def exitGroupDef(self, ctx:POUParser.GroupDefContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#varDefGroups.
+    def enterVarDefGroups(self, ctx:POUParser.VarDefGroupsContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#varDefGroups.
+    def exitVarDefGroups(self, ctx:POUParser.VarDefGroupsContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#varDefGroup.
+    def enterVarDefGroup(self, ctx:POUParser.VarDefGroupContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#varDefGroup.
+    def exitVarDefGroup(self, ctx:POUParser.VarDefGroupContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#valTypeRule.
+    def enterValTypeRule(self, ctx:POUParser.ValTypeRuleContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#valTypeRule.
+    def exitValTypeRule(self, ctx:POUParser.ValTypeRuleContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#feedbackRule.
+    def enterFeedbackRule(self, ctx:POUParser.FeedbackRuleContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#feedbackRule.
+    def exitFeedbackRule(self, ctx:POUParser.FeedbackRuleContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#varLine.
+    def enterVarLine(self, ctx:POUParser.VarLineContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#varLine.
+    def exitVarLine(self, ctx:POUParser.VarLineContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#val_Type.
+    def enterVal_Type(self, ctx:POUParser.Val_TypeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#val_Type.
+    def exitVal_Type(self, ctx:POUParser.Val_TypeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#elementary_type.
+    def enterElementary_type(self, ctx:POUParser.Elementary_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#elementary_type.
+    def exitElementary_type(self, ctx:POUParser.Elementary_typeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#safe_type.
+    def enterSafe_type(self, ctx:POUParser.Safe_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#safe_type.
+    def exitSafe_type(self, ctx:POUParser.Safe_typeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#derived_type.
+    def enterDerived_type(self, ctx:POUParser.Derived_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#derived_type.
+    def exitDerived_type(self, ctx:POUParser.Derived_typeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#generic_type.
+    def enterGeneric_type(self, ctx:POUParser.Generic_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#generic_type.
+    def exitGeneric_type(self, ctx:POUParser.Generic_typeContext):
+        pass
+
+
+    # Enter a parse tree produced by POUParser#var_type.
+    def enterVar_type(self, ctx:POUParser.Var_typeContext):
+        pass
+
+    # Exit a parse tree produced by POUParser#var_type.
+    def exitVar_type(self, ctx:POUParser.Var_typeContext):
+        pass
+
+
+
+del POUParser
\ No newline at end of file
@@ -1,11 +1,17 @@
 import argparse
+import contextlib
+import functools
 import glob
 import logging
+import multiprocessing
 import os.path
-import pathlib
 import re
+import signal
 
 from helper_functions import parse_pou_file
+from program_cache import ProgramCache
+
+REPORT_SEPARATOR = "\n\n\n"
 
 argparser = argparse.ArgumentParser(
     description="Utility function for creating reports from all files matching a given pattern")
@@ -15,35 +21,100 @@ argparser.add_argument("--output-report-path", required=True)
 argparser.add_argument("--dry-run", required=False, action="store_true")
 argparser.add_argument("--ignore-files", required=False, default=[], nargs="+", metavar="IgnoreMe",
                        help="File name patterns to ignore")
+argparser.add_argument("--program-cache-dir", required=False, default=None,
+                       help="Directory for caching parsed programs between runs. Unchanged files are not re-parsed")
+argparser.add_argument("--jobs", required=False, default=1, type=int,
+                       help="Number of worker processes analysing files in parallel")
+argparser.add_argument("--timeout", required=False, default=None, type=float,
+                       help="Maximum number of seconds spent on a single file. Files exceeding it are skipped")
 
 log = logging.Logger("batch_logger")
 log.setLevel(logging.INFO)
 
 
-def parse_or_except(file_to_parse):
+class FileTimeoutError(BaseException):
+    """
+    Raised by the timer of time_limit. Not an Exception, so that broad exception handlers running when the timer
+    fires, e.g. while loading a program from the cache, do not swallow it
+    """
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """Raises FileTimeoutError in the current (main) thread, if the body runs for longer than the given seconds"""
+    if seconds is None:
+        yield
+        return
+    if not hasattr(signal, "SIGALRM"):
+        log.warning("Timeouts are not supported on this platform, running without a time limit")
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise FileTimeoutError(f"Analysis did not finish within {seconds} seconds")
+
+    previous_handler = signal.signal(signal.SIGALRM, on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
     try:
-        program = parse_pou_file(file_to_parse)
-        report = program.report_as_text()
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def parse_or_except(file_to_parse, cache=None, timeout=None):
+    try:
+        with time_limit(timeout):
+            program = parse_pou_file(file_to_parse, cache=cache)
+            report = program.report_as_text()
         return report
 
-    except Exception as e:
+    except (Exception, FileTimeoutError) as e:
         log.error(f"Failure during parse process of {file_to_parse}. {e}")
         return None
 
 
+def analyse_files(files_to_process, jobs=1, cache=None, timeout=None):
+    """
+    Yields the report of each file, or None if its analysis failed, in the order of the given files.
+    With more than one job, files are analysed in worker processes and reports are yielded as soon as
+    all reports before them are done.
+    """
+    analyse = functools.partial(parse_or_except, cache=cache, timeout=timeout)
+    if jobs <= 1:
+        yield from map(analyse, files_to_process)
+        return
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap(analyse, files_to_process, chunksize=1)
+
+
+def write_reports(reports, output_report_path):
+    """Streams the reports to the output file as they arrive, skipping failed analyses"""
+    with open(output_report_path, "w", encoding="utf8") as output_file:
+        is_first = True
+        for report in reports:
+            if report is None:
+                continue
+            if not is_first:
+                output_file.write(REPORT_SEPARATOR)
+            output_file.write(report)
+            output_file.flush()
+            is_first = False
+
+
 def main():
     args = argparser.parse_args()
-    files_to_process = glob.glob(args.base_path + "/" + args.file_match_glob, recursive=True)
+    # Sorted, so that the report order does not depend on the file system
+    files_to_process = sorted(glob.glob(args.base_path + "/" + args.file_match_glob, recursive=True))
     for ignore_pattern in args.ignore_files:
         files_to_process = [f for f in files_to_process if re.match(ignore_pattern, os.path.basename(f)) == None]
     if args.dry_run:
         print("Dry run mode - The following files would be analysed:")
         print("\n".join(files_to_process))
     else:
-        results = [parse_or_except(f) for f in files_to_process]
-        results_filtered = [r for r in results if r is not None]
-
-        pathlib.Path(args.output_report_path).write_text("\n\n\n".join(results_filtered), encoding="utf8")
+        cache = ProgramCache(args.program_cache_dir) if args.program_cache_dir else None
+        reports = analyse_files(files_to_process, args.jobs, cache, args.timeout)
+        write_reports(reports, args.output_report_path)
 
 
 if __name__ == "__main__":
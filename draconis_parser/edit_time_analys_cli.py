@@ -1,41 +1,226 @@
 import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
 
 import watchdog.events
 import watchdog.observers
 import time
-from helper_functions import parse_pou_file, change_pou_description
+from helper_functions import (
+    CODE_PARSER_ANTLR_LISTENER,
+    change_pou_description,
+    clean_pou_string,
+    get_worksheets_from_input,
+    parse_code_worksheet,
+    parse_variable_worksheet,
+)
 from renderer import generate_image_of_program
+from draconis_parser import Program
+
+
+class AnalysedFile:
+    """The last analysed version of a watched file, together with the worksheets it was parsed from"""
+
+    def __init__(self, var_sheet: str, code_sheet: str, program: Program):
+        self.var_sheet = var_sheet
+        self.code_sheet = code_sheet
+        self.program = program
+
+
+class AnalysisUpdate:
+    """The outcome of re-analysing a watched file after it has been saved"""
+
+    def __init__(self, analysed_file: AnalysedFile, header_changed: bool, code_changed: bool,
+                 graphics_changed: bool, changes: Optional[List[str]]):
+        self.analysed_file = analysed_file
+        self.header_changed = header_changed
+        self.code_changed = code_changed
+        self.graphics_changed = graphics_changed
+        # None for the first analysis of a file, as there is nothing to compare against
+        self.changes = changes
+
+
+def graphical_content(program: Program):
+    """Everything that ends up in the rendered image of a program"""
+    return (
+        [e.toJSON() for e in program.behaviourElements],
+        program.lines,
+        program.comments,
+    )
+
+
+def reanalyse(previous: Optional[AnalysedFile], pou_content: str, code_parser=CODE_PARSER_ANTLR_LISTENER,
+              is_current: Callable[[], bool] = lambda: True) -> Optional[AnalysisUpdate]:
+    """
+    Analyses a new version of a file, re-parsing only the worksheets that differ from the previous version.
+    The code worksheet data is shared with the previous program if the FBD part is unchanged,
+    including its already computed data flow, and so are the cached results of analyses depending only on
+    an unchanged worksheet.
+    The code worksheet is parsed with code_parser, by default the backend of a full parse (parse_pou_content).
+    The analysis is cancelled, returning None, as soon as is_current returns False. It is checked before
+    the header parse, the code parse and the comparison with the previous version.
+    """
+    var_sheet, code_sheet = get_worksheets_from_input(clean_pou_string(pou_content))
+    header_changed = previous is None or var_sheet != previous.var_sheet
+    code_changed = previous is None or code_sheet != previous.code_sheet
+
+    if not is_current():
+        return None
+    if header_changed:
+        program = parse_variable_worksheet(var_sheet)
+    else:
+        program = Program(previous.program.progName, previous.program.varHeader)
+    if not is_current():
+        return None
+    if code_changed:
+        (
+            program.behaviourElements,
+            program.behaviour_id_map,
+            program.lines,
+            program.comments,
+        ) = parse_code_worksheet(code_sheet, code_parser)
+        program.post_parsing_analysis()
+    else:
+        old_program = previous.program
+        program.behaviourElements = old_program.behaviourElements
+        program.behaviour_id_map = old_program.behaviour_id_map
+        program.lines = old_program.lines
+        program.comments = old_program.comments
+        program.ports = old_program.ports
+        program.dataflow_graph = old_program.dataflow_graph
+        # The data flow only depends on the code worksheet
+        program.backward_flow = old_program.backward_flow
+        program.forward_flow = old_program.forward_flow
+    if previous is not None:
+        program.carry_over_analyses(previous.program, not header_changed, not code_changed)
+
+    if not is_current():
+        return None
+    analysed_file = AnalysedFile(var_sheet, code_sheet, program)
+    if previous is None:
+        return AnalysisUpdate(analysed_file, True, True, True, None)
+    graphics_changed = code_changed and graphical_content(previous.program) != graphical_content(program)
+    changes = previous.program.compute_delta(program) if header_changed or code_changed else []
+    return AnalysisUpdate(analysed_file, header_changed, code_changed, graphics_changed, changes)
+
+
+class AnalysisQueue:
+    """
+    Runs analyses of files in the background, so that the caller never waits for them.
+
+    Events for a file are debounced: its analysis starts once no new event has arrived for debounce_seconds,
+    so a burst of events for one save results in a single analysis.
+    At most one analysis per file runs at a time, on a pool of max_workers threads.
+    An analysis is stale once a newer event for its file has arrived. It can check this with the
+    is_current callback it is given, and should then stop without reporting.
+    Cancellation is cooperative: a running analysis is not interrupted, it stops at its next check of is_current.
+    """
+
+    def __init__(self, analyse: Callable[[str, Callable[[], bool]], None], debounce_seconds=0.3, max_workers=2):
+        self.analyse = analyse
+        self.debounce_seconds = debounce_seconds
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="edit_time_analysis")
+        self.condition = threading.Condition()
+        # Per file: when its analysis is due, the number of events seen, and if an analysis is running
+        self.due = dict()
+        self.generation = dict()
+        self.running = set()
+        self.stopped = False
+        self.dispatcher = threading.Thread(target=self._dispatch, name="edit_time_dispatcher", daemon=True)
+        self.dispatcher.start()
+
+    def submit(self, path: str):
+        with self.condition:
+            self.generation[path] = self.generation.get(path, 0) + 1
+            self.due[path] = time.monotonic() + self.debounce_seconds
+            self.condition.notify_all()
+
+    def is_current(self, path: str, generation: int) -> bool:
+        with self.condition:
+            return self.generation.get(path, None) == generation
+
+    def wait_until_idle(self, timeout=None) -> bool:
+        """Waits until no analysis is pending or running. Returns False if the timeout expired first"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not (self.due or self.running), timeout)
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        self.dispatcher.join()
+        self.executor.shutdown(wait=True)
+
+    def _dispatch(self):
+        with self.condition:
+            while not self.stopped:
+                now = time.monotonic()
+                waiting = [(path, due) for path, due in self.due.items() if path not in self.running]
+                for path, due in waiting:
+                    if due <= now:
+                        del self.due[path]
+                        self.running.add(path)
+                        self.executor.submit(self._run, path, self.generation[path])
+                next_due = [due - now for path, due in waiting if due > now]
+                self.condition.wait(timeout=min(next_due) if next_due else None)
+
+    def _run(self, path: str, generation: int):
+        try:
+            self.analyse(path, lambda: self.is_current(path, generation))
+        except Exception as e:
+            logging.error(f"Failure during analysis of {path}. {e}")
+        finally:
+            with self.condition:
+                self.running.discard(path)
+                self.condition.notify_all()
 
 
 class EditTimeAnalysisWatchDog(watchdog.events.PatternMatchingEventHandler):
-    def __init__(self):
+    def __init__(self, debounce_seconds=0.3, max_workers=2):
         watchdog.events.PatternMatchingEventHandler.__init__(
             self, patterns=["*.pou"], ignore_directories=True, case_sensitive=False
         )
 
-        self.analysed_programs = dict()
+        self.analysed_files = dict()
+        self.queue = AnalysisQueue(self.analyse_file, debounce_seconds, max_workers)
 
     def on_modified(self, event):
-        program = parse_pou_file(event.src_path)
-        if self.analysed_programs.get(program.progName, None) is None:
-            self.analysed_programs[program.progName] = program
+        # Called on the observer thread, which must not be blocked by the analysis
+        self.queue.submit(event.src_path)
+
+    def stop(self):
+        self.queue.stop()
+
+    def analyse_file(self, src_path, is_current: Callable[[], bool] = lambda: True):
+        previous = self.analysed_files.get(src_path, None)
+        update = reanalyse(previous, Path(src_path).read_text(), is_current=is_current)
+        if update is None or not is_current():
+            # A newer save has arrived in the meantime. It will be compared against the previous version
+            return None
+        self.analysed_files[src_path] = update.analysed_file
+        program = update.analysed_file.program
+        if update.changes is None:
             print(program.report_as_text())
+        elif not (update.header_changed or update.code_changed):
+            return update
         else:
-            old_version = self.analysed_programs[program.progName]
-            changes = old_version.compute_delta(program)
             print("Found previous version of analysed program. Printing changes:")
-            print(changes)
-        generate_image_of_program(
-            program, f"testrender_{program.progName}.jpg", scale=4.0
-        )
+            print(update.changes)
+        if update.graphics_changed and is_current():
+            generate_image_of_program(
+                program, f"testrender_{program.progName}.jpg", scale=4.0
+            )
+        return update
 
 
-def getWatchDogHandler(source_path):
-    event_handler = EditTimeAnalysisWatchDog()
+def getWatchDogHandler(source_path, debounce_seconds=0.3, max_workers=2):
+    event_handler = EditTimeAnalysisWatchDog(debounce_seconds, max_workers)
     observer = watchdog.observers.Observer()
     observer.schedule(event_handler, path=source_path, recursive=True)
     observer.start()
-    return observer
+    return observer, event_handler
 
 
 
@@ -43,9 +228,13 @@ def getWatchDogHandler(source_path):
 def main():
     argParser = argparse.ArgumentParser()
     argParser.add_argument("--base-path", action="store", required=True)
+    argParser.add_argument("--debounce-ms", action="store", type=int, default=300,
+                           help="Time without further changes to a file before it is analysed")
+    argParser.add_argument("--workers", action="store", type=int, default=2,
+                           help="Maximum number of files analysed at the same time")
 
     args = argParser.parse_args()
-    observer = getWatchDogHandler(args.base_path)
+    observer, event_handler = getWatchDogHandler(args.base_path, args.debounce_ms / 1000, args.workers)
     print("Analyser watchdog now listening to changes in path ", args.base_path)
     try:
         while True:
@@ -53,6 +242,7 @@ def main():
     except KeyboardInterrupt:
         observer.stop()
     observer.join()
+    event_handler.stop()
 
 
 if __name__ == "__main__":
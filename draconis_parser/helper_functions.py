@@ -1,11 +1,22 @@
+import functools
+import glob
+import logging
+import os.path
+
 from antlr4 import InputStream, CommonTokenStream
 
 import MyPOUVisitor
+import POUHeaderParser
+import program_cache
 import MyXMLVisitor
+import MyXMLListener
+import MyLXMLVisitor
+from draconis_parser import Project
 from antlr_generated.python import POULexer, POUParser
 from antlr_generated.python import XMLLexer, XMLParser
 
 from pathlib import Path
+from typing import Iterable, Tuple
 import xml.etree.ElementTree as ET
 
 # Helpers
@@ -23,7 +34,26 @@ def get_worksheets_from_input(input_program: str):
     return input_varWorkSheet, input_codeSheet
 
 
-def parse_variable_worksheet(input_varWorkSheet):
+# Available parser backends for the variable worksheet
+HEADER_PARSER_ANTLR = "antlr"
+HEADER_PARSER_HANDWRITTEN = "handwritten"
+HEADER_PARSER_BACKENDS = [HEADER_PARSER_ANTLR, HEADER_PARSER_HANDWRITTEN]
+
+
+def parse_variable_worksheet(input_varWorkSheet, backend=HEADER_PARSER_HANDWRITTEN):
+    """
+    Parses the variable worksheet defined by the input string
+    The hand-written parser is used by default. Headers it does not accept are handed to
+    the ANTLR grammar, which recovers from syntax errors instead of rejecting the input.
+    Returns a Program without any behaviour elements
+    """
+    if backend == HEADER_PARSER_HANDWRITTEN:
+        try:
+            return POUHeaderParser.parse_variable_worksheet(input_varWorkSheet)
+        except POUHeaderParser.POUHeaderSyntaxError as e:
+            logging.warning(f"Falling back to ANTLR parser for variable worksheet. {e}")
+    elif backend != HEADER_PARSER_ANTLR:
+        raise ValueError(f"Unknown variable worksheet parser backend: {backend}")
     inputDataVarHeader = InputStream(input_varWorkSheet)
     lexer = POULexer.POULexer(inputDataVarHeader)
     tokens = CommonTokenStream(lexer)
@@ -33,14 +63,34 @@ def parse_variable_worksheet(input_varWorkSheet):
     return result
 
 
-def parse_code_worksheet(input_codeWorkSheet: str):
+# Available parser backends for the code worksheet
+CODE_PARSER_ANTLR = "antlr"
+CODE_PARSER_ANTLR_LISTENER = "antlr_listener"
+CODE_PARSER_LXML = "lxml"
+CODE_PARSER_BACKENDS = [CODE_PARSER_ANTLR, CODE_PARSER_ANTLR_LISTENER, CODE_PARSER_LXML]
+
+
+def parse_code_worksheet(input_codeWorkSheet: str, backend=CODE_PARSER_ANTLR_LISTENER):
     """
     Parses the code worksheet defined by the input string
+    The backend selects between the generic ANTLR XML grammar and the streaming lxml parser.
+    With the ANTLR grammar, the AST is either built while parsing (antlr_listener),
+    or by visiting the complete parse tree afterward (antlr).
+    All produce the same result.
     Returns the elements and an ID map
     """
+    if backend == CODE_PARSER_LXML:
+        visitor = MyLXMLVisitor.MyLXMLVisitor()
+        visitor.visitDocument(input_codeWorkSheet)
+        return visitor.elements, visitor.local_id_map, visitor.lines, visitor.comments
+    if backend not in [CODE_PARSER_ANTLR, CODE_PARSER_ANTLR_LISTENER]:
+        raise ValueError(f"Unknown code worksheet parser backend: {backend}")
     inputDataVarHeader = InputStream(input_codeWorkSheet)
     lexer = XMLLexer.XMLLexer(inputDataVarHeader)
     tokens = CommonTokenStream(lexer)
+    if backend == CODE_PARSER_ANTLR_LISTENER:
+        listener = MyXMLListener.MyXMLListener.parse(tokens)
+        return listener.elements, listener.local_id_map, listener.lines, listener.comments
     parser = XMLParser.XMLParser(tokens)
     tree = parser.document()  # Begin parsing at this rule
     visitor = MyXMLVisitor.MyXMLVisitor()
@@ -52,22 +102,100 @@ def clean_pou_string(input_pou_prog: str):
     """Removes useless parts of the program before parsing"""
     return input_pou_prog.replace("﻿", "")
 
-def parse_pou_content(pou_content_str):
+def load_code_worksheet(codeSheet, code_parser, program):
+    """Sets the data of the code worksheet on a program, which was parsed in interface mode"""
+    (
+        program.behaviourElements,
+        program.behaviour_id_map,
+        program.lines,
+        program.comments,
+    ) = parse_code_worksheet(codeSheet, code_parser)
+
+
+def parse_pou_interface(pou_content_str, code_parser=CODE_PARSER_ANTLR_LISTENER,
+                        header_parser=HEADER_PARSER_HANDWRITTEN):
+    """
+    Parses only the variable worksheet of a POU.
+    The code worksheet is parsed the first time its elements, or any analysis depending on them, are used
+    """
+    program_string = clean_pou_string(pou_content_str)
+    varSheet, codeSheet = get_worksheets_from_input(program_string)
+    resultProgram = parse_variable_worksheet(varSheet, header_parser)
+    resultProgram.defer_code_worksheet(functools.partial(load_code_worksheet, codeSheet, code_parser))
+    return resultProgram
+
+
+def parse_pou_content(pou_content_str, code_parser=CODE_PARSER_ANTLR_LISTENER,
+                      header_parser=HEADER_PARSER_HANDWRITTEN, cache: program_cache.ProgramCache = None, interface_only=False):
+    """
+    Parses a complete POU and performs the post parsing analysis.
+    If a program cache is given, or configured through the environment, an unchanged POU is loaded from it instead.
+    With interface_only, see parse_pou_interface, the cache is not used
+    """
+    if interface_only:
+        return parse_pou_interface(pou_content_str, code_parser, header_parser)
     program_string = clean_pou_string(pou_content_str)
+    cache = cache or program_cache.get_default_program_cache()
+    if cache is None:
+        return _parse_cleaned_pou_content(program_string, code_parser, header_parser)
+
+    key = cache.key(program_string, code_parser, header_parser)
+    resultProgram = cache.get(key)
+    if resultProgram is None:
+        resultProgram = _parse_cleaned_pou_content(program_string, code_parser, header_parser)
+        cache.put(key, resultProgram)
+    return resultProgram
+
+
+def _parse_cleaned_pou_content(program_string, code_parser, header_parser):
     varSheet, codeSheet = get_worksheets_from_input(program_string)
 
-    resultProgram = parse_variable_worksheet(varSheet)
+    resultProgram = parse_variable_worksheet(varSheet, header_parser)
     (
         resultProgram.behaviourElements,
         resultProgram.behaviour_id_map,
         resultProgram.lines,
         resultProgram.comments,
-    ) = parse_code_worksheet(codeSheet)
+    ) = parse_code_worksheet(codeSheet, code_parser)
     resultProgram.post_parsing_analysis()
     return resultProgram
 
-def parse_pou_file(pou_file_path: str):
-    return parse_pou_content(clean_pou_string(Path(pou_file_path).read_text()))
+def parse_pou_file(pou_file_path: str, code_parser=CODE_PARSER_ANTLR_LISTENER,
+                   header_parser=HEADER_PARSER_HANDWRITTEN, cache: program_cache.ProgramCache = None, interface_only=False):
+    return parse_pou_content(clean_pou_string(Path(pou_file_path).read_text()), code_parser, header_parser, cache,
+                             interface_only)
+
+
+def parse_project_directory(base_path: str, file_match_glob="**/*.pou", code_parser=CODE_PARSER_ANTLR_LISTENER,
+                            header_parser=HEADER_PARSER_HANDWRITTEN, cache: program_cache.ProgramCache = None):
+    """
+    Parses all POUs below base_path into a project, resolving instances of function blocks to their defining POUs.
+    Files that cannot be parsed are logged and left out.
+    """
+    programs = []
+    # Sorted, so that the first of several definitions of a POU does not depend on the file system
+    for pou_file in sorted(glob.glob(os.path.join(base_path, file_match_glob), recursive=True)):
+        try:
+            programs.append(parse_pou_file(pou_file, code_parser, header_parser, cache))
+        except Exception as e:
+            logging.error(f"Failure during parse process of {pou_file}. {e}")
+    return Project(programs)
+
+
+def parse_project_contents(named_pou_contents: Iterable[Tuple[str, str]], code_parser=CODE_PARSER_ANTLR_LISTENER,
+                           header_parser=HEADER_PARSER_HANDWRITTEN, cache: program_cache.ProgramCache = None):
+    """
+    Parses POU texts, e.g. the uploaded files of a project, into a project, like parse_project_directory.
+    Args:
+        named_pou_contents: (name, content) of each POU. The name is only used to log POUs that cannot be parsed
+    """
+    programs = []
+    for name, pou_content in named_pou_contents:
+        try:
+            programs.append(parse_pou_content(pou_content, code_parser, header_parser, cache))
+        except Exception as e:
+            logging.error(f"Failure during parse process of {name}. {e}")
+    return Project(programs)
 
 
 def change_pou_description(description_file, description):
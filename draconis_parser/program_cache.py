@@ -0,0 +1,134 @@
+"""
+On-disk cache of parsed programs, see ProgramCache.
+
+Entries are unpickled when they are loaded, and unpickling can run arbitrary code. The cache directory, e.g. the one
+configured through DRACONIS_PROGRAM_CACHE_DIR, must therefore not be writable by untrusted users.
+"""
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+this_dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if this_dirname not in sys.path:
+    sys.path.insert(0, this_dirname)
+from draconis_parser import Program
+
+# Opt-in: no cache is used unless a cache directory is configured
+PROGRAM_CACHE_DIR = os.environ.get("DRACONIS_PROGRAM_CACHE_DIR", None)
+PROGRAM_CACHE_MAX_SIZE_MB = float(os.environ.get("DRACONIS_PROGRAM_CACHE_MAX_SIZE_MB", "256"))
+
+CACHE_ENTRY_SUFFIX = ".program"
+
+# The errors of loading a corrupt or outdated entry, which is then discarded. Other errors are not the entry's fault
+UNREADABLE_ENTRY_ERRORS = (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError)
+
+
+class ProgramCache:
+    """
+    Content-addressed on-disk store of parsed programs.
+
+    Entries are keyed by a hash of the cleaned POU text, the parser configuration and Program.VERSION(),
+    so a changed file or a new analysis version never hits a stale entry.
+    Programs are stored as compressed pickles of their state after post_parsing_analysis.
+    The directory is kept below max_size_bytes by evicting the least recently used entries. It is scanned once,
+    on first use; from then on the size is tracked as entries are used and stored. Entries stored by other
+    processes meanwhile are only counted once they are used.
+    """
+
+    def __init__(self, cache_dir, max_size_bytes=int(PROGRAM_CACHE_MAX_SIZE_MB * 1024 * 1024)):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # entry path -> size, least recently used first. None until the directory has been scanned
+        self._entries: Optional[OrderedDict] = None
+        self._total_size = 0
+
+    @classmethod
+    def key(cls, cleaned_pou_content: str, *parser_options) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(repr((Program.VERSION(), parser_options)).encode("utf-8"))
+        hasher.update(cleaned_pou_content.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / (key + CACHE_ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[Program]:
+        path = self.entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            program = pickle.loads(zlib.decompress(data))
+        except UNREADABLE_ENTRY_ERRORS as e:
+            logging.warning(f"Discarding unreadable program cache entry {path}. {e}")
+            path.unlink(missing_ok=True)
+            self._total_size -= self._index().pop(path, 0)
+            return None
+        # Mark as recently used
+        os.utime(path)
+        self._record_use(path, len(data))
+        return program
+
+    def put(self, key: str, program: Program) -> None:
+        data = zlib.compress(pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL))
+        # Write to a temporary file first, so that concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, self.entry_path(key))
+        except BaseException:
+            # Also on a timeout or an interrupt: temporary files are not evicted
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._record_use(self.entry_path(key), len(data))
+        self.evict()
+
+    def _index(self) -> OrderedDict:
+        if self._entries is None:
+            entries = []
+            for path in self.cache_dir.glob("*" + CACHE_ENTRY_SUFFIX):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            self._entries = OrderedDict((path, size) for _, size, path in sorted(entries, key=lambda e: e[0]))
+            self._total_size = sum(self._entries.values())
+        return self._entries
+
+    def _record_use(self, path: Path, size: int) -> None:
+        entries = self._index()
+        self._total_size += size - entries.pop(path, 0)
+        entries[path] = size
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache fits within its size bound"""
+        entries = self._index()
+        while self._total_size > self.max_size_bytes and entries:
+            path, size = entries.popitem(last=False)
+            path.unlink(missing_ok=True)
+            self._total_size -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*" + CACHE_ENTRY_SUFFIX):
+            path.unlink(missing_ok=True)
+        self._entries = None
+
+
+@functools.cache
+def get_default_program_cache() -> Optional[ProgramCache]:
+    """The cache configured through the environment, or None if caching has not been enabled"""
+    if PROGRAM_CACHE_DIR is None:
+        return None
+    return ProgramCache(PROGRAM_CACHE_DIR)
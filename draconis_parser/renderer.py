@@ -6,7 +6,7 @@ from typing import Tuple, List
 
 from PIL import Image, ImageDraw, ImageFont
 from draconis_parser import Program
-from draconis_parser import ConnectionDirection
+from draconis_parser import ConnectionDirection, LineTable
 from Web_GUI import Point
 from html_sanitizer import Sanitizer
 
@@ -268,21 +268,9 @@ def render_reports_to_draw_context(program: Program, margin_offset_size, draw_co
 
 
 def get_program_width_height(program, min_size=100):
-    _width, _height = min_size, min_size
     # Find actual width and height, based on elements present
-    for b in program.behaviourElements:
-        _x, _y = b.data.boundary_box.bot_right.getAsTuple()
-        _width = max(_width, _x)
-        _height = max(_height, _y)
-    for l in program.lines:
-        s_p, e_p = l
-        _width = max(_width, s_p.x, e_p.x)
-        _height = max(_height, s_p.y, e_p.y)
-    for c in program.comments:
-        _x, _y = c.bounding_box.bot_right.getAsTuple()
-        _width = max(_width, _x)
-        _height = max(_height, _y)
-    return _height, _width
+    extent = program.getExtent(min_size)
+    return extent.y, extent.x
 
 
 def render_block(aBlock, scalerFunc, font: ImageFont.FreeTypeFont, canvas: ImageDraw.ImageDraw):
@@ -474,12 +462,18 @@ def render_program_to_svg(aProgram, scale=1.0, use_dedicated_css=False):
 
 
 def render_lines_to_svg(lines, scalerFunc):
+    if isinstance(lines, LineTable):
+        return [render_coordinates_to_svg(coordinates, scalerFunc) for coordinates in lines.rows()]
     return [render_line_to_svg(line, scalerFunc) for line in lines]
 
 
 def render_line_to_svg(line, scalerFunc):
     start_point, end_point = line
-    s_x, s_y, e_x, e_y = map(scalerFunc, (start_point.x, start_point.y, end_point.x, end_point.y))
+    return render_coordinates_to_svg((start_point.x, start_point.y, end_point.x, end_point.y), scalerFunc)
+
+
+def render_coordinates_to_svg(coordinates, scalerFunc):
+    s_x, s_y, e_x, e_y = map(scalerFunc, coordinates)
     return f'<line class="signal_line" x1="{s_x}" y1="{s_y}" x2="{e_x}" y2="{e_y}" />'
 
 
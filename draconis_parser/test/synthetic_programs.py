@@ -0,0 +1,300 @@
+"""
+Generators for large, synthetic POU files.
+Used by tests and benchmarks that need programs far bigger than the hand-made test POUs.
+"""
+from typing import List, Optional, Tuple
+
+# A source of data flow: (refLocalId, connected formal parameter ID, formal parameter name)
+Source = Tuple[int, Optional[int], Optional[str]]
+
+BLOCK_WIDTH, BLOCK_HEIGHT = 16, 24
+VAR_BLOCK_WIDTH, VAR_BLOCK_HEIGHT = 18, 4
+
+
+class SyntheticPOU:
+    """
+    Minimal builder for PLCopen FBD programs in the format produced by the IDE.
+    Every localId is unique across blocks and formal parameters, like in the exported files.
+    """
+
+    def __init__(self, name: str, pou_type="PROGRAM"):
+        self.name = name
+        self.pou_type = pou_type
+        self.variables = {"VAR_INPUT": [], "VAR_OUTPUT": [], "VAR": []}
+        self.nodes = []
+        self.lines = []
+        self._next_id = 0
+        self._column = 0
+
+    def new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def _next_position(self):
+        self._column += 1
+        return 20 + 40 * (self._column % 50), 10 + 30 * (self._column // 50)
+
+    def add_variable(self, kind: str, name: str, value_type="BOOL", description=None, init_val=None):
+        self.variables[kind].append((name, value_type, description, init_val))
+
+    def in_variable(self, expr: str) -> Source:
+        local_id = self.new_id()
+        x, y = self._next_position()
+        self.nodes.append(
+            f'  <inVariable localId="{local_id}" height="{VAR_BLOCK_HEIGHT}" width="{VAR_BLOCK_WIDTH}">\n'
+            f'    <position x="{x}" y="{y}" />\n'
+            f"    <expression>{expr}</expression>\n"
+            f"    <connectionPointOut>\n"
+            f'      <relPosition x="{VAR_BLOCK_WIDTH}" y="2" />\n'
+            f"    </connectionPointOut>\n"
+            f"  </inVariable>"
+        )
+        return local_id, None, None
+
+    def out_variable(self, expr: str, source: Source) -> int:
+        local_id = self.new_id()
+        x, y = self._next_position()
+        self.nodes.append(
+            f'  <outVariable localId="{local_id}" height="{VAR_BLOCK_HEIGHT}" width="{VAR_BLOCK_WIDTH}">\n'
+            f'    <position x="{x}" y="{y}" />\n'
+            f"    <expression>{expr}</expression>\n"
+            f"    <connectionPointIn>\n"
+            f'      <relPosition x="0" y="2" />\n'
+            f"{self._connection(source, indent=6)}\n"
+            f"    </connectionPointIn>\n"
+            f"  </outVariable>"
+        )
+        self._add_line(source, x, y)
+        return local_id
+
+    def block(self, type_name: str, sources: List[Source], nr_of_outputs=1, input_names: List[str] = None,
+              output_names: List[str] = None, instance_name: str = None) -> List[Source]:
+        input_names = input_names or [f"IN{i + 1}" for i in range(len(sources))]
+        output_names = output_names or [f"OUT{i + 1}" for i in range(nr_of_outputs)]
+        in_ids = [self.new_id() for _ in sources]
+        out_ids = [self.new_id() for _ in range(nr_of_outputs)]
+        block_id = self.new_id()
+        x, y = self._next_position()
+        inputs = "\n".join(
+            f'      <variable formalParameter="{input_names[i]}">\n'
+            f"        <connectionPointIn>\n"
+            f'          <relPosition x="0" y="{8 * (i + 1)}" />\n'
+            f"{self._connection(source, indent=10)}\n"
+            f"        </connectionPointIn>\n"
+            f"{self._fp_data(fp_id, 640, 0)}\n"
+            f"      </variable>"
+            for i, (fp_id, source) in enumerate(zip(in_ids, sources))
+        )
+        outputs = "\n".join(
+            f'      <variable formalParameter="{output_names[i]}">\n'
+            f"        <connectionPointOut>\n"
+            f'          <relPosition x="{BLOCK_WIDTH}" y="{8 * (i + 1)}" />\n'
+            f"        </connectionPointOut>\n"
+            f"{self._fp_data(fp_id, 0, 640)}\n"
+            f"      </variable>"
+            for i, fp_id in enumerate(out_ids)
+        )
+        instance = "" if instance_name is None else f' instanceName="{instance_name}"'
+        self.nodes.append(
+            f'  <block localId="{block_id}" height="{BLOCK_HEIGHT}" width="{BLOCK_WIDTH}" typeName="{type_name}"{instance}>\n'
+            f'    <position x="{x}" y="{y}" />\n'
+            f"    <addData>\n"
+            f'      <data name="synthetic" handleUnknown="preserve">\n'
+            f'        <fbData fbFuType="1" />\n'
+            f"      </data>\n"
+            f"    </addData>\n"
+            f"    <inputVariables>\n{inputs}\n    </inputVariables>\n"
+            f"    <inOutVariables />\n"
+            f"    <outputVariables>\n{outputs}\n    </outputVariables>\n"
+            f"  </block>"
+        )
+        for source in sources:
+            self._add_line(source, x, y)
+        return [(block_id, fp_id, output_names[i]) for i, fp_id in enumerate(out_ids)]
+
+    def next_block_outputs(self, input_counts: List[int]) -> List[Source]:
+        """
+        The first output of each of the next blocks, given their number of inputs, before they are added.
+        Allows wiring feedback loops, where a block is connected to the output of a later block.
+        """
+        result = []
+        next_id = self._next_id
+        for nr_of_inputs in input_counts:
+            # The IDs of the inputs, the output, the block, and the lines from the sources
+            out_id = next_id + nr_of_inputs + 1
+            block_id = out_id + 1
+            result.append((block_id, out_id, "OUT1"))
+            next_id = block_id + nr_of_inputs
+        return result
+
+    def add_comment(self, text: str):
+        local_id = self.new_id()
+        x, y = self._next_position()
+        self.nodes.append(
+            f'  <comment localId="{local_id}" height="16" width="48">\n'
+            f'    <position x="{x}" y="{y}" />\n'
+            f"    <content>\n"
+            f'      <html xmlns="">\n'
+            f"        <head>\n"
+            f"          <title />\n"
+            f"          <body>\n"
+            f'            <p style="">{text}</p>\n'
+            f"          </body>\n"
+            f"        </head>\n"
+            f"      </html>\n"
+            f"    </content>\n"
+            f"  </comment>"
+        )
+
+    def _add_line(self, source: Source, x, y):
+        self.lines.append((self.new_id(), source[0] % 97, source[0] % 89, x // 2, y // 2))
+
+    @classmethod
+    def _connection(cls, source: Source, indent):
+        ref_id, fp_id, formal_name = source
+        pad = " " * indent
+        if fp_id is None:
+            return f'{pad}<connection refLocalId="{ref_id}" />'
+        return (
+            f'{pad}<connection refLocalId="{ref_id}" formalParameter="{formal_name}">\n'
+            f"{pad}  <addData>\n"
+            f'{pad}    <data name="synthetic" handleUnknown="preserve">\n'
+            f'{pad}      <connectedFormalparameter refLocalId="{fp_id}" />\n'
+            f"{pad}    </data>\n"
+            f"{pad}  </addData>\n"
+            f"{pad}</connection>"
+        )
+
+    @classmethod
+    def _fp_data(cls, fp_id, in_state, out_state):
+        return (
+            f"        <addData>\n"
+            f'          <data name="synthetic" handleUnknown="preserve">\n'
+            f'            <fp localId="{fp_id}" inState="{in_state}" outState="{out_state}" width="2" height="2" '
+            f'flagType="" dataType="ANY" />\n'
+            f"          </data>\n"
+            f"        </addData>"
+        )
+
+    def render(self) -> str:
+        line_nr = 0
+        groups = []
+        for group_id, (group_name, kind) in enumerate(
+                [("Inputs", "VAR_INPUT"), ("Outputs", "VAR_OUTPUT"), ("Internals", "VAR")]
+        ):
+            var_lines = []
+            for name, value_type, description, init_val in self.variables[kind]:
+                line_nr += 1
+                init = "" if init_val is None else f" := {init_val}"
+                desc = "" if description is None else f" (*{description}*)"
+                var_lines.append(f"    {{LINE({line_nr})}}\n    {name} : {value_type}{init};{desc}")
+            groups.append((group_id, group_name, kind, var_lines))
+        group_defs = "\n".join(f"{{GroupDefinition({i},'{name}')}}" for i, name, _, _ in groups)
+        var_groups = "\n\n".join(
+            "\n".join([f"{kind} {{Group({i})}}"] + var_lines + ["END_VAR"]) for i, _, kind, var_lines in groups
+        )
+        lines = "\n".join(
+            f'      <line localId="{i}" beginX="{bx}" beginY="{by}" endX="{ex}" endY="{ey}" />'
+            for i, bx, by, ex, ey in self.lines
+        )
+        nodes = "\n".join(self.nodes)
+        return (
+            f"{self.pou_type} {self.name}\n"
+            f"{{ VariableWorksheet := 'Variables' }}\n"
+            f"{group_defs}\n\n"
+            f"{var_groups}\n\n"
+            f"{{ CodeWorksheet := '{self.name}', Type := '.fbd' }}\n"
+            f'<?xml version="1.0" encoding="utf-16" standalone="yes"?><FBD>\n'
+            f"  <addData>\n"
+            f'    <data name="synthetic" handleUnknown="preserve">\n'
+            f"{lines}\n"
+            f"    </data>\n"
+            f"  </addData>\n"
+            f"{nodes}\n"
+            f"</FBD>\n"
+            f"END_{self.pou_type}\n"
+        )
+
+
+def chain_program(length: int, name="Chain") -> str:
+    """A single input flowing through a chain of 'length' blocks into a single output"""
+    pou = SyntheticPOU(name)
+    pou.add_variable("VAR_INPUT", "In_0", description="Chain input")
+    pou.add_variable("VAR_OUTPUT", "Out_0", description="Chain output")
+    source = pou.in_variable("In_0")
+    for _ in range(length):
+        source = pou.block("NOT", [source])[0]
+    pou.out_variable("Out_0", source)
+    return pou.render()
+
+
+def diamond_lattice_program(depth: int, name="Diamonds") -> str:
+    """
+    'depth' consecutive diamonds: every stage fans the signal out to two blocks and joins them again.
+    The number of distinct input-to-output paths is 2**depth.
+    """
+    pou = SyntheticPOU(name)
+    pou.add_variable("VAR_INPUT", "In_0", description="Lattice input")
+    pou.add_variable("VAR_OUTPUT", "Out_0", description="Lattice output")
+    source = pou.in_variable("In_0")
+    for _ in range(depth):
+        left = pou.block("NOT", [source])[0]
+        right = pou.block("NOT", [source])[0]
+        source = pou.block("AND", [left, right])[0]
+    pou.out_variable("Out_0", source)
+    return pou.render()
+
+
+def wide_program(nr_of_inputs: int, nr_of_outputs: int, fan_in=4, name="Wide") -> str:
+    """
+    Many independent inputs and outputs. Every output is an AND over 'fan_in' inputs,
+    with overlapping input windows so that most inputs reach several outputs.
+    """
+    pou = SyntheticPOU(name)
+    in_sources = []
+    for i in range(nr_of_inputs):
+        pou.add_variable("VAR_INPUT", f"In_{i}", description=f"Input number {i}")
+        in_sources.append(pou.in_variable(f"In_{i}"))
+    for o in range(nr_of_outputs):
+        pou.add_variable("VAR_OUTPUT", f"Out_{o}", description=f"Output number {o}")
+        sources = [in_sources[(o + k) % nr_of_inputs] for k in range(fan_in)]
+        pou.out_variable(f"Out_{o}", pou.block("AND", sources)[0])
+    return pou.render()
+
+
+def feedback_program(nr_of_loops: int, loop_length: int, name="Loops") -> str:
+    """
+    'nr_of_loops' independent networks, each a ring of 'loop_length' blocks: the first block combines
+    the input with the output of the last one, which is also the output of the network.
+    """
+    pou = SyntheticPOU(name)
+    for n in range(nr_of_loops):
+        pou.add_variable("VAR_INPUT", f"In_{n}", description=f"Loop {n} input")
+        pou.add_variable("VAR_OUTPUT", f"Out_{n}", description=f"Loop {n} output")
+        source = pou.in_variable(f"In_{n}")
+        feedback = pou.next_block_outputs([2] + [1] * (loop_length - 1))[-1]
+        source = pou.block("AND", [source, feedback])[0]
+        for _ in range(loop_length - 1):
+            source = pou.block("NOT", [source])[0]
+        assert source == feedback
+        pou.out_variable(f"Out_{n}", source)
+    return pou.render()
+
+
+def large_program(nr_of_blocks: int, name="Large") -> str:
+    """
+    A program of roughly 'nr_of_blocks' function blocks, organised as independent networks
+    of ten blocks each, with a comment per network.
+    """
+    pou = SyntheticPOU(name)
+    network_size = 10
+    for n in range(max(1, nr_of_blocks // network_size)):
+        pou.add_variable("VAR_INPUT", f"In_{n}", description=f"Network {n} input")
+        pou.add_variable("VAR_OUTPUT", f"Out_{n}", description=f"Network {n} output")
+        source = pou.in_variable(f"In_{n}")
+        constant = pou.in_variable("BOOL#1")
+        for _ in range(network_size):
+            source = pou.block("AND", [source, constant])[0]
+        pou.out_variable(f"Out_{n}", source)
+        pou.add_comment(f"Network {n}")
+    return pou.render()
@@ -0,0 +1,88 @@
+import os.path
+import pickle
+import sys
+
+from draconis_parser import ParameterType, Program, ValueType, VariableLine
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content, parse_pou_interface
+from synthetic_programs import wide_program
+
+
+def count_calls(monkeypatch, method_name):
+    calls = []
+    method = getattr(Program, method_name)
+
+    def counting_method(self, *args):
+        calls.append(args)
+        return method(self, *args)
+
+    monkeypatch.setattr(Program, method_name, counting_method)
+    return calls
+
+
+def test_report_computes_each_analysis_once(monkeypatch):
+    program = parse_pou_content(wide_program(6, 3))
+    metrics_calls = count_calls(monkeypatch, "compute_variables_complexity")
+    matrix_calls = count_calls(monkeypatch, "getDependencyMatrix")
+    var_info_columns_calls = count_calls(monkeypatch, "getVarDataColumns")
+
+    report = program.report_as_text()
+
+    assert len(metrics_calls) == 1
+    assert len(matrix_calls) == 1
+    # Once for the var info, once for the variables part of the report
+    assert len(var_info_columns_calls) == 2
+    assert program.report_as_text() == report
+    assert len(metrics_calls) == 1 and len(matrix_calls) == 1
+
+
+def test_results_are_shared_until_invalidated():
+    program = parse_pou_content(wide_program(6, 3))
+    results = [program.getMetrics(), program.getVarInfo(), program.getDependencyPathsByName(),
+               program.get_dependencies_names(), program.checkSafeDataFlow(), program.check_rules()]
+    assert [program.getMetrics(), program.getVarInfo(), program.getDependencyPathsByName(),
+            program.get_dependencies_names(), program.checkSafeDataFlow(), program.check_rules()] == results
+    assert program.getMetrics() is results[0] and program.check_rules() is results[-1]
+
+    program.invalidate()
+    assert program.analysis_cache == {}
+    assert program.backward_flow is None and program.dependency_matrix is None
+    assert program.getMetrics() is not results[0]
+    assert program.getMetrics() == results[0]
+    assert program.check_rules() == results[-1]
+
+
+def test_given_mutated_variable_sheet_all_results_are_updated():
+    program = parse_pou_content(wide_program(6, 3))
+    metrics = program.getMetrics()
+    rules = program.check_rules()
+    assert "In_6" not in program.getVarInfo()["InputVariables"]
+
+    program.varHeader.addVariable(
+        "Inputs", VariableLine("In_6", ParameterType.InputVar, ValueType.BOOL, description="Another input")
+    )
+
+    assert program.getMetrics()["NrInputVariables"] == metrics["NrInputVariables"] + 1
+    assert "In_6" in program.getVarInfo()["InputVariables"]
+    [unused_rule] = [r for r in program.check_rules() if r[0] == "FBD.Variable.UnusedVariables"]
+    assert unused_rule[1] == "Fail" and "In_6" in unused_rule[2]
+    assert program.check_rules() != rules
+
+
+def test_given_variable_removed_from_sheet_of_unpickled_program_metrics_are_updated():
+    program = pickle.loads(pickle.dumps(parse_pou_content(wide_program(6, 3))))
+    assert program.getMetrics()["NrInputVariables"] == 6
+    program.varHeader.removeVariable(program.varHeader.getFirstVariableByName("In_0"))
+    assert program.getMetrics()["NrInputVariables"] == 5
+    assert len(program.varHeader.getVarsByType(ParameterType.InputVar)) == 5
+
+
+def test_given_interface_parse_invalidate_does_not_load_code_worksheet():
+    program = parse_pou_interface(wide_program(6, 3))
+    var_info = program.getVarInfo()
+    program.invalidate()
+    assert not program.is_code_worksheet_loaded()
+    assert program.getVarInfo() is not var_info
+    assert program.getMetrics()["NrInputVariables"] == 6
+    assert program.is_code_worksheet_loaded()
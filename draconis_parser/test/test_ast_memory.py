@@ -0,0 +1,76 @@
+import gc
+import logging
+import os.path
+import sys
+import tracemalloc
+
+import pytest
+
+from draconis_parser import FBDObjData, Point, Rectangle
+from AST.connections import Connection, ConnectionData, ConnectionPoint, ConnectionDirection
+from utility_classes.position import make_absolute_position
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_LXML, parse_pou_content
+from synthetic_programs import large_program
+
+
+def bytes_per_block(nr_of_blocks):
+    """Memory held by a parsed synthetic program, divided by its number of blocks"""
+    content = large_program(nr_of_blocks)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        program = parse_pou_content(content, code_parser=CODE_PARSER_LXML)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(program.behaviourElements) >= nr_of_blocks
+    return (after - before) / nr_of_blocks
+
+
+def test_nodes_of_parsed_program_have_no_instance_dict():
+    program = parse_pou_content(large_program(20))
+    nodes = list(program.varHeader.getAllVariables()) + list(program.ports.values())
+    for block in program.behaviourElements:
+        nodes += [block.data, block.data.boundary_box, block.data.boundary_box.top_left]
+        if block.getBlockType() == "Port":
+            connection_points = [block.outConnection]
+        else:
+            nodes += block.getInputVars() + block.getOutputVars()
+            connection_points = [p.connectionPoint for p in block.getInputVars() + block.getOutputVars()]
+        for point in connection_points:
+            nodes += [point, point.data, point.data.position] + point.connections
+    assert nodes
+    assert [n for n in nodes if hasattr(n, "__dict__")] == []
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        Point(3, 4),
+        Rectangle(Point(1, 2), Point(3, 4)),
+        FBDObjData(7, "block", Rectangle(Point(1, 2), Point(3, 4))),
+        ConnectionData(make_absolute_position(5, 6), 8),
+    ],
+    ids=lambda n: type(n).__name__,
+)
+def test_slotted_nodes_survive_json_round_trip(node):
+    assert type(node).fromJSON(node.toJSON()) == node
+
+
+def test_connection_data_compare_equal_regardless_of_content():
+    connection_data = ConnectionData(make_absolute_position(5, 6), 8)
+    assert connection_data == ConnectionData()
+    point = ConnectionPoint(ConnectionDirection.Input, [Connection(connection_data, ConnectionData(), "IN")], ConnectionData())
+    assert point == ConnectionPoint(ConnectionDirection.Input, [Connection(ConnectionData(), ConnectionData(), "IN")], ConnectionData())
+
+
+if __name__ == "__main__":
+    # E.g., python test_ast_memory.py 20000
+    # With per-instance dictionaries and unshared attribute strings, 500 blocks measured about 9900 bytes per block
+    logging.disable(logging.WARNING)
+    nr_of_blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{nr_of_blocks} blocks: {bytes_per_block(nr_of_blocks):.0f} bytes per block")
@@ -0,0 +1,114 @@
+import glob
+import os.path
+import sys
+
+import pytest
+
+from draconis_parser import DataflowDirection, PathDivide
+from AST.dataflow_graph import NODE_IN_VARIABLE
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_LXML, parse_pou_content, parse_pou_file
+from synthetic_programs import chain_program, diamond_lattice_program, large_program, wide_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+TEST_POU_FILES = sorted(
+    glob.glob(os.path.join(THIS_DIR, "**", "*.pou"), recursive=True)
+    + glob.glob(os.path.join(THIS_DIR, "..", "..", "checks", "test", "test_programs", "*.pou"))
+)
+# Stored as UTF-16 with a byte order mark, and not a complete POU
+NON_POU_FILES = ["xml_part.pou"]
+# Refers to connections of blocks that are not part of the worksheet, and cannot be set up
+UNCONNECTABLE_FILES = ["Main.pou"]
+
+
+def recursive_back_trace(program, bID, trace_from_portID=None):
+    """The original recursive implementation, kept as the reference for the traversal"""
+
+    def appendIfNotInListEnd(l, elem):
+        if not l or l[-1] != elem:
+            l.append(elem)
+
+    b = program.behaviour_id_map.get(bID, None) or program.behaviour_id_map[program.ports[bID].blockID]
+    result = []
+    flow = b.getFlowOverBlock(DataflowDirection.Backward, trace_from_portID)
+    if not flow:
+        return [bID]
+    elif len(flow) == 1:
+        startPort, connectionPorts = flow[0]
+        appendIfNotInListEnd(result, startPort)
+        if len(connectionPorts) == 1:
+            appendIfNotInListEnd(result, connectionPorts[0][0])
+            appendIfNotInListEnd(result, connectionPorts[0][1])
+            for r in recursive_back_trace(program, connectionPorts[0][1], connectionPorts[0][1]):
+                appendIfNotInListEnd(result, r)
+        else:
+            dividing_paths = []
+            for toPort, connectingPort in connectionPorts:
+                _recurse = [toPort]
+                for _r in recursive_back_trace(program, connectingPort, connectingPort):
+                    appendIfNotInListEnd(_recurse, _r)
+                dividing_paths.append(_recurse)
+            result.append(PathDivide(dividing_paths))
+    return result
+
+
+def recursive_backward_trace(program):
+    return {
+        b.getVarExpr(): recursive_back_trace(program, b.getID())
+        for b in program.behaviourElements
+        if b.getBlockType() == "Port" and b.data.type == "outVariable"
+    }
+
+
+def count_paths(trace, counts=None):
+    """Number of paths in a trace, without flattening it. Shared PathDivides are counted once"""
+    counts = {} if counts is None else counts
+    divides = [e for e in trace if isinstance(e, PathDivide)]
+    if not divides:
+        return 1
+    divide = divides[-1]
+    if id(divide) not in counts:
+        counts[id(divide)] = sum(count_paths(p, counts) for p in divide.paths)
+    return counts[id(divide)]
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES + UNCONNECTABLE_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_trace_is_identical_to_recursive_trace(pou_file):
+    program = parse_pou_file(pou_file)
+    assert program.getBackwardTrace() == recursive_backward_trace(program)
+    for block in program.behaviourElements:
+        assert program.performBackTraceFromBlock(block.getID()) == recursive_back_trace(program, block.getID())
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [chain_program(20), diamond_lattice_program(5), wide_program(12, 6), large_program(40)],
+    ids=["chain", "diamonds", "wide", "large"],
+)
+def test_given_synthetic_pou_trace_is_identical_to_recursive_trace(pou_content):
+    program = parse_pou_content(pou_content)
+    assert program.getBackwardTrace() == recursive_backward_trace(program)
+
+
+def test_deep_chain_does_not_hit_recursion_limit():
+    length = 2 * sys.getrecursionlimit()
+    program = parse_pou_content(chain_program(length), code_parser=CODE_PARSER_LXML)
+    with pytest.raises(RecursionError):
+        recursive_backward_trace(program)
+    trace = program.getBackwardTrace()["Out_0"]
+    # Outport, and the output and input port of every block, down to the inport
+    assert len(trace) == 2 * length + 2
+    graph = program.dataflow_graph
+    assert graph.ids(graph.nodes_of_kind(NODE_IN_VARIABLE)) == [trace[-1]]
+
+
+def test_wide_diamond_lattice_is_traced_without_enumerating_paths():
+    depth = 60
+    program = parse_pou_content(diamond_lattice_program(depth), code_parser=CODE_PARSER_LXML)
+    trace = program.getBackwardTrace()["Out_0"]
+    assert count_paths(trace) == 2 ** depth
@@ -0,0 +1,93 @@
+import multiprocessing
+import os.path
+import pickle
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+import batch_analysis_cli
+from batch_analysis_cli import REPORT_SEPARATOR, analyse_files, parse_or_except, write_reports
+import program_cache
+from program_cache import ProgramCache
+from synthetic_programs import wide_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+def write_test_pous(directory):
+    paths = []
+    for i in range(4):
+        path = directory / f"wide_{i}.pou"
+        path.write_text(wide_program(4 + i, 2, name=f"Wide_{i}"))
+        paths.append(str(path))
+    return paths
+
+
+def test_given_several_jobs_reports_are_identical_and_in_order(tmp_path):
+    files = write_test_pous(tmp_path)
+    sequential_reports = list(analyse_files(files, jobs=1))
+    parallel_reports = list(analyse_files(files, jobs=3))
+    assert parallel_reports == sequential_reports
+    assert [f"Num_Inputs: {4 + i}\n" in r for i, r in enumerate(parallel_reports)] == [True] * len(files)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_given_file_exceeding_timeout_it_is_skipped(tmp_path, monkeypatch, jobs):
+    if jobs > 1 and multiprocessing.get_start_method() != "fork":
+        pytest.skip("Worker processes only inherit the slow parse when forked")
+    files = write_test_pous(tmp_path)[:2]
+    parse_pou_file = batch_analysis_cli.parse_pou_file
+
+    def slow_parse(file_to_parse, **kwargs):
+        if file_to_parse == files[1]:
+            time.sleep(60)
+        return parse_pou_file(file_to_parse, **kwargs)
+
+    monkeypatch.setattr(batch_analysis_cli, "parse_pou_file", slow_parse)
+    # Leaves the other file enough time to be analysed by a fresh worker process, e.g. one loading language profiles
+    reports = list(analyse_files(files, jobs=jobs, timeout=2.0))
+    assert reports[0] is not None
+    assert reports[1] is None
+
+
+def test_given_timeout_during_cache_load_file_is_skipped_and_entry_kept(tmp_path, monkeypatch):
+    pou_file = write_test_pous(tmp_path)[0]
+    cache = ProgramCache(tmp_path / "cache")
+    assert parse_or_except(pou_file, cache=cache) is not None
+    entries = list(cache.cache_dir.iterdir())
+    assert len(entries) == 1
+
+    def slow_loads(data):
+        time.sleep(5)
+        return pickle.loads(data)
+
+    monkeypatch.setattr(program_cache.pickle, "loads", slow_loads)
+    assert parse_or_except(pou_file, cache=cache, timeout=0.2) is None
+    # Not swallowed by the cache as an unreadable entry, which would have been removed
+    assert list(cache.cache_dir.iterdir()) == entries
+
+
+def test_given_failing_file_remaining_reports_are_written(tmp_path):
+    files = write_test_pous(tmp_path)[:2]
+    broken_file = tmp_path / "broken.pou"
+    broken_file.write_text("PROGRAM Broken")
+    output = tmp_path / "report.txt"
+    write_reports(analyse_files([files[0], str(broken_file), files[1]], jobs=2), output)
+    reports = output.read_text(encoding="utf8").split(REPORT_SEPARATOR)
+    assert len(reports) == 2
+    assert "Num_Inputs: 4\n" in reports[0] and "Num_Inputs: 5\n" in reports[1]
+
+
+def test_cli_output_is_independent_of_number_of_jobs(tmp_path, monkeypatch):
+    write_test_pous(tmp_path)
+    outputs = []
+    for jobs in ["1", "2"]:
+        output = tmp_path / f"report_{jobs}.txt"
+        monkeypatch.setattr(sys, "argv", ["batch_analysis_cli.py", "--base-path", str(tmp_path),
+                                          "--output-report-path", str(output), "--jobs", jobs])
+        batch_analysis_cli.main()
+        outputs.append(output.read_text(encoding="utf8"))
+    assert outputs[0] == outputs[1]
+    assert outputs[0].count("Design Rule Report:") == 4
@@ -0,0 +1,173 @@
+import glob
+import os.path
+import subprocess
+import sys
+import time
+
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import (
+    CODE_PARSER_ANTLR,
+    CODE_PARSER_ANTLR_LISTENER,
+    CODE_PARSER_LXML,
+    clean_pou_string,
+    get_worksheets_from_input,
+    parse_code_worksheet,
+    parse_pou_content,
+)
+from AST.blocks import FBD_Block, VarBlock
+from synthetic_programs import diamond_lattice_program, large_program, wide_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(THIS_DIR))
+TEST_POU_FILES = sorted(
+    glob.glob(os.path.join(THIS_DIR, "**", "*.pou"), recursive=True)
+    + glob.glob(os.path.join(THIS_DIR, "..", "..", "checks", "test", "test_programs", "*.pou"))
+)
+# Stored as UTF-16 with a byte order mark, and not a complete POU
+NON_POU_FILES = ["xml_part.pou"]
+
+
+def code_sheet_of(pou_content):
+    _, code_sheet = get_worksheets_from_input(clean_pou_string(pou_content))
+    return code_sheet
+
+
+def assert_same_code_worksheet(code_sheet):
+    antlr_elements, antlr_id_map, antlr_lines, antlr_comments = parse_code_worksheet(code_sheet, CODE_PARSER_ANTLR)
+    for backend in [CODE_PARSER_ANTLR_LISTENER, CODE_PARSER_LXML]:
+        elements, id_map, lines, comments = parse_code_worksheet(code_sheet, backend)
+
+        # Blocks only compare their object data, so compare the full serialised form as well
+        assert [type(e) for e in elements] == [type(e) for e in antlr_elements]
+        assert [e.toJSON() for e in elements] == [e.toJSON() for e in antlr_elements]
+        assert {k: v.toJSON() for k, v in id_map.items()} == {k: v.toJSON() for k, v in antlr_id_map.items()}
+        assert lines == antlr_lines
+        assert comments == antlr_comments
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_all_backends_produce_same_code_worksheet(pou_file):
+    with open(pou_file) as f:
+        assert_same_code_worksheet(code_sheet_of(f.read()))
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [large_program(50), diamond_lattice_program(4), wide_program(12, 8)],
+    ids=["large", "diamonds", "wide"],
+)
+def test_given_synthetic_pou_all_backends_produce_same_code_worksheet(pou_content):
+    assert_same_code_worksheet(code_sheet_of(pou_content))
+
+
+def test_comment_content_keeps_markup_as_written():
+    content = code_sheet_of(
+        large_program(10).replace("<p style=\"\">Network 0</p>", "<p>A &lt;br /&gt; B<b class=\"x\" >bold</b><br /></p>")
+    )
+    assert_same_code_worksheet(content)
+    *_, comments = parse_code_worksheet(content, CODE_PARSER_LXML)
+    assert comments[0].content == 'A &lt;br /&gt; B<bclass="x">bold</b><br/>'
+
+
+@pytest.mark.parametrize(
+    "p_content",
+    [
+        "Say &quot;hi&quot; &amp; &apos;bye&apos;",
+        "Grad &#176; and &#x3A9;",
+        "<![CDATA[ a < b && c ]]> after",
+        "before <!-- a note --> after",
+        "<span class='x' title=\"it's\" >single &lt; double</span>",
+        "<b\n   class = \"x y\"\n>bold</b ><br\t/>",
+    ],
+    ids=["entities", "character references", "cdata", "xml comment", "quoted attributes", "whitespace in tags"],
+)
+def test_comment_content_is_the_same_text_in_all_backends(p_content):
+    content = code_sheet_of(large_program(10).replace("<p style=\"\">Network 0</p>", f"<p>{p_content}</p>"))
+    assert_same_code_worksheet(content)
+
+
+@pytest.mark.parametrize(
+    "expression, type_name, expected",
+    [
+        ("In&amp;0", '"AND&lt;2&gt;"', ("In&0", "AND<2>")),
+        ("In&#95;0<![CDATA[&x]]>", "'AND&#x41;'", ("In_0&x", "ANDA")),
+        ("In_0", '"AND\tOR"', ("In_0", "AND OR")),
+    ],
+    ids=["entities", "character references and cdata", "whitespace"],
+)
+def test_expressions_and_attributes_are_decoded_in_all_backends(expression, type_name, expected):
+    content = code_sheet_of(
+        large_program(10).replace("<expression>In_0</expression>", f"<expression>{expression}</expression>", 1)
+        .replace('typeName="AND"', f"typeName={type_name}", 1)
+    )
+    assert_same_code_worksheet(content)
+    elements, *_ = parse_code_worksheet(content, CODE_PARSER_LXML)
+    expr = next(e.expr for e in elements if isinstance(e, VarBlock))
+    block = next(e for e in elements if isinstance(e, FBD_Block))
+    assert (expr.expr, block.data.type) == expected
+
+
+def test_given_unknown_backend_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_code_worksheet(code_sheet_of(large_program(10)), "not_a_backend")
+
+
+def test_whole_program_analysis_is_independent_of_backend():
+    pou_content = wide_program(12, 8)
+    antlr_program = parse_pou_content(pou_content, code_parser=CODE_PARSER_ANTLR)
+    lxml_program = parse_pou_content(pou_content, code_parser=CODE_PARSER_LXML)
+    assert lxml_program.getBackwardTrace() == antlr_program.getBackwardTrace()
+    assert lxml_program.lines == antlr_program.lines
+    assert lxml_program.check_rules() == antlr_program.check_rules()
+
+
+# The peak RSS is read from /proc, as getrusage reports the peak of the forking process after an exec
+PEAK_RSS_SCRIPT = """
+import re, sys
+sys.path[0:0] = [sys.argv[1], sys.argv[2]]
+import draconis_parser
+from helper_functions import get_worksheets_from_input, parse_code_worksheet
+from synthetic_programs import large_program
+
+def peak_rss():
+    with open("/proc/self/status") as f:
+        return int(re.search(r"VmHWM:\\s*(\\d+) kB", f.read()).group(1))
+
+_, code_sheet = get_worksheets_from_input(large_program(int(sys.argv[4])))
+rss_before = peak_rss()
+parse_code_worksheet(code_sheet, sys.argv[3])
+print(peak_rss() - rss_before)
+"""
+
+
+def peak_rss_growth_of_parse(backend, nr_of_blocks):
+    """Growth of the peak resident set size, in kilobytes, of a fresh interpreter parsing a synthetic program"""
+    result = subprocess.run(
+        [sys.executable, "-c", PEAK_RSS_SCRIPT, THIS_DIR, REPO_ROOT, backend, str(nr_of_blocks)],
+        capture_output=True, text=True, check=True, cwd=THIS_DIR,
+    )
+    return int(result.stdout.split()[-1])
+
+
+def parse_times(code_sheet):
+    timings = {}
+    for backend in [CODE_PARSER_ANTLR, CODE_PARSER_ANTLR_LISTENER, CODE_PARSER_LXML]:
+        start = time.perf_counter()
+        parse_code_worksheet(code_sheet, backend)
+        timings[backend] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    for nr_of_blocks in [200, 2000]:
+        print(f"Code worksheet parse of {nr_of_blocks} blocks: {parse_times(code_sheet_of(large_program(nr_of_blocks)))}")
+        if os.path.exists("/proc/self/status"):
+            growth = {b: peak_rss_growth_of_parse(b, nr_of_blocks) for b in [CODE_PARSER_ANTLR, CODE_PARSER_ANTLR_LISTENER]}
+            print(f"Peak RSS growth (kB) during code worksheet parse of {nr_of_blocks} blocks: {growth}")
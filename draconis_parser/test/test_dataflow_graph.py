@@ -0,0 +1,127 @@
+import os.path
+import sys
+
+import networkx
+import pytest
+
+from draconis_parser import DataflowDirection, DataflowGraph, PathDivide
+from AST.dataflow_graph import NODE_BLOCK, NODE_IN_VARIABLE, NODE_OUT_VARIABLE
+from checks.graph_utilities import graph_from_program, islands_from_graph, islands_from_program
+from .test_programanalysis import programs
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content
+from synthetic_programs import chain_program, feedback_program, wide_program
+
+
+def edges_by_id(graph: DataflowGraph):
+    return {
+        (graph.node_ids[i], graph.node_ids[j])
+        for i in range(len(graph))
+        for j in graph.successors(i)
+    }
+
+
+def block_ids(graph: DataflowGraph):
+    return set(graph.ids(graph.nodes_of_kind(NODE_BLOCK)))
+
+
+def test_graph_is_built_after_parsing(programs):
+    graph = programs["Calc_Even"].dataflow_graph
+    assert isinstance(graph, DataflowGraph)
+    # Inports 3 and 4 flow over the ports 6 and 7 of block 9, out of its port 8 into outport 5
+    assert edges_by_id(graph) == {(3, 6), (4, 7), (6, 9), (7, 9), (9, 8), (8, 5)}
+    assert set(graph.ids(graph.nodes_of_kind(NODE_IN_VARIABLE))) == {3, 4}
+    assert set(graph.ids(graph.nodes_of_kind(NODE_OUT_VARIABLE))) == {5}
+
+
+def test_predecessors_are_the_reversed_edges(programs):
+    graph = programs["MultiAND"].dataflow_graph
+    reversed_edges = {
+        (graph.node_ids[j], graph.node_ids[i])
+        for i in range(len(graph))
+        for j in graph.predecessors(i)
+    }
+    assert reversed_edges == edges_by_id(graph)
+
+
+@pytest.mark.parametrize("name", ["Calc_Even", "MultiAND", "SingleIn_MultiOut", "feedback_example"])
+def test_backward_reachable_nodes_match_backward_trace(programs, name):
+    program = programs[name]
+    graph = program.dataflow_graph
+    for out_block in [b for b in program.behaviourElements if b.data.type == "outVariable"]:
+        trace = PathDivide.unpack_pathlist([program.getBackwardTrace()[out_block.getVarExpr()]])
+        reached = graph.reachable([graph.index_of[out_block.getID()]], DataflowDirection.Backward)
+        assert set(graph.ids(reached)) - block_ids(graph) == {e for path in trace for e in path}
+
+
+@pytest.mark.parametrize("name", ["MultiAND", "feedback_example"])
+def test_islands_match_islands_of_traces(programs, name):
+    program = programs[name]
+    graph = program.dataflow_graph
+    expected = sorted(sorted(island) for island in islands_from_graph(graph_from_program(program)).values())
+    actual = sorted(sorted(set(graph.ids(island)) - block_ids(graph)) for island in graph.islands())
+    assert actual == expected
+    assert sorted(sorted(island) for island in islands_from_program(program).values()) == expected
+
+
+def test_traversal_can_stop_at_nodes(programs):
+    graph = programs["Calc_Even"].dataflow_graph
+    block = graph.index_of[9]
+    reached = graph.reachable([graph.index_of[3]], DataflowDirection.Forward, stop=lambda i: i == block)
+    assert graph.ids(reached) == [3, 6, 9]
+
+
+def test_synthetic_programs_are_acyclic_and_sizes_are_linear():
+    program = parse_pou_content(chain_program(200))
+    graph = program.dataflow_graph
+    assert not graph.has_cycle()
+    # Per block: a block node, an input and output port, and three edges
+    assert len(graph) == 3 * 200 + 2
+    assert graph.nr_of_edges() == 3 * 200 + 1
+    wide = parse_pou_content(wide_program(16, 4)).dataflow_graph
+    assert len(wide.islands()) >= 1 and not wide.has_cycle()
+
+
+def test_cycles_are_detected():
+    # 0 -> 1 -> 2 -> 0
+    graph = DataflowGraph([10, 11, 12], [NODE_BLOCK] * 3, [0, 1, 2], [(0, 1), (1, 2), (2, 0)])
+    assert graph.has_cycle()
+    assert graph.reachable([1]) == [1, 2, 0]
+
+
+def test_deferred_code_worksheet_builds_graph_on_use():
+    program = parse_pou_content(wide_program(4, 2), interface_only=True)
+    assert not program.is_code_worksheet_loaded()
+    assert isinstance(program.dataflow_graph, DataflowGraph)
+    assert len(program.dataflow_graph) > 0
+
+
+def test_strongly_connected_components_are_in_reverse_topological_order():
+    # 0 -> 1 <-> 2 -> 3 -> 3, and 4 alone
+    graph = DataflowGraph([10, 11, 12, 13, 14], [NODE_BLOCK] * 5, [0, 1, 2, 3, 4],
+                          [(0, 1), (1, 2), (2, 1), (2, 3), (3, 3)])
+    assert graph.strongly_connected_components() == [[3], [1, 2], [0], [4]]
+    assert graph.cycles() == [[1, 2], [3]]
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [chain_program(50), wide_program(12, 6), feedback_program(3, 1), feedback_program(4, 7)],
+    ids=["chain", "wide", "self_loops", "loops"],
+)
+def test_strongly_connected_components_match_networkx(pou_content):
+    graph = parse_pou_content(pou_content).dataflow_graph
+    nx_graph = networkx.DiGraph()
+    nx_graph.add_nodes_from(range(len(graph)))
+    nx_graph.add_edges_from((i, j) for i in range(len(graph)) for j in graph.successors(i))
+    expected = sorted(sorted(c) for c in networkx.strongly_connected_components(nx_graph))
+    assert sorted(graph.strongly_connected_components()) == expected
+    assert graph.has_cycle() == bool(graph.cycles())
+
+
+def test_deep_loop_does_not_hit_recursion_limit():
+    length = sys.getrecursionlimit()
+    graph = DataflowGraph(list(range(length)), [NODE_BLOCK] * length, list(range(length)),
+                          [(i, (i + 1) % length) for i in range(length)])
+    assert graph.cycles() == [list(range(length))]
@@ -0,0 +1,75 @@
+import os.path
+import sys
+
+import pytest
+
+from draconis_parser import DependencyMatrix, PathDivide
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_LXML, parse_pou_content, parse_pou_file
+from synthetic_programs import SyntheticPOU, chain_program, diamond_lattice_program, large_program, wide_program
+from test_backward_trace import NON_POU_FILES, TEST_POU_FILES, UNCONNECTABLE_FILES
+
+
+def dependencies_from_traces(program):
+    return {
+        name: {program.behaviour_id_map[s].getVarExpr() for s in PathDivide.sources([paths])}
+        for name, paths in program.getBackwardTrace().items()
+    }
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES + UNCONNECTABLE_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_matrix_matches_sources_of_traces(pou_file):
+    program = parse_pou_file(pou_file)
+    actual = {name: set(deps) for name, deps in program.getDependencyPathsByName().items()}
+    assert actual == dependencies_from_traces(program)
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [chain_program(20), diamond_lattice_program(5), wide_program(12, 6), large_program(40)],
+    ids=["chain", "diamonds", "wide", "large"],
+)
+def test_given_synthetic_pou_matrix_matches_sources_of_traces(pou_content):
+    program = parse_pou_content(pou_content)
+    actual = {name: set(deps) for name, deps in program.getDependencyPathsByName().items()}
+    assert actual == dependencies_from_traces(program)
+
+
+def test_columns_follow_variable_sheet_with_constants_last():
+    program = parse_pou_content(large_program(20))
+    matrix = program.getDependencyMatrix()
+    assert isinstance(matrix, DependencyMatrix)
+    assert matrix.sources[:4] == ["In_0", "In_1", "Out_0", "Out_1"]
+    assert matrix.sources[-1] == "BOOL#1"
+    assert program.getDependencyPathsByName() == {"Out_0": ["In_0", "BOOL#1"], "Out_1": ["In_1", "BOOL#1"]}
+    assert program.get_dependencies_names() == {"Out_0": ["In_0"], "Out_1": ["In_1"]}
+
+
+def test_queries_in_both_directions():
+    matrix = parse_pou_content(wide_program(6, 3, fan_in=2)).getDependencyMatrix()
+    assert matrix.depends_on("Out_1", "In_2") and not matrix.depends_on("Out_1", "In_3")
+    assert not matrix.depends_on("Out_1", "Unknown")
+    assert matrix.outputs_of("In_1") == ["Out_0", "Out_1"]
+    assert matrix.used_sources() == ["In_0", "In_1", "In_2", "In_3"]
+
+
+def test_unused_variables_are_found_from_matrix():
+    pou = SyntheticPOU("Unused")
+    pou.add_variable("VAR_INPUT", "In_1", description="Used input")
+    pou.add_variable("VAR_INPUT", "In_2", description="Unused input")
+    pou.add_variable("VAR_OUTPUT", "Out_1", description="An output")
+    pou.out_variable("Out_1", pou.block("AND", [pou.in_variable("In_1"), pou.in_variable("BOOL#1")])[0])
+    program = parse_pou_content(pou.render())
+    [unused_rule] = [r for r in program.check_rules() if r[0] == "FBD.Variable.UnusedVariables"]
+    assert unused_rule[1] == "Fail"
+    assert unused_rule[2] == "The following variables are unused:\nIn_2"
+
+
+def test_wide_diamond_lattice_dependencies_need_no_path_enumeration():
+    program = parse_pou_content(diamond_lattice_program(200), code_parser=CODE_PARSER_LXML)
+    assert program.get_dependencies_names() == {"Out_0": ["In_0"]}
@@ -0,0 +1,163 @@
+import os.path
+import pickle
+import sys
+
+import pytest
+
+from draconis_parser import AnalysisContext, Program
+from AST.design_rules import ARTIFACTS, RULES, SYMBOL_LENGTH_LIMITS, check_variable_naming_uniqueness, design_rule
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content
+from synthetic_programs import SyntheticPOU, wide_program
+from test_analysis_cache import count_calls
+
+REPORT_ORDER = [
+    "FBD.MetricRule.TooManyInterfaceVariables",
+    "FBD.DataFlow.SafenessProperty",
+    "FBD.Variables.GroupCohesion",
+    "FBD.Variables.GroupStructure",
+    "FBD.Naming.Uniqueness",
+    "FBD.Variable.UnusedVariables",
+    "FBD.Variables.Initialization",
+    "FBD.DesignRule.VariableDescriptionLang",
+    "FBD.DesignRule.CommentLang",
+]
+
+
+@pytest.fixture
+def program():
+    return parse_pou_content(wide_program(6, 3))
+
+
+def test_rules_are_reported_in_registry_order(program):
+    assert list(RULES) == REPORT_ORDER
+    assert [r[0] for r in program.check_rules()] == REPORT_ORDER
+    assert all(set(RULES[n].artifacts) <= set(ARTIFACTS) for n in RULES)
+
+
+def test_subset_of_rules_gives_the_same_verdicts(program):
+    report = {r[0]: r for r in parse_pou_content(wide_program(6, 3)).check_rules()}
+    subset = ["FBD.Variable.UnusedVariables", "FBD.Variables.GroupStructure"]
+    assert program.check_rules(subset) == [report[n] for n in subset]
+    assert program.check_rules() == list(report.values())
+
+
+def test_only_the_artifacts_of_selected_rules_are_computed(program, monkeypatch):
+    metrics_calls = count_calls(monkeypatch, "getMetrics")
+    matrix_calls = count_calls(monkeypatch, "getDependencyMatrix")
+    program.check_rules(["FBD.Variables.GroupStructure", "FBD.Naming.Uniqueness"])
+    assert metrics_calls == [] and matrix_calls == []
+
+    program.check_rules(["FBD.Variable.UnusedVariables"])
+    program.check_rules()
+    assert len(metrics_calls) == 1 and len(matrix_calls) == 1
+
+
+def test_concurrent_evaluation_gives_the_same_report(program):
+    sequential = parse_pou_content(wide_program(6, 3)).check_rules()
+    assert program.check_rules(jobs=4) == sequential
+
+
+def test_artifacts_are_computed_before_rules_are_evaluated_concurrently(program, monkeypatch):
+    matrix_calls = count_calls(monkeypatch, "getDependencyMatrix")
+    evaluating = []
+    monkeypatch.setitem(RULES, "FBD.Test.Artifacts", None)
+
+    @design_rule("FBD.Test.Artifacts", "variables")
+    def record_artifacts(variables):
+        evaluating.append(set(context._artifacts))
+        return ["FBD.Test.Artifacts", "Pass", ""]
+
+    context = AnalysisContext(program)
+    context.evaluate_rules(REPORT_ORDER + ["FBD.Test.Artifacts"], jobs=4)
+    assert evaluating == [set(ARTIFACTS)]
+    assert len(matrix_calls) == 1
+
+
+def test_context_is_shared_until_invalidated(program):
+    context = program.getAnalysisContext()
+    [verdict] = program.check_rules(["FBD.Variables.GroupCohesion"])
+    assert context.evaluate("FBD.Variables.GroupCohesion") is verdict
+    program.invalidate()
+    assert program.getAnalysisContext() is not context
+
+
+def test_checked_program_can_be_pickled(program):
+    report = program.check_rules()
+    loaded = pickle.loads(pickle.dumps(program))
+    assert loaded.check_rules() == report
+    assert loaded.check_rules(jobs=4) == report
+    loaded.invalidate()
+    assert loaded.check_rules() == report
+
+
+def test_unknown_rules_and_artifacts_are_rejected(program):
+    with pytest.raises(ValueError):
+        program.check_rules(["FBD.NoSuchRule"])
+    with pytest.raises(ValueError):
+        design_rule("FBD.Test.UnknownArtifact", "no_such_artifact")
+
+
+def test_registered_rule_is_evaluated_with_its_artifacts(program, monkeypatch):
+    monkeypatch.setitem(RULES, "FBD.Test.Comments", None)
+
+    @design_rule("FBD.Test.Comments", "comments", "variables")
+    def count_comments(comments, variables):
+        return ["FBD.Test.Comments", "Pass", f"{len(comments)} comments, {len(variables)} variables"]
+
+    context = AnalysisContext(program)
+    assert context.evaluate("FBD.Test.Comments") == ["FBD.Test.Comments", "Pass", "0 comments, 9 variables"]
+    assert isinstance(context.program, Program)
+
+
+
+GERMAN = "Die Eingangsspannung wird vom Sensor gemessen und an die Steuerung weitergegeben"
+
+
+def pou_with(variables, comments=()):
+    pou = SyntheticPOU("Reported")
+    for kind, name, description in variables:
+        pou.add_variable(kind, name, description=description)
+    pou.out_variable("Out", pou.in_variable(variables[0][1]))
+    pou.add_variable("VAR_OUTPUT", "Out", description="The output of the pump")
+    for comment in comments:
+        pou.add_comment(comment)
+    return parse_pou_content(pou.render())
+
+
+# Reports of the rules before they were moved into the registry, except for the descriptions which are not in
+# English: these used to be looked up among all variables instead of the described ones
+BASELINE_REPORTS = [
+    (lambda: pou_with([("VAR_INPUT", "In1", None), ("VAR_INPUT", "In2", "The input of the pump"),
+                       ("VAR_INPUT", "In3", GERMAN)]),
+     ["FBD.DesignRule.VariableDescriptionLang", "Fail",
+      "The following variables have descriptions that are not in english:\n" + GERMAN]),
+    (lambda: pou_with([("VAR_INPUT", "In1", "The input of the pump")], ["The speed of the pump is set here", GERMAN]),
+     ["FBD.DesignRule.CommentLang", "Fail",
+      "The following variables have descriptions that are not in english:\n" + GERMAN]),
+    (lambda: pou_with([("VAR_INPUT", "In1", "The input of the pump")]),
+     ["FBD.Naming.Uniqueness", "Pass", "The variable names are suitably unique to be told apart by compilers"]),
+]
+
+
+@pytest.mark.parametrize("program, report", BASELINE_REPORTS, ids=["descriptions", "comments", "naming"])
+def test_rule_reports_are_unchanged(program, report):
+    assert program().check_rules([report[0]]) == [report]
+
+
+def test_descriptions_not_in_english_are_reported_among_undescribed_variables():
+    program = pou_with([("VAR_INPUT", "In1", None), ("VAR_INPUT", "In2", GERMAN), ("VAR_INPUT", "In3", None)])
+    assert program.check_rules(["FBD.DesignRule.VariableDescriptionLang"]) == [
+        ["FBD.DesignRule.VariableDescriptionLang", "Fail",
+         "The following variables have descriptions that are not in english:\n" + GERMAN]
+    ]
+
+
+def test_naming_uniqueness_check_is_unchanged():
+    program = pou_with([("VAR_INPUT", "A_very_long_input_variable_name_1", None),
+                        ("VAR_INPUT", "A_very_long_input_variable_name_2", None)])
+    assert check_variable_naming_uniqueness(program.varHeader.getAllVariables(), SYMBOL_LENGTH_LIMITS) == [
+        "Compilers supporting symbol table entry lengths of 30 or less would be unable to tell some of these names apart",
+        ["A_very_long_input_variable_name_1", "A_very_long_input_variable_name_2"],
+    ]
@@ -0,0 +1,254 @@
+import os.path
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+import edit_time_analys_cli
+from edit_time_analys_cli import AnalysisQueue, EditTimeAnalysisWatchDog, reanalyse
+from helper_functions import CODE_PARSER_ANTLR_LISTENER, CODE_PARSER_LXML, parse_pou_content
+from synthetic_programs import feedback_program, large_program, wide_program
+
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError("Worksheet should not have been parsed again")
+
+
+def assert_same_analysis(program, pou_content):
+    full_program = parse_pou_content(pou_content)
+    assert program.getBackwardTrace() == full_program.getBackwardTrace()
+    assert program.check_rules() == full_program.check_rules()
+    assert program == full_program
+
+
+def test_first_analysis_has_no_changes_and_is_rendered():
+    update = reanalyse(None, wide_program(6, 3))
+    assert update.changes is None
+    assert update.header_changed and update.code_changed and update.graphics_changed
+
+
+def test_given_unchanged_file_nothing_is_parsed(monkeypatch):
+    pou_content = wide_program(6, 3)
+    previous = reanalyse(None, pou_content).analysed_file
+    monkeypatch.setattr(edit_time_analys_cli, "parse_variable_worksheet", fail_if_called)
+    monkeypatch.setattr(edit_time_analys_cli, "parse_code_worksheet", fail_if_called)
+    update = reanalyse(previous, pou_content)
+    assert update.changes == []
+    assert not (update.header_changed or update.code_changed or update.graphics_changed)
+
+
+def test_given_header_change_only_header_is_parsed(monkeypatch):
+    pou_content = wide_program(6, 3)
+    previous = reanalyse(None, pou_content).analysed_file
+    previous.program.getBackwardTrace()
+    new_content = pou_content.replace("(*Input number 2*)", "(*Renamed input*)")
+
+    monkeypatch.setattr(edit_time_analys_cli, "parse_code_worksheet", fail_if_called)
+    update = reanalyse(previous, new_content)
+    assert update.header_changed and not update.code_changed and not update.graphics_changed
+    assert any("Renamed input" in c for c in update.changes)
+    assert update.analysed_file.program.backward_flow is previous.program.backward_flow
+    monkeypatch.undo()
+    assert_same_analysis(update.analysed_file.program, new_content)
+
+
+def test_analyses_of_the_unchanged_worksheet_are_carried_over():
+    pou_content = feedback_program(3, 4)
+    previous = reanalyse(None, pou_content).analysed_file
+    loops, block_boxes = previous.program.getLoops(), previous.program.getBlockBoxes()
+    var_info = previous.program.getVarInfo()
+
+    header_update = reanalyse(previous, pou_content.replace("(*Loop 0 input*)", "(*Renamed input*)"))
+    program = header_update.analysed_file.program
+    assert header_update.header_changed and not header_update.code_changed
+    assert program.getLoops() is loops and program.getBlockBoxes() is block_boxes
+    assert program.getVarInfo() is not var_info
+
+    block_position = '<position x="300" y="10" />'
+    code_update = reanalyse(previous, pou_content.replace(block_position, '<position x="320" y="10" />'))
+    program = code_update.analysed_file.program
+    assert code_update.code_changed and not code_update.header_changed
+    assert program.getVarInfo() is var_info
+    assert program.getBlockBoxes() is not block_boxes
+
+
+def test_given_moved_block_code_is_parsed_and_rendered(monkeypatch):
+    pou_content = wide_program(6, 3)
+    previous = reanalyse(None, pou_content).analysed_file
+    block_position = '<position x="300" y="10" />'
+    assert pou_content.count(block_position) == 1
+    new_content = pou_content.replace(block_position, '<position x="320" y="10" />')
+
+    monkeypatch.setattr(edit_time_analys_cli, "parse_variable_worksheet", fail_if_called)
+    update = reanalyse(previous, new_content)
+    assert update.code_changed and not update.header_changed and update.graphics_changed
+    assert any("moved" in c for c in update.changes)
+    monkeypatch.undo()
+    assert_same_analysis(update.analysed_file.program, new_content)
+
+
+def test_stale_analysis_is_cancelled_between_parses(monkeypatch):
+    checks = []
+
+    def becomes_stale_after_header_parse():
+        checks.append(True)
+        return len(checks) < 2
+
+    monkeypatch.setattr(edit_time_analys_cli, "parse_code_worksheet", fail_if_called)
+    assert reanalyse(None, wide_program(6, 3), is_current=becomes_stale_after_header_parse) is None
+    monkeypatch.setattr(edit_time_analys_cli, "parse_variable_worksheet", fail_if_called)
+    assert reanalyse(None, wide_program(6, 3), is_current=lambda: False) is None
+
+
+def test_code_worksheet_is_parsed_with_the_backend_of_a_full_parse(monkeypatch):
+    backends = []
+    parse = edit_time_analys_cli.parse_code_worksheet
+    monkeypatch.setattr(edit_time_analys_cli, "parse_code_worksheet",
+                        lambda code_sheet, backend: backends.append(backend) or parse(code_sheet, backend))
+    pou_content = wide_program(6, 3)
+    reanalyse(None, pou_content)
+    reanalyse(None, pou_content, code_parser=CODE_PARSER_LXML)
+    assert backends == [CODE_PARSER_ANTLR_LISTENER, CODE_PARSER_LXML]
+
+
+def test_given_code_change_without_graphical_effect_nothing_is_rendered():
+    pou_content = wide_program(6, 3)
+    previous = reanalyse(None, pou_content).analysed_file
+    new_content = pou_content.replace('<fbData fbFuType="1" />', '<fbData fbFuType="2" />')
+    update = reanalyse(previous, new_content)
+    assert update.code_changed and not update.graphics_changed
+
+
+def test_watchdog_keeps_latest_version_and_renders_only_graphical_changes(tmp_path, monkeypatch):
+    rendered = []
+    monkeypatch.setattr(edit_time_analys_cli, "generate_image_of_program", lambda p, path, scale: rendered.append(path))
+    pou_file = tmp_path / "wide.pou"
+    pou_content = wide_program(6, 3)
+    pou_file.write_text(pou_content)
+    watchdog = EditTimeAnalysisWatchDog()
+
+    watchdog.analyse_file(str(pou_file))
+    pou_file.write_text(pou_content.replace("(*Input number 2*)", "(*Renamed input*)"))
+    header_update = watchdog.analyse_file(str(pou_file))
+    pou_file.write_text(pou_content.replace("(*Input number 2*)", "(*Renamed again*)"))
+    second_header_update = watchdog.analyse_file(str(pou_file))
+
+    assert len(rendered) == 1
+    assert any("Renamed input" in c for c in header_update.changes)
+    # Compared against the latest version, not the first one
+    assert any("Renamed again" in c for c in second_header_update.changes)
+    assert not any("Input number 2" in c for c in second_header_update.changes)
+    watchdog.stop()
+
+
+class RecordingAnalysis:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path, is_current):
+        with self.lock:
+            self.calls.append(path)
+
+
+def test_burst_of_events_for_a_file_is_analysed_once():
+    analysis = RecordingAnalysis()
+    queue = AnalysisQueue(analysis, debounce_seconds=0.05, max_workers=2)
+    for _ in range(20):
+        queue.submit("a.pou")
+    queue.submit("b.pou")
+    time.sleep(0.1)
+    assert queue.wait_until_idle(timeout=5)
+    queue.stop()
+    assert sorted(analysis.calls) == ["a.pou", "b.pou"]
+
+
+def test_submit_does_not_wait_for_running_analysis():
+    release = threading.Event()
+    finished = threading.Event()
+
+    def analyse(path, is_current):
+        release.wait(5)
+        finished.set()
+
+    queue = AnalysisQueue(analyse, debounce_seconds=0.0, max_workers=1)
+    queue.submit("a.pou")
+    time.sleep(0.05)
+    for i in range(50):
+        queue.submit(f"{i}.pou")
+    # The submits returned while the first analysis is still blocked
+    assert not finished.is_set()
+    release.set()
+    assert queue.wait_until_idle(timeout=5)
+    queue.stop()
+
+
+def test_newer_save_makes_running_analysis_stale_and_is_analysed_afterwards():
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def analyse(path, is_current):
+        if not results:
+            started.set()
+            release.wait(5)
+        results.append(is_current())
+
+    queue = AnalysisQueue(analyse, debounce_seconds=0.0, max_workers=2)
+    queue.submit("a.pou")
+    assert started.wait(5)
+    queue.submit("a.pou")
+    # The second analysis of the file must not start while the first one is still running
+    time.sleep(0.05)
+    assert results == []
+    release.set()
+    assert queue.wait_until_idle(timeout=5)
+    queue.stop()
+    assert results == [False, True]
+
+
+def test_watchdog_discards_stale_analysis(tmp_path, monkeypatch):
+    rendered = []
+    monkeypatch.setattr(edit_time_analys_cli, "generate_image_of_program", lambda p, path, scale: rendered.append(path))
+    pou_file = tmp_path / "wide.pou"
+    pou_file.write_text(wide_program(6, 3))
+    watchdog = EditTimeAnalysisWatchDog()
+    watchdog.stop()
+
+    assert watchdog.analyse_file(str(pou_file), is_current=lambda: False) is None
+    assert watchdog.analysed_files == {} and rendered == []
+
+
+def test_watchdog_analyses_modified_files_in_background(tmp_path, monkeypatch):
+    rendered = []
+    monkeypatch.setattr(edit_time_analys_cli, "generate_image_of_program", lambda p, path, scale: rendered.append(path))
+    pou_file = tmp_path / "wide.pou"
+    pou_file.write_text(wide_program(6, 3))
+    watchdog = EditTimeAnalysisWatchDog(debounce_seconds=0.05)
+
+    class Event:
+        src_path = str(pou_file)
+
+    for _ in range(5):
+        watchdog.on_modified(Event())
+    time.sleep(0.1)
+    assert watchdog.queue.wait_until_idle(timeout=30)
+    watchdog.stop()
+    assert list(watchdog.analysed_files) == [str(pou_file)]
+    assert len(rendered) == 1
+
+
+if __name__ == "__main__":
+    for nr_of_blocks in [500, 5000]:
+        pou_content = large_program(nr_of_blocks)
+        previous = reanalyse(None, pou_content).analysed_file
+        new_content = pou_content.replace("(*Network 3 input*)", "(*Changed*)")
+        start = time.perf_counter()
+        reanalyse(previous, new_content)
+        incremental_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reanalyse(None, new_content)
+        full_time = time.perf_counter() - start
+        print(f"Re-analysis of {nr_of_blocks} blocks after header change: {incremental_time:.3f}s, full: {full_time:.3f}s")
@@ -0,0 +1,71 @@
+import os.path
+import sys
+
+import pytest
+
+from draconis_parser import DataflowDirection, PathDivide
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_LXML, parse_pou_content
+from synthetic_programs import SyntheticPOU, feedback_program, wide_program
+
+
+def test_loops_and_their_blocks_are_exposed():
+    program = parse_pou_content(feedback_program(2, 3))
+    # Per loop: the ring of 3 blocks, with their output ports and the input ports on the ring
+    assert [len(loop) for loop in program.getLoops()] == [9, 9]
+    looped_back_blocks = program.getLoopedBackBlocks()
+    assert [len(blocks) for blocks in looped_back_blocks] == [3, 3]
+    all_blocks = {b.getID() for b in program.behaviourElements if b.getBlockType() != "Port"}
+    assert set(looped_back_blocks[0] + looped_back_blocks[1]) == all_blocks
+    assert parse_pou_content(wide_program(6, 3)).getLoopedBackBlocks() == []
+
+
+@pytest.mark.parametrize("loop_length", [1, 3])
+def test_trace_steps_over_loop_to_its_inputs(loop_length):
+    program = parse_pou_content(feedback_program(1, loop_length))
+    [in_variable] = [b for b in program.behaviourElements if b.getBlockType() == "Port" and b.getVarExpr() == "In_0"]
+    [out_variable] = [b for b in program.behaviourElements if b.getBlockType() == "Port" and b.getVarExpr() == "Out_0"]
+    [[(input_port, source)]] = {tuple(inputs) for inputs in program.getLoopInputs().values()}
+    assert source == in_variable.getID()
+
+    trace = program.getBackwardTrace()["Out_0"]
+    assert trace[0] == out_variable.getID()
+    assert trace[-2:] == [input_port, source]
+    assert all(not isinstance(e, PathDivide) for e in trace)
+    assert program.getTrace(DataflowDirection.Forward) == {"In_0": [list(reversed(trace))]}
+    assert program.getDependencyPathsByName() == {"Out_0": ["In_0"]}
+
+
+def test_loop_with_several_inputs_divides_the_trace():
+    pou = SyntheticPOU("TwoInputLoop")
+    for name in ["In_0", "In_1"]:
+        pou.add_variable("VAR_INPUT", name, description="Loop input")
+    pou.add_variable("VAR_OUTPUT", "Out_0", description="Loop output")
+    in_0, in_1 = pou.in_variable("In_0"), pou.in_variable("In_1")
+    feedback = pou.next_block_outputs([2, 2])[-1]
+    first = pou.block("AND", [in_0, feedback])[0]
+    pou.out_variable("Out_0", pou.block("OR", [first, in_1])[0])
+    program = parse_pou_content(pou.render())
+
+    assert len(program.getLoopedBackBlocks()) == 1
+    paths = list(PathDivide.iter_paths([program.getBackwardTrace()["Out_0"]]))
+    assert [p[-1] for p in paths] == [in_0[0], in_1[0]]
+    assert program.getDependencyPathsByName() == {"Out_0": ["In_0", "In_1"]}
+
+
+def test_trace_is_independent_of_the_order_of_tracing():
+    program = parse_pou_content(feedback_program(3, 4))
+    full_trace = program.getBackwardTrace()
+    for name in full_trace:
+        [out_variable] = [b for b in program.behaviourElements
+                          if b.getBlockType() == "Port" and b.getVarExpr() == name]
+        assert program.performBackTraceFromBlock(out_variable.getID()) == full_trace[name]
+
+
+def test_many_long_loops_are_traced():
+    program = parse_pou_content(feedback_program(100, 100), code_parser=CODE_PARSER_LXML)
+    trace = program.getBackwardTrace()
+    assert len(program.getLoopedBackBlocks()) == 100
+    assert all(len(t) == 4 for t in trace.values())
+    assert program.get_dependencies_names() == {f"Out_{n}": [f"In_{n}"] for n in range(100)}
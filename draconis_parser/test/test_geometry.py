@@ -0,0 +1,98 @@
+import logging
+import os.path
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+from draconis_parser import BoxTable, LineTable, Point, Rectangle
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_ANTLR, CODE_PARSER_LXML, parse_pou_content, parse_pou_file
+from synthetic_programs import large_program, wide_program
+from test_backward_trace import NON_POU_FILES, TEST_POU_FILES, UNCONNECTABLE_FILES
+
+
+def loop_extent(program, min_size=100):
+    """The extent as it was computed over Point objects, kept as the reference"""
+    width, height = min_size, min_size
+    for b in program.behaviourElements:
+        width, height = max(width, b.data.boundary_box.bot_right.x), max(height, b.data.boundary_box.bot_right.y)
+    for s_p, e_p in program.lines:
+        width, height = max(width, s_p.x, e_p.x), max(height, s_p.y, e_p.y)
+    for c in program.comments:
+        width, height = max(width, c.bounding_box.bot_right.x), max(height, c.bounding_box.bot_right.y)
+    return Point(width, height)
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES + UNCONNECTABLE_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_extent_is_identical_to_loop(pou_file):
+    program = parse_pou_file(pou_file)
+    assert isinstance(program.lines, LineTable)
+    assert program.getExtent(100) == loop_extent(program)
+
+
+def test_lines_are_point_pairs_in_model_space():
+    program = parse_pou_content(wide_program(3, 2), code_parser=CODE_PARSER_LXML)
+    assert program.lines == parse_pou_content(wide_program(3, 2), code_parser=CODE_PARSER_ANTLR).lines
+    start, end = program.lines[0]
+    assert program.lines.coordinates[:4].tolist() == [start.x, start.y, end.x, end.y]
+    assert program.lines == [(s, e) for s, e in program.lines]
+    assert LineTable.fromPoints(program.lines) == program.lines
+    assert program.lines.scaled(3)[-1] == tuple(Point(p.x * 3, p.y * 3) for p in program.lines[-1])
+    with pytest.raises(IndexError):
+        program.lines[len(program.lines)]
+
+
+def test_program_with_list_of_lines_gets_a_line_table():
+    program = parse_pou_content(wide_program(3, 2))
+    lines = list(program.lines)
+    program.lines = lines
+    program.post_parsing_analysis()
+    assert program.lines == [(Point(s.x * 2, s.y * 2), Point(e.x * 2, e.y * 2)) for s, e in lines]
+
+
+def test_block_boxes_are_rectangles_by_id():
+    program = parse_pou_content(wide_program(3, 2))
+    boxes = program.getBlockBoxes()
+    for block in program.behaviourElements:
+        assert boxes[boxes.row_of[block.getID()]] == block.getBoundingBox()
+    assert boxes.boundingBox(range(len(boxes))) == Rectangle.fromTuple(
+        min(b.top_left.x for b in boxes), min(b.top_left.y for b in boxes),
+        max(b.bot_right.x for b in boxes), max(b.bot_right.y for b in boxes),
+    )
+    assert BoxTable().extent() is None and LineTable().extent() is None
+
+
+def test_malformed_coordinates_are_rejected():
+    with pytest.raises(ValueError):
+        LineTable([1, 2, 3])
+
+
+def scale_and_measure(lines):
+    if isinstance(lines, LineTable):
+        scaled = lines.scaled(2)
+        return scaled, scaled.extent()
+    scaled = [(Point(s.x * 2, s.y * 2), Point(e.x * 2, e.y * 2)) for s, e in lines]
+    return scaled, Point(max(max(s.x, e.x) for s, e in scaled), max(max(s.y, e.y) for s, e in scaled))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    program = parse_pou_content(large_program(20000), code_parser=CODE_PARSER_LXML)
+    point_lines = list(program.lines)
+    for name, lines in [("Point pairs", point_lines), ("LineTable", program.lines)]:
+        start = time.perf_counter()
+        scale_and_measure(lines)
+        duration = time.perf_counter() - start
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        scaled, extent = scale_and_measure(lines)
+        memory = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        print(f"{name}: {len(lines)} lines scaled and measured in {duration:.4f}s, {memory / len(lines):.1f} bytes per line")
@@ -0,0 +1,100 @@
+import os.path
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+import helper_functions
+from helper_functions import parse_pou_content, parse_pou_file, parse_pou_interface
+from synthetic_programs import wide_program
+from AST.program import extract_from_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+TEST_POU = os.path.join(THIS_DIR, "Collatz_Calculator_Odd", "Collatz_Calculator_Odd.pou")
+
+
+def count_code_worksheet_parses(monkeypatch):
+    calls = []
+    parse_code_worksheet = helper_functions.parse_code_worksheet
+
+    def counting_parse(*args):
+        calls.append(args)
+        return parse_code_worksheet(*args)
+
+    monkeypatch.setattr(helper_functions, "parse_code_worksheet", counting_parse)
+    return calls
+
+
+def test_given_interface_parse_variable_queries_do_not_parse_code_worksheet(monkeypatch):
+    calls = count_code_worksheet_parses(monkeypatch)
+    full_program = parse_pou_file(TEST_POU)
+    calls.clear()
+    program = parse_pou_file(TEST_POU, interface_only=True)
+
+    assert program.progName == full_program.progName
+    assert program.varHeader == full_program.varHeader
+    assert program.getVarInfo() == full_program.getVarInfo()
+    for value in ["__VarGroupNames__", "__InputVariables__", "__VariableNames__"]:
+        assert extract_from_program(value, program) == extract_from_program(value, full_program)
+    assert not program.is_code_worksheet_loaded()
+    assert calls == []
+
+
+def test_given_interface_parse_dataflow_queries_load_code_worksheet_once(monkeypatch):
+    calls = count_code_worksheet_parses(monkeypatch)
+    full_program = parse_pou_file(TEST_POU)
+    calls.clear()
+    program = parse_pou_file(TEST_POU, interface_only=True)
+
+    assert program.getBackwardTrace() == full_program.getBackwardTrace()
+    assert program.is_code_worksheet_loaded()
+    assert program.lines == full_program.lines
+    assert program.ports == full_program.ports
+    assert program.check_rules() == full_program.check_rules()
+    assert program == full_program
+    assert len(calls) == 1
+
+
+def test_given_interface_parse_program_can_be_pickled_before_loading():
+    program = parse_pou_interface(wide_program(6, 3))
+    loaded = pickle.loads(pickle.dumps(program))
+    assert not loaded.is_code_worksheet_loaded()
+    assert loaded.getDependencyPathsByName() == parse_pou_content(wide_program(6, 3)).getDependencyPathsByName()
+
+
+def test_given_unknown_attribute_interface_program_raises_attribute_error():
+    program = parse_pou_interface(wide_program(6, 3))
+    assert not hasattr(program, "not_an_attribute")
+    assert not program.is_code_worksheet_loaded()
+
+
+def test_given_failing_load_interface_program_raises_the_load_error_again():
+    program = parse_pou_interface(wide_program(6, 3))
+    loader = program._code_worksheet_loader
+    attempts = []
+
+    def failing_loader(prog):
+        attempts.append(prog)
+        if len(attempts) < 3:
+            raise ValueError("broken code worksheet")
+        loader(prog)
+
+    program._code_worksheet_loader = failing_loader
+    for _ in range(2):
+        with pytest.raises(ValueError, match="broken code worksheet"):
+            program.behaviourElements
+        assert not program.is_code_worksheet_loaded()
+    assert program.getDependencyPathsByName() == parse_pou_content(wide_program(6, 3)).getDependencyPathsByName()
+    assert program.is_code_worksheet_loaded()
+    assert len(attempts) == 3
+
+
+def test_given_concurrent_uses_interface_program_loads_code_worksheet_once(monkeypatch):
+    calls = count_code_worksheet_parses(monkeypatch)
+    program = parse_pou_interface(wide_program(6, 3))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: len(program.behaviourElements), range(8)))
+    assert len(set(results)) == 1
+    assert len(calls) == 1
@@ -0,0 +1,127 @@
+import logging
+import os.path
+import sys
+import time
+
+import pytest
+
+from draconis_parser import Project
+from AST.language_detection import LanguageDetector, is_obviously_english, normalise, string_is_in_language
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content
+from synthetic_programs import wide_program
+
+GERMAN = "Die Eingangsspannung wird vom Sensor gemessen und an die Steuerung weitergegeben"
+NORWEGIAN = "Trykket i tanken er for høyt og ventilen må åpnes umiddelbart"
+# Short ASCII texts with words which English shares with other languages (in, was, a, no)
+SHORT_GERMAN = "Eingang in Grad, was gemessen wird"
+SHORT_SPANISH = "Valor de entrada a la salida, no usar"
+
+
+@pytest.fixture
+def detector():
+    return LanguageDetector()
+
+
+def test_texts_are_normalised_before_caching(detector):
+    assert normalise("  The input\n of\tthe  pump ") == "The input of the pump"
+    detector.detect("The input of the pump")
+    detector.detect("  The input\n of\tthe  pump ")
+    assert detector.cache_info().hits == 1 and detector.cache_info().misses == 1
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("The input of the pump", True),
+    ("Set when the valve is open", True),
+    ("Pump speed", False),
+    (GERMAN, False),
+    (NORWEGIAN, False),
+    ("Der Druck ist zu hoch", False),
+    (SHORT_GERMAN, False),
+    (SHORT_SPANISH, False),
+    ("", False),
+])
+def test_prefilter_only_accepts_obviously_english_short_texts(text, expected):
+    assert is_obviously_english(text) == expected
+
+
+def test_prefilter_skips_the_probabilistic_detector(detector, monkeypatch):
+    import AST.language_detection
+    calls = []
+    monkeypatch.setattr(AST.language_detection, "detect", lambda text: calls.append(text) or "de")
+    assert detector.detect("The input of the pump") == "en"
+    assert detector.detect(GERMAN) == "de"
+    assert calls == [GERMAN]
+
+
+def test_detection_is_deterministic_and_matches_without_prefilter(detector):
+    unfiltered = LanguageDetector(prefilter=False)
+    for text in [GERMAN, NORWEGIAN, "The pressure in the tank is too high and the valve must be opened"]:
+        assert detector.detect(text) == unfiltered.detect(text) == LanguageDetector().detect(text)
+    assert detector.detect(GERMAN) == "de"
+
+
+def test_undetectable_text_has_no_language(detector):
+    assert detector.detect("") is None
+    assert detector.detect("1234 + 5678") is None
+
+
+def test_batch_detects_each_distinct_text_once(detector):
+    texts = [GERMAN, "The input of the pump", GERMAN + " ", "The input of the pump", NORWEGIAN]
+    assert detector.detect_all(texts) == [detector.detect(t) for t in texts]
+    assert detector.cache_info().misses == 3
+
+
+def test_strings_not_in_language_are_reported_by_index(detector):
+    assert string_is_in_language([], "en", detector) is None
+    assert string_is_in_language(["The input of the pump"], "en", detector) is None
+    strings = ["The input of the pump", GERMAN, GERMAN, "The speed of the pump"]
+    assert string_is_in_language(strings, "en", detector) == [1, 2]
+
+
+def test_strings_without_detectable_language_are_not_reported(detector):
+    assert string_is_in_language(["1234"], "en", detector) == []
+    assert string_is_in_language(["---", GERMAN, "1234"], "en", detector) == [1]
+
+
+@pytest.mark.parametrize("prefilter", [True, False])
+def test_short_german_and_spanish_descriptions_are_not_english(prefilter):
+    detector = LanguageDetector(prefilter=prefilter)
+    assert string_is_in_language([SHORT_GERMAN], "en", detector) == [0]
+    assert string_is_in_language([SHORT_SPANISH, SHORT_GERMAN], "en", detector) == [0, 1]
+
+
+def test_only_strings_not_in_language_on_their_own_are_reported(monkeypatch):
+    import AST.language_detection
+    strings = ["First part", "second part"]
+    monkeypatch.setattr(AST.language_detection, "detect", lambda text: "de" if text == " ".join(strings) else "en")
+    assert string_is_in_language(strings, "en", LanguageDetector(prefilter=False)) == []
+
+
+def test_project_languages_are_classified_in_one_batch():
+    project = Project([parse_pou_content(wide_program(4, 2, name=f"Wide{n}")) for n in range(3)])
+    detector = LanguageDetector()
+    languages = project.getLanguages(detector)
+    assert set(languages) == {f"Input number {i}" for i in range(4)} | {f"Output number {o}" for o in range(2)}
+    # The same descriptions in the three POUs
+    assert detector.cache_info().misses == len(languages)
+
+
+def descriptions(n):
+    words = ["pump", "valve", "sensor", "tank", "pressure", "level", "motor", "speed"]
+    return [f"{words[i % 8].capitalize()} {words[(i // 8) % 8]} of the line {i % 50}" for i in range(n)]
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    texts = descriptions(2000) * 5
+    for name, detector in [("cached, with prefilter", LanguageDetector()),
+                           ("cached, without prefilter", LanguageDetector(prefilter=False))]:
+        start = time.perf_counter()
+        detector.detect_all(texts)
+        print(f"{name}: {len(texts)} descriptions in {time.perf_counter() - start:.3f}s")
+    from langdetect import detect
+    start = time.perf_counter()
+    [detect(t) for t in texts]
+    print(f"uncached, without prefilter: {len(texts)} descriptions in {time.perf_counter() - start:.3f}s")
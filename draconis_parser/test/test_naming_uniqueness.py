@@ -0,0 +1,114 @@
+import logging
+import os.path
+import random
+import statistics
+import sys
+import time
+
+import pytest
+
+from draconis_parser import Project
+from AST.design_rules import check_naming_uniqueness
+from checks.rule_utility_functions import prefix_collisions
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content
+from synthetic_programs import SyntheticPOU, wide_program
+
+LIMITS = (8, 16, 31, 63)
+
+
+def pairwise_collisions(names, length):
+    """The comparison of all pairs of names the uniqueness check used before, kept as the reference"""
+    non_unique = set()
+    for i, name in enumerate(names):
+        for other in names[i + 1:]:
+            if name[:length] == other[:length]:
+                non_unique.update([name, other])
+    return sorted(non_unique)
+
+
+def random_names(n, seed=0):
+    rng = random.Random(seed)
+    stems = ["Pump", "Valve", "PressureSensor", "TankLevelMeasurement", "MotorSpeedSetpointFromOperator"]
+    return [f"{rng.choice(stems)}_{rng.choice(stems)}_{rng.randrange(n)}" for _ in range(n)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_collisions_equal_pairwise_comparison_for_all_limits(seed):
+    names = random_names(300, seed) + ["Pump", "Pump", "P"]
+    collisions = prefix_collisions(names, LIMITS)
+    assert list(collisions) == sorted(LIMITS)
+    for length in LIMITS:
+        assert collisions[length] == pairwise_collisions(names, length)
+
+
+def test_longer_limits_only_report_names_colliding_at_shorter_ones():
+    collisions = prefix_collisions(random_names(1000), LIMITS)
+    for shorter, longer in zip(LIMITS, LIMITS[1:]):
+        assert set(collisions[longer]) <= set(collisions[shorter])
+
+
+def test_names_colliding_at_each_limit_are_reported():
+    names = ["MotorSpeed_A", "MotorSpeed_B", "Level"]
+    assert check_naming_uniqueness(names, (8, 16)) == [
+        "Compilers supporting symbol table entry lengths of 8 or less would be unable to tell some of these names apart",
+        ["MotorSpeed_A", "MotorSpeed_B"],
+    ]
+    assert check_naming_uniqueness(names, (16, 31)) == []
+
+
+def sheet_with_names(names, pou_name="Names"):
+    pou = SyntheticPOU(pou_name)
+    for name in names:
+        pou.add_variable("VAR", name)
+    pou.out_variable("Out", pou.in_variable(names[0]))
+    pou.add_variable("VAR_OUTPUT", "Out")
+    return parse_pou_content(pou.render())
+
+
+def test_rule_limits_are_configurable():
+    program = sheet_with_names(["MotorSpeed_A", "MotorSpeed_B", "Level"])
+    default = program.check_rules(["FBD.Naming.Uniqueness"])[0]
+    assert default[1] == "Pass"
+    name, verdict, justification = program.check_rules(
+        ["FBD.Naming.Uniqueness"], options={"FBD.Naming.Uniqueness": {"symbol_lengths": LIMITS}}
+    )[0]
+    assert verdict == "Fail" and "lengths of 8 or less" in justification and "16" not in justification
+    # Results with options are not cached
+    assert program.check_rules(["FBD.Naming.Uniqueness"]) == [default]
+
+
+def test_project_mode_finds_clashes_across_pous():
+    project = Project([
+        sheet_with_names(["ConveyorBeltSpeed"], "ConveyorControl"),
+        sheet_with_names(["ConveyorBeltStop"], "ConveyorControlLine2"),
+        parse_pou_content(wide_program(2, 1)),
+    ])
+    assert "ConveyorControl.ConveyorBeltSpeed" in project.getGlobalSymbols()
+    assert project.checkNamingUniqueness((63,))[1] == "Pass"
+    name, verdict, justification = project.checkNamingUniqueness((8, 16, 31))
+    assert (name, verdict) == ("FBD.Naming.ProjectUniqueness", "Fail")
+    assert "lengths of 31" not in justification
+    assert {"ConveyorControl", "ConveyorControlLine2", "ConveyorControl.ConveyorBeltSpeed",
+            "ConveyorControlLine2.ConveyorBeltStop"} <= set(justification.split("\n"))
+
+
+def collision_times(nr_of_names, repetitions=5):
+    names = random_names(nr_of_names)
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        prefix_collisions(names, LIMITS)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    for n in [1000, 5000, 20000]:
+        print(f"{n} names, limits {LIMITS}: {collision_times(n):.4f}s")
+    names = random_names(5000)
+    start = time.perf_counter()
+    pairwise_collisions(names, 30)
+    print(f"5000 names, pairwise comparison for one limit: {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,155 @@
+import os.path
+import re
+import sys
+
+import pytest
+
+from draconis_parser import PathDivide, SafeClass
+from checks.graph_utilities import path_list_to_graph_edges
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import CODE_PARSER_LXML, parse_pou_content, parse_pou_file
+from synthetic_programs import SyntheticPOU, diamond_lattice_program, large_program, wide_program
+from test_backward_trace import NON_POU_FILES, TEST_POU_FILES, UNCONNECTABLE_FILES
+
+shared = PathDivide([[3, 4], [5, PathDivide([[10, 11], [12]])]])
+HANDMADE_PATH_LISTS = [
+    [[1, 2], [3, 4]],
+    [[1, 2], []],
+    [[], [1, 2]],
+    [[1, 2, shared], [7, 8, shared], [99, 100]],
+    # Divides without any path, and elements after a divide, which are not part of any path
+    [[5, PathDivide([])], [6, PathDivide([[]])]],
+    [[1, PathDivide([[2]]), 3, PathDivide([[4], []])]],
+    [[PathDivide([[1, 2], [PathDivide([[3]])]])]],
+]
+
+
+def ordered_sources(paths):
+    return list(dict.fromkeys(p[-1] for p in paths))
+
+
+def assert_same_as_unpacked(path_list):
+    unpacked = PathDivide.unpack_pathlist(path_list)
+    assert list(PathDivide.iter_paths(path_list)) == unpacked
+    assert PathDivide.sources(path_list) == ordered_sources(unpacked)
+    assert PathDivide.edges(path_list) == path_list_to_graph_edges([unpacked])
+    for source in PathDivide.sources(path_list):
+        assert list(PathDivide.iter_paths_to(path_list, source)) == [p for p in unpacked if p[-1] == source]
+
+
+@pytest.mark.parametrize("path_list", HANDMADE_PATH_LISTS)
+def test_given_handmade_paths_dag_queries_match_unpacked_paths(path_list):
+    assert_same_as_unpacked(path_list)
+
+
+def test_deeply_nested_divides_do_not_hit_recursion_limit():
+    depth = 2 * sys.getrecursionlimit()
+    path_list = [[depth]]
+    for i in reversed(range(depth)):
+        path_list = [[i, PathDivide(path_list + [[-i - 1]])]]
+    with pytest.raises(RecursionError):
+        PathDivide.unpack_pathlist(path_list)
+    paths = list(PathDivide.iter_paths(path_list))
+    assert len(paths) == depth + 1
+    assert paths[0] == list(range(depth + 1)) and paths[-1] == [0, -1]
+    assert list(PathDivide.iter_paths_to(path_list, -1)) == [[0, -1]]
+    assert list(PathDivide.iter_paths_to(path_list, depth)) == [paths[0]]
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES + UNCONNECTABLE_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_dag_queries_match_unpacked_paths(pou_file):
+    for trace in parse_pou_file(pou_file).getBackwardTrace().values():
+        assert_same_as_unpacked([trace])
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [diamond_lattice_program(6), wide_program(12, 6), large_program(40)],
+    ids=["diamonds", "wide", "large"],
+)
+def test_given_synthetic_pou_dag_queries_match_unpacked_paths(pou_content):
+    for trace in parse_pou_content(pou_content).getBackwardTrace().values():
+        assert_same_as_unpacked([trace])
+
+
+def test_paths_are_generated_lazily():
+    program = parse_pou_content(diamond_lattice_program(60), code_parser=CODE_PARSER_LXML)
+    paths = PathDivide.iter_paths([program.getBackwardTrace()["Out_0"]])
+    first, second = next(paths), next(paths)
+    assert first[:2] == second[:2] and first != second
+
+
+def test_given_wide_diamond_lattice_sources_and_edges_are_found_without_enumeration():
+    depth = 60
+    program = parse_pou_content(diamond_lattice_program(depth), code_parser=CODE_PARSER_LXML)
+    trace = program.getBackwardTrace()["Out_0"]
+    sources = PathDivide.sources([trace])
+    edges = PathDivide.edges([trace])
+    assert [program.behaviour_id_map[s].getVarExpr() for s in sources] == ["In_0"]
+    # Per diamond: over the joining block to both its inputs, the 2 wires to the fanned out blocks,
+    # over each of these, and their 2 wires to the previous stage. And the wire to the output
+    assert len(edges) == 8 * depth + 1
+    assert program.getDependencyPathsByName() == {"Out_0": ["In_0"]}
+
+
+def safe_flow_from_paths(program):
+    """The safe data flow check walking every path, as done before, kept as the reference"""
+    safeness = program.getVarInfo()["Safeness"]
+    result = []
+    for name, trace in program.getBackwardTrace().items():
+        if safeness.get(name, None) == SafeClass.Unsafe:
+            continue
+        for path in PathDivide.iter_paths([trace]):
+            source = program.behaviour_id_map.get(path[-1], None)
+            if source is None or source.getBlockType() != "Port":
+                continue
+            expr = source.getVarExpr()
+            is_safe = "SAFE" in expr if "#" in expr else safeness.get(expr, False)
+            converted = any("EN_IN" in b.getName() for b in map(program.behaviour_id_map.get, path) if b is not None)
+            if not is_safe and not converted:
+                result.append(f"Unsafe data ('{expr}') flowing to safe output ('{name}')")
+    return result
+
+
+def with_safe_outputs(pou_content):
+    return re.sub(r"(Out_\d+) : BOOL", r"\1 : SAFEBOOL", pou_content)
+
+
+@pytest.mark.parametrize(
+    "pou_content",
+    [with_safe_outputs(diamond_lattice_program(6)), with_safe_outputs(wide_program(12, 6)),
+     wide_program(12, 6), with_safe_outputs(large_program(40))],
+    ids=["diamonds", "wide", "unsafe_outputs", "large"],
+)
+def test_safe_flow_violations_equal_those_of_all_paths_once_each(pou_content):
+    program = parse_pou_content(pou_content)
+    violations = program.checkSafeDataFlow()
+    assert len(violations) == len(set(violations))
+    assert sorted(violations) == sorted(set(safe_flow_from_paths(program)))
+
+
+def test_safe_flow_of_wide_diamond_lattice_is_checked_without_enumerating_paths():
+    program = parse_pou_content(with_safe_outputs(diamond_lattice_program(60)), code_parser=CODE_PARSER_LXML)
+    assert program.checkSafeDataFlow() == ["Unsafe data ('In_0') flowing to safe output ('Out_0')"]
+
+
+def test_converted_unsafe_data_is_not_reported():
+    pou = SyntheticPOU("Converted")
+    pou.add_variable("VAR_INPUT", "In_0")
+    for name in ["Converted_0", "Direct_0", "Mixed_0"]:
+        pou.add_variable("VAR_OUTPUT", name, value_type="SAFEBOOL")
+    source = pou.in_variable("In_0")
+    converted = pou.block("BOOL_TO_SAFEBOOL_EN_IN", [source])[0]
+    pou.out_variable("Converted_0", converted)
+    pou.out_variable("Direct_0", source)
+    pou.out_variable("Mixed_0", pou.block("AND", [converted, source])[0])
+    program = parse_pou_content(pou.render())
+    assert program.checkSafeDataFlow() == [
+        "Unsafe data ('In_0') flowing to safe output ('Direct_0')",
+        "Unsafe data ('In_0') flowing to safe output ('Mixed_0')",
+    ]
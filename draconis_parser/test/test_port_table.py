@@ -0,0 +1,169 @@
+import gc
+import logging
+import os.path
+import pickle
+import statistics
+import sys
+import time
+
+import pytest
+
+from draconis_parser import BlockPorts, DataflowDirection, FBD_Block, Point, Port, PortTable, VarBlock
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import (
+    CODE_PARSER_LXML,
+    clean_pou_string,
+    get_worksheets_from_input,
+    parse_code_worksheet,
+    parse_pou_content,
+    parse_pou_file,
+    parse_variable_worksheet,
+)
+from synthetic_programs import feedback_program, large_program, wide_program
+from test_backward_trace import NON_POU_FILES, TEST_POU_FILES, UNCONNECTABLE_FILES
+
+
+def dict_ports(program):
+    """The port dict as it was set up before the port table, kept as the reference"""
+    ports = {}
+
+    def addPortConnectionToBlock(blockID, portID, connection):
+        targetPort = ports.get(portID, None)
+        if targetPort is None:
+            targetPort = Port(
+                portID=portID,
+                blockID=blockID,
+                rel_connection_direction=connection.connectionDir,
+                rel_position=Point(connection.data.position.x, connection.data.position.y),
+                connections=set(),
+            )
+            ports[portID] = targetPort
+        for conn in connection.connections:
+            start_point = conn.startPoint.connectionIndex
+            targetPort.connections.add(start_point if start_point is not None else conn.endPoint.connectionIndex)
+
+    for block in program.behaviourElements:
+        if isinstance(block, FBD_Block):
+            for c in block.getInputVars() + block.getOutputVars():
+                addPortConnectionToBlock(block.getID(), c.ID, c.connectionPoint)
+    for block in program.behaviourElements:
+        if isinstance(block, VarBlock):
+            addPortConnectionToBlock(block.getID(), block.getID(), block.outConnection)
+    for p_id, p_data in list(ports.items()):
+        for conn in p_data.connections:
+            ports[conn].connections.add(p_id)
+    return ports
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES + UNCONNECTABLE_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_port_table_equals_port_dict(pou_file):
+    program = parse_pou_file(pou_file)
+    reference = dict_ports(program)
+    assert isinstance(program.ports, PortTable)
+    assert list(program.ports) == list(reference)
+    assert program.ports == reference
+    for block in program.behaviourElements:
+        assert isinstance(block.ports, BlockPorts)
+        assert dict(block.ports) == {p.portID: p for p in reference.values() if p.blockID == block.getID()}
+
+
+def test_flow_over_block_is_identical_for_table_and_dict_ports():
+    def flows_of(block):
+        # The table holds the connections of a port in ascending order, a set in any order
+        return [[(start, sorted(ends)) for start, ends in block.getFlowOverBlock(d)] for d in DataflowDirection]
+
+    program = parse_pou_content(wide_program(6, 3))
+    reference = dict_ports(program)
+    for block in program.behaviourElements:
+        flows = flows_of(block)
+        assert [[(start, list(ends)) for start, ends in block.getFlowOverBlock(d)]
+                for d in DataflowDirection] == flows
+        block.ports = {ID: reference[ID] for ID in block.ports}
+        assert flows_of(block) == flows
+
+
+def test_arrays_are_indexed_by_local_id():
+    program = parse_pou_content(feedback_program(1, 1))
+    ports = program.ports
+    for block in program.behaviourElements:
+        for port_id in block.ports:
+            assert ports.blockID(port_id) == block.getID()
+            assert ports.direction(port_id) == ports[port_id].rel_connection_direction
+            assert sorted(ports.connections(port_id)) == sorted(ports[port_id].connections)
+    assert [ID for ID in range(len(ports.block_of)) if ID in ports] == sorted(ports)
+    assert -1 not in ports and "1" not in ports
+    with pytest.raises(KeyError):
+        ports[len(ports.block_of)]
+
+
+def test_port_table_survives_pickling():
+    program = parse_pou_content(wide_program(6, 3))
+    program.ports[next(iter(program.ports))]
+    loaded = pickle.loads(pickle.dumps(program))
+    assert loaded == program
+    assert loaded.ports == program.ports
+    assert loaded.behaviourElements[0].ports.table is loaded.ports
+    assert loaded.getBackwardTrace() == program.getBackwardTrace()
+
+
+def test_sparse_ids_are_compacted():
+    huge_id = 10 ** 9
+    ports = PortTable([1, 2, huge_id], [0, 0, 3], [1, 2, 1], [0, 5, 0], [0, 0, 0], [2], [huge_id])
+    assert ports.slots is not None and len(ports.block_of) == 3
+    assert list(ports) == [1, 2, huge_id] and huge_id in ports and 3 not in ports and huge_id - 1 not in ports
+    assert ports.blockID(huge_id) == 3 and ports.direction(2) == 2
+    assert list(ports.connections(huge_id)) == [2] and list(ports.connections(2)) == [huge_id]
+    assert ports[2].rel_position == Point(5, 0) and ports[huge_id].connections == {2}
+    assert ports.viewOf(0).portIDs(1) == [1] and dict(ports.viewOf(3)) == {huge_id: ports[huge_id]}
+    assert pickle.loads(pickle.dumps(ports)) == ports
+
+
+def test_program_with_sparse_local_id_gives_same_analysis():
+    content = wide_program(6, 3)
+    program = parse_pou_content(content)
+    largest = max(program.ports)
+    sparse_content = content.replace(f'localId="{largest}"', 'localId="900000000"').replace(
+        f'refLocalId="{largest}"', 'refLocalId="900000000"')
+    sparse_program = parse_pou_content(sparse_content)
+    assert sparse_program.ports.slots is not None and program.ports.slots is None
+    trace = {name: [largest if e == 900000000 else e for e in path]
+             for name, path in sparse_program.getBackwardTrace().items()}
+    assert trace == program.getBackwardTrace()
+
+
+def test_connection_to_unknown_port_is_rejected():
+    with pytest.raises(ValueError):
+        PortTable([1], [0], [1], [0], [0], [1], [7])
+
+
+def setup_and_trace_times(content, repetitions=5):
+    """Median times of setting up the ports and the data flow graph of a parsed program, and of its trace"""
+    var_sheet, code_sheet = get_worksheets_from_input(clean_pou_string(content))
+    setups, traces = [], []
+    for _ in range(repetitions):
+        program = parse_variable_worksheet(var_sheet)
+        program.behaviourElements, program.behaviour_id_map, program.lines, program.comments = \
+            parse_code_worksheet(code_sheet, CODE_PARSER_LXML)
+        # Not to measure the garbage left by the parser
+        gc.collect()
+        start = time.perf_counter()
+        program.post_parsing_analysis()
+        setups.append(time.perf_counter() - start)
+        gc.collect()
+        start = time.perf_counter()
+        program.getBackwardTrace()
+        traces.append(time.perf_counter() - start)
+    return statistics.median(setups), statistics.median(traces)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    for name, content in [("large_program(20000)", large_program(20000)),
+                          ("wide_program(2000, 2000, fan_in=8)", wide_program(2000, 2000, fan_in=8))]:
+        setup, trace = setup_and_trace_times(content)
+        print(f"{name}: setup {setup:.3f}s, backward trace {trace:.3f}s")
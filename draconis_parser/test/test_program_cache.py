@@ -0,0 +1,145 @@
+import os.path
+import pickle
+import sys
+import time
+import zlib
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+import helper_functions
+import program_cache
+from helper_functions import clean_pou_string, parse_pou_content, parse_pou_file
+from program_cache import ProgramCache
+from synthetic_programs import large_program, wide_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+TEST_POU = os.path.join(THIS_DIR, "Collatz_Calculator_Even", "Collatz_Calculator_Even.pou")
+
+
+def test_given_cached_program_loaded_program_gives_same_analysis(tmp_path):
+    cache = ProgramCache(tmp_path)
+    parsed = parse_pou_file(TEST_POU, cache=cache)
+    loaded = parse_pou_file(TEST_POU, cache=cache)
+    assert loaded is not parsed
+    assert loaded == parsed
+    assert loaded.ports == parsed.ports
+    assert loaded.getBackwardTrace() == parsed.getBackwardTrace()
+    assert loaded.getMetrics() == parsed.getMetrics()
+    assert loaded.check_rules() == parsed.check_rules()
+
+
+def test_given_unchanged_program_it_is_not_parsed_again(tmp_path, monkeypatch):
+    cache = ProgramCache(tmp_path)
+    pou_content = wide_program(6, 3)
+    parse_pou_content(pou_content, cache=cache)
+
+    def fail(*args):
+        raise AssertionError("Program should have been loaded from the cache")
+
+    monkeypatch.setattr(helper_functions, "_parse_cleaned_pou_content", fail)
+    assert parse_pou_content(pou_content, cache=cache).progName == "Wide"
+
+
+def test_key_depends_on_content_version_and_parser_options(monkeypatch):
+    content = clean_pou_string(wide_program(6, 3))
+    key = ProgramCache.key(content, "antlr", "handwritten")
+    assert key == ProgramCache.key(content, "antlr", "handwritten")
+    assert key != ProgramCache.key(content.replace("In_0", "In_X"), "antlr", "handwritten")
+    assert key != ProgramCache.key(content, "lxml", "handwritten")
+    monkeypatch.setattr(helper_functions.program_cache.Program, "VERSION", classmethod(lambda cls: (99, 0, 0)))
+    assert key != ProgramCache.key(content, "antlr", "handwritten")
+
+
+def test_given_corrupt_entry_program_is_parsed_again(tmp_path):
+    cache = ProgramCache(tmp_path)
+    pou_content = wide_program(6, 3)
+    parse_pou_content(pou_content, cache=cache)
+    (entry,) = list(tmp_path.iterdir())
+    entry.write_bytes(b"not a program")
+    assert parse_pou_content(pou_content, cache=cache).progName == "Wide"
+    assert pickle.loads(zlib.decompress(entry.read_bytes())).progName == "Wide"
+
+
+def test_given_error_unrelated_to_entry_it_is_raised_and_entry_kept(tmp_path, monkeypatch):
+    cache = ProgramCache(tmp_path)
+    pou_content = wide_program(6, 3)
+    parse_pou_content(pou_content, cache=cache)
+    entries = list(tmp_path.iterdir())
+
+    def failing_loads(data):
+        raise RuntimeError("Bug while restoring the program")
+
+    monkeypatch.setattr(program_cache.pickle, "loads", failing_loads)
+    with pytest.raises(RuntimeError):
+        parse_pou_content(pou_content, cache=cache)
+    assert list(tmp_path.iterdir()) == entries
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    programs = [wide_program(4 + i, 2) for i in range(3)]
+    cache = ProgramCache(tmp_path)
+    for p in programs:
+        parse_pou_content(p, cache=cache)
+    entry_sizes = sorted(e.stat().st_size for e in tmp_path.iterdir())
+
+    # Room for two entries only. Using the first program again makes the second the least recently used
+    small_cache = ProgramCache(tmp_path, max_size_bytes=entry_sizes[-1] + entry_sizes[-2])
+    small_cache.clear()
+    parse_pou_content(programs[0], cache=small_cache)
+    time.sleep(0.01)
+    parse_pou_content(programs[1], cache=small_cache)
+    time.sleep(0.01)
+    parse_pou_content(programs[0], cache=small_cache)
+    time.sleep(0.01)
+    parse_pou_content(programs[2], cache=small_cache)
+
+    keys = [small_cache.key(clean_pou_string(p), helper_functions.CODE_PARSER_ANTLR_LISTENER,
+                            helper_functions.HEADER_PARSER_HANDWRITTEN) for p in programs]
+    assert small_cache.entry_path(keys[0]).exists()
+    assert not small_cache.entry_path(keys[1]).exists()
+    assert small_cache.entry_path(keys[2]).exists()
+
+
+
+def test_storing_many_entries_scans_the_directory_once(tmp_path, monkeypatch):
+    program = parse_pou_content(wide_program(4, 2))
+    entry_size = len(zlib.compress(pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL)))
+    cache = ProgramCache(tmp_path, max_size_bytes=5 * entry_size)
+    scans = []
+    glob = type(tmp_path).glob
+    monkeypatch.setattr(type(tmp_path), "glob", lambda self, pattern: scans.append(pattern) or glob(self, pattern))
+    for i in range(20):
+        cache.put(f"key_{i}", program)
+    assert len(scans) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"key_{i}.program" for i in range(15, 20))
+
+
+def test_interrupted_store_leaves_no_temporary_file(tmp_path, monkeypatch):
+    from batch_analysis_cli import FileTimeoutError
+
+    cache = ProgramCache(tmp_path)
+
+    def timed_out_replace(source, target):
+        raise FileTimeoutError()
+
+    monkeypatch.setattr(program_cache.os, "replace", timed_out_replace)
+    with pytest.raises(FileTimeoutError):
+        cache.put("key", parse_pou_content(wide_program(4, 2)))
+    assert list(tmp_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ProgramCache(cache_dir)
+        for nr_of_blocks in [200, 2000]:
+            pou_content = large_program(nr_of_blocks)
+            start = time.perf_counter()
+            parse_pou_content(pou_content, cache=cache)
+            parse_time = time.perf_counter() - start
+            start = time.perf_counter()
+            parse_pou_content(pou_content, cache=cache)
+            load_time = time.perf_counter() - start
+            print(f"Parse of {nr_of_blocks} blocks: {parse_time:.3f}s, load from cache: {load_time:.3f}s")
@@ -0,0 +1,127 @@
+import logging
+import os.path
+import sys
+
+import pytest
+
+from draconis_parser import Project
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import parse_pou_content, parse_project_contents, parse_project_directory
+from synthetic_programs import SyntheticPOU
+
+
+def pass_through_pou(name, cross=False):
+    """Function block with inputs A and B, and outputs X and Y. X depends on A, and Y on B, or the other way round"""
+    pou = SyntheticPOU(name, "FUNCTION_BLOCK")
+    for input_name in ["A", "B"]:
+        pou.add_variable("VAR_INPUT", input_name, description="Input")
+    for output_name in ["X", "Y"]:
+        pou.add_variable("VAR_OUTPUT", output_name, description="Output")
+    a, b = pou.in_variable("A"), pou.in_variable("B")
+    pou.out_variable("X", pou.block("NOT", [b if cross else a])[0])
+    pou.out_variable("Y", pou.block("NOT", [a if cross else b])[0])
+    return pou.render()
+
+
+def caller_pou(name, callee, pou_type="PROGRAM", inputs=("I1", "I2"), outputs=("O1", "O2")):
+    """The two inputs flow over an instance of the callee (as A and B), into the two outputs (from X and Y)"""
+    pou = SyntheticPOU(name, pou_type)
+    for input_name in inputs:
+        pou.add_variable("VAR_INPUT", input_name, description="Input")
+    for output_name in outputs:
+        pou.add_variable("VAR_OUTPUT", output_name, description="Output")
+    pou.add_variable("VAR", f"{callee}_1", value_type=callee, description="Instance")
+    x, y = pou.block(callee, [pou.in_variable(i) for i in inputs], 2,
+                     input_names=["A", "B"], output_names=["X", "Y"], instance_name=f"{callee}_1")
+    pou.out_variable(outputs[0], x)
+    pou.out_variable(outputs[1], y)
+    return pou.render()
+
+
+@pytest.fixture
+def nested_project():
+    # Top -> Middle -> Inner, where Middle passes its inputs straight through to Inner
+    return Project([parse_pou_content(content) for content in [
+        caller_pou("Top", "Middle"),
+        caller_pou("Middle", "Inner", "FUNCTION_BLOCK", inputs=("A", "B"), outputs=("X", "Y")),
+        pass_through_pou("Inner"),
+    ]])
+
+
+def count_summaries(monkeypatch):
+    calls = []
+    summarise = Project._summarise
+
+    def counting_summarise(self, name):
+        calls.append(name)
+        return summarise(self, name)
+
+    monkeypatch.setattr(Project, "_summarise", counting_summarise)
+    return calls
+
+
+def test_call_graph_resolves_instances_to_pous(nested_project):
+    assert nested_project.getCallGraph() == {"Top": ["Middle"], "Middle": ["Inner"], "Inner": []}
+    [(block_id, callee)] = nested_project.getCalls("Top").items()
+    assert callee == "Middle"
+    assert nested_project.getProgram("Top").behaviour_id_map[block_id].data.type == "Middle"
+
+
+def test_dependencies_are_composed_through_nested_instances(nested_project):
+    # Analysed in isolation, every output of a block depends on all its inputs
+    assert nested_project.getProgram("Top").get_dependencies_names() == {"O1": ["I1", "I2"], "O2": ["I1", "I2"]}
+    assert nested_project.getDependencySummary("Inner") == {"X": ["A"], "Y": ["B"]}
+    assert nested_project.getDependencySummary("Top") == {"O1": ["I1"], "O2": ["I2"]}
+    assert nested_project.getInfluencingInputs("Top", "O2") == ["I2"]
+
+
+def test_summaries_are_computed_once_callees_first(nested_project, monkeypatch):
+    calls = count_summaries(monkeypatch)
+    nested_project.getDependencySummary("Top")
+    nested_project.getDependencySummary("Middle")
+    nested_project.getInfluencingInputs("Top", "O1")
+    assert calls == ["Inner", "Middle", "Top"]
+
+
+def test_replacing_a_callee_invalidates_its_callers(nested_project, monkeypatch):
+    nested_project.getDependencySummary("Top")
+    calls = count_summaries(monkeypatch)
+    nested_project.setProgram(parse_pou_content(pass_through_pou("Inner", cross=True)))
+    assert nested_project.getDependencySummary("Top") == {"O1": ["I2"], "O2": ["I1"]}
+    assert calls == ["Inner", "Middle", "Top"]
+
+
+def test_recursive_instantiation_depends_on_all_inputs():
+    project = Project([parse_pou_content(caller_pou(name, callee, inputs=("A", "B"), outputs=("X", "Y")))
+                       for name, callee in [("Ping", "Pong"), ("Pong", "Ping")]])
+    assert project.getCallGraph() == {"Ping": ["Pong"], "Pong": ["Ping"]}
+    assert project.getDependencySummary("Ping") == {"X": ["A", "B"], "Y": ["A", "B"]}
+
+
+def test_unknown_function_blocks_are_not_calls(nested_project):
+    project = Project([nested_project.getProgram("Top")])
+    assert project.getCallGraph() == {"Top": []}
+    assert project.getDependencySummary("Top") == {"O1": ["I1", "I2"], "O2": ["I1", "I2"]}
+
+
+def test_project_is_parsed_from_directory(tmp_path, caplog):
+    for name, content in [("Top", caller_pou("Top", "Inner")), ("Inner", pass_through_pou("Inner"))]:
+        (tmp_path / "pous").mkdir(exist_ok=True)
+        (tmp_path / "pous" / f"{name}.pou").write_text(content)
+    (tmp_path / "Broken.pou").write_text("PROGRAM Broken\nEND_PROGRAM\n")
+    with caplog.at_level(logging.ERROR):
+        project = parse_project_directory(str(tmp_path))
+    assert sorted(project.programs) == ["Inner", "Top"]
+    assert "Broken.pou" in caplog.text
+    assert project.getDependencySummary("Top") == {"O1": ["I1"], "O2": ["I2"]}
+
+
+def test_project_is_parsed_from_uploaded_contents(caplog):
+    contents = [("Top.pou", caller_pou("Top", "Inner")), ("Broken.pou", "PROGRAM Broken\nEND_PROGRAM\n"),
+                ("Inner.pou", pass_through_pou("Inner"))]
+    with caplog.at_level(logging.ERROR):
+        project = parse_project_contents(contents)
+    assert sorted(project.programs) == ["Inner", "Top"]
+    assert "Broken.pou" in caplog.text
+    assert project.getDependencySummary("Top") == {"O1": ["I1"], "O2": ["I2"]}
@@ -0,0 +1,107 @@
+import os.path
+import sys
+import time
+
+import pytest
+
+from draconis_parser import ParameterType, ValueType, VariableGroup, VariableLine, VariableWorkSheet
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import clean_pou_string, get_worksheets_from_input, parse_variable_worksheet
+from synthetic_programs import SyntheticPOU
+
+
+def sheet_of_size(nr_of_variables):
+    pou = SyntheticPOU("ManyVariables")
+    for i in range(nr_of_variables):
+        kind = ["VAR_INPUT", "VAR_OUTPUT", "VAR"][i % 3]
+        pou.add_variable(kind, f"Var_{i}", description=f"Variable number {i}")
+    var_sheet, _ = get_worksheets_from_input(clean_pou_string(pou.render()))
+    return parse_variable_worksheet(var_sheet).varHeader
+
+
+def unindexed_lookups(sheet: VariableWorkSheet, names):
+    """The lookups as done before the indexes: concatenate all groups, then scan"""
+
+    def all_variables():
+        result = []
+        for group in sheet.varGroups:
+            result.extend(group.varLines)
+        return result
+
+    found = [next((v for v in all_variables() if v.name == name), None) for name in names]
+    by_type = [[v for v in all_variables() if v.paramType == t] for t in ParameterType for _ in names[:50]]
+    return found, by_type
+
+
+def indexed_lookups(sheet: VariableWorkSheet, names):
+    found = [sheet.getFirstVariableByName(name) for name in names]
+    by_type = [sheet.getVarsByType(t) for t in ParameterType for _ in names[:50]]
+    return found, by_type
+
+
+def test_lookups_return_same_as_scanning():
+    sheet = sheet_of_size(90)
+    names = [f"Var_{i}" for i in range(0, 100, 7)]
+    assert indexed_lookups(sheet, names) == unindexed_lookups(sheet, names)
+    assert [v.name for v in sheet.getAllVariables()] == [v.name for g in sheet.varGroups for v in g.varLines]
+    assert sheet.getFirstVariableByName("Missing") is None
+    assert sheet.getVarsByType(ParameterType.InOutVar) == []
+
+
+def test_first_variable_of_duplicated_name_is_found():
+    first = VariableLine("Dup", ParameterType.InputVar, ValueType.BOOL)
+    second = VariableLine("Dup", ParameterType.OutputVar, ValueType.BOOL)
+    sheet = VariableWorkSheet([VariableGroup("Inputs", [first]), VariableGroup("Outputs", [second])])
+    assert sheet.getFirstVariableByName("Dup") is first
+
+
+def test_indexes_follow_changes_to_the_sheet():
+    sheet = sheet_of_size(9)
+    assert len(sheet.getAllVariables()) == 9
+    added = VariableLine("Added", ParameterType.InputVar, ValueType.BOOL)
+    sheet.addVariable("Inputs", added)
+    assert sheet.getFirstVariableByName("Added") is added
+    sheet.addVariableGroup(VariableGroup("Extra", [VariableLine("Extra_1", ParameterType.InternalVar, ValueType.INT)]))
+    assert sheet.getAllVariables()[-1].name == "Extra_1"
+    # Lines added directly need an explicit invalidation
+    sheet.varGroups[0].varLines.append(VariableLine("Direct", ParameterType.InputVar, ValueType.BOOL))
+    sheet.invalidate_indexes()
+    assert sheet.getFirstVariableByName("Direct") is not None
+    # A line changed in place needs an explicit invalidation
+    added.name = "Renamed"
+    sheet.invalidate_indexes()
+    assert sheet.getFirstVariableByName("Added") is None
+    assert sheet.getFirstVariableByName("Renamed") is added
+    with pytest.raises(ValueError):
+        sheet.addVariable("No such group", added)
+
+
+def test_remove_and_add_in_the_same_group_is_noticed():
+    sheet = sheet_of_size(9)
+    removed = sheet.getFirstVariableByName("Var_0")
+    sheet.removeVariable(removed)
+    added = VariableLine("Replacement", ParameterType.OutputVar, ValueType.BOOL)
+    sheet.addVariable(sheet.varGroups[0].groupName, added)
+    assert sheet.getFirstVariableByName("Var_0") is None
+    assert sheet.getFirstVariableByName("Replacement") is added
+    assert removed not in sheet.getAllVariables() and added in sheet.getVarsByType(ParameterType.OutputVar)
+    with pytest.raises(ValueError):
+        sheet.removeVariable(removed)
+
+
+def test_indexed_lookups_on_large_sheet_equal_scanning():
+    sheet = sheet_of_size(2000)
+    names = [f"Var_{i}" for i in range(0, 2000, 10)]
+    assert indexed_lookups(sheet, names) == unindexed_lookups(sheet, names)
+
+
+if __name__ == "__main__":
+    sheet = sheet_of_size(2000)
+    names = [f"Var_{i}" for i in range(0, 2000, 10)]
+    timings = {}
+    for lookups in [unindexed_lookups, indexed_lookups]:
+        start = time.perf_counter()
+        lookups(sheet, names)
+        timings[lookups.__name__] = time.perf_counter() - start
+    print(f"200 name and 300 type lookups on 2000 variables: {timings}")
@@ -0,0 +1,135 @@
+import glob
+import os.path
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from helper_functions import (
+    HEADER_PARSER_ANTLR,
+    HEADER_PARSER_HANDWRITTEN,
+    clean_pou_string,
+    get_worksheets_from_input,
+    parse_variable_worksheet,
+)
+from POUHeaderParser import POUHeaderParser, POUHeaderSyntaxError
+from synthetic_programs import SyntheticPOU, large_program, wide_program
+
+THIS_DIR = os.path.abspath(os.path.dirname(__file__))
+TEST_POU_FILES = sorted(
+    glob.glob(os.path.join(THIS_DIR, "**", "*.pou"), recursive=True)
+    + glob.glob(os.path.join(THIS_DIR, "..", "..", "checks", "test", "test_programs", "*.pou"))
+)
+# Stored as UTF-16 with a byte order mark, and not a complete POU
+NON_POU_FILES = ["xml_part.pou"]
+
+
+def var_sheet_of(pou_content):
+    var_sheet, _ = get_worksheets_from_input(clean_pou_string(pou_content))
+    return var_sheet
+
+
+def summary_of(program):
+    return (
+        program.progName,
+        [
+            (
+                group.groupName,
+                [
+                    (v.name, v.paramType, v.valueType, v.initVal, v.description, v.isFeedback)
+                    for v in group.varLines
+                ],
+            )
+            for group in program.varHeader.varGroups
+        ],
+    )
+
+
+def assert_same_variable_worksheet(var_sheet):
+    antlr_program = parse_variable_worksheet(var_sheet, HEADER_PARSER_ANTLR)
+    handwritten_program = POUHeaderParser(var_sheet).parseSafe_program_POU()
+    assert summary_of(handwritten_program) == summary_of(antlr_program)
+
+
+@pytest.mark.parametrize(
+    "pou_file",
+    [f for f in TEST_POU_FILES if os.path.basename(f) not in NON_POU_FILES],
+    ids=os.path.basename,
+)
+def test_given_test_pou_both_parsers_produce_same_variable_worksheet(pou_file):
+    with open(pou_file) as f:
+        assert_same_variable_worksheet(var_sheet_of(f.read()))
+
+
+def test_given_synthetic_pou_both_parsers_produce_same_variable_worksheet():
+    pou = SyntheticPOU("Synthetic")
+    pou.add_variable("VAR_INPUT", "In_1", "SAFEBOOL", "A safe (input)", "SAFEFALSE")
+    pou.add_variable("VAR_INPUT", "In_2", "INT", None, "-12")
+    pou.add_variable("VAR_OUTPUT", "Out_1", "BOOL", "An output", "BOOL#1")
+    pou.add_variable("VAR", "Internal_1", "SAFEBOOL", None, "SAFETRUE")
+    assert_same_variable_worksheet(var_sheet_of(pou.render()))
+    assert_same_variable_worksheet(var_sheet_of(wide_program(40, 20)))
+
+
+def test_given_unsupported_header_handwritten_parser_raises_and_default_falls_back_to_antlr():
+    var_sheet = var_sheet_of(wide_program(4, 2)).replace("In_0 : BOOL;", "In_0 : BOOL := In_1;")
+    with pytest.raises(POUHeaderSyntaxError):
+        POUHeaderParser(var_sheet).parseSafe_program_POU()
+    assert summary_of(parse_variable_worksheet(var_sheet)) == summary_of(
+        parse_variable_worksheet(var_sheet, HEADER_PARSER_ANTLR)
+    )
+
+
+@pytest.mark.parametrize(
+    "original, replacement",
+    [
+        ("In_0 : BOOL;", "Feedback : BOOL;"),
+        ("In_0 : BOOL;", "LINE : BOOL;"),
+        ("In_0 : BOOL;", "SAFEBOOL : BOOL;"),
+        ("In_0 : BOOL;", "In_0 : Group;"),
+        ("PROGRAM Wide", "PROGRAM END_VAR"),
+    ],
+    ids=["feedback keyword", "line keyword", "type keyword", "keyword as type", "keyword as program name"],
+)
+def test_given_keyword_as_identifier_handwritten_parser_raises_and_default_falls_back_to_antlr(original, replacement):
+    var_sheet = var_sheet_of(wide_program(4, 2)).replace(original, replacement, 1)
+    with pytest.raises(POUHeaderSyntaxError):
+        POUHeaderParser(var_sheet).parseSafe_program_POU()
+    # The visitor of the ANTLR parser may fail on what the grammar recovered from as well
+    assert outcome_of(var_sheet, HEADER_PARSER_HANDWRITTEN) == outcome_of(var_sheet, HEADER_PARSER_ANTLR)
+
+
+def outcome_of(var_sheet, backend):
+    """The summary of the parsed variable worksheet, or the type of the error raised by parsing it"""
+    try:
+        return summary_of(parse_variable_worksheet(var_sheet, backend))
+    except Exception as e:
+        return type(e)
+
+
+def test_given_unknown_header_parser_raises_value_error():
+    with pytest.raises(ValueError):
+        parse_variable_worksheet(var_sheet_of(wide_program(4, 2)), "not_a_backend")
+
+
+def parse_times(var_sheet, repetitions=3):
+    """Best time of parsing the variable worksheet with each backend"""
+    timings = {}
+    for backend in [HEADER_PARSER_ANTLR, HEADER_PARSER_HANDWRITTEN]:
+        runs = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            parse_variable_worksheet(var_sheet, backend)
+            runs.append(time.perf_counter() - start)
+        timings[backend] = min(runs)
+    return timings
+
+
+if __name__ == "__main__":
+    for nr_of_blocks in [2000, 20000]:
+        var_sheet = var_sheet_of(large_program(nr_of_blocks))
+        # large_program has two variables per network of ten blocks
+        nr_of_variables = len(parse_variable_worksheet(var_sheet).varHeader.getAllVariables())
+        print(f"Variable worksheet parse of {nr_of_variables} variables ({nr_of_blocks} blocks): "
+              f"{parse_times(var_sheet)}")
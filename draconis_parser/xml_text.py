@@ -0,0 +1,56 @@
+import re
+
+from antlr_generated.python.XMLLexer import XMLLexer
+
+# The entities every XML document knows, without declaring them
+PREDEFINED_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+REFERENCE = re.compile(r"&([^;]*);")
+# Tokens which are part of the text of an element: character data, references and CDATA sections
+TEXT_TOKEN_TYPES = {XMLLexer.TEXT, XMLLexer.SEA_WS, XMLLexer.EntityRef, XMLLexer.CharRef, XMLLexer.CDATA}
+
+
+def decode_reference(name: str) -> str:
+    """The character of an entity or character reference, given without its '&' and ';'"""
+    if name.startswith("#x"):
+        return chr(int(name[2:], 16))
+    if name.startswith("#"):
+        return chr(int(name[1:]))
+    if name not in PREDEFINED_ENTITIES:
+        raise ValueError(f"Undefined entity &{name};")
+    return PREDEFINED_ENTITIES[name]
+
+
+def normalize_line_ends(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def attribute_value(string_token: str) -> str:
+    """
+    The value of an attribute, given the text of its STRING token, as an XML parser gives it:
+    without its quotes, with references replaced, and with tabs and line ends as spaces
+    """
+    value = string_token[1:-1]
+    if "&" not in value and "\t" not in value and "\n" not in value and "\r" not in value:
+        return value
+    value = normalize_line_ends(value).replace("\t", " ").replace("\n", " ")
+    return REFERENCE.sub(lambda m: decode_reference(m.group(1)), value)
+
+
+def element_text(token_stream, start_index: int) -> str:
+    """
+    The text of an element as an XML parser gives it, given the index of the first token of its content:
+    the character data up to its first child node, with references replaced and CDATA sections unwrapped
+    """
+    parts = []
+    index = start_index
+    token = token_stream.get(index)
+    while token.type in TEXT_TOKEN_TYPES:
+        if token.type in (XMLLexer.EntityRef, XMLLexer.CharRef):
+            parts.append(decode_reference(token.text[1:-1]))
+        elif token.type == XMLLexer.CDATA:
+            parts.append(normalize_line_ends(token.text[len("<![CDATA["):-len("]]>")]))
+        else:
+            parts.append(normalize_line_ends(token.text))
+        index += 1
+        token = token_stream.get(index)
+    return "".join(parts)
@@ -1,5 +1,5 @@
 from enum import IntEnum
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 
 class ChangeType(IntEnum):
     DELETION = -1
@@ -7,6 +7,12 @@ class ChangeType(IntEnum):
     ADDITION = 1
 
 
+def _field_names(obj):
+    # Slotted dataclasses have no instance __dict__
+    names = [f.name for f in fields(obj)] if is_dataclass(obj) else vars(obj)
+    return [f for f in names if f[0] != '_']
+
+
 @dataclass()
 class Delta:
     def __init__(self, changeType, fromObject, toObject):
@@ -48,8 +54,8 @@ class Delta:
             res = [
                 f"The following properties have been modified for variable '{self.fromObject.getName()}'",
             ]
-            from_field_value_pairs = dict((f, getattr(self.fromObject, f)) for f in vars(self.fromObject) if f[0] != '_' )
-            to_field_value_pairs = dict((f, getattr(self.toObject, f)) for f in vars(self.toObject) if f[0] != '_' )
+            from_field_value_pairs = dict((f, getattr(self.fromObject, f)) for f in _field_names(self.fromObject))
+            to_field_value_pairs = dict((f, getattr(self.toObject, f)) for f in _field_names(self.toObject))
             for f, v1 in from_field_value_pairs.items():
                 v2 = to_field_value_pairs.get(f, "FIELD_DOES_NOT_EXIST")
                 if v2 == "FIELD_DOES_NOT_EXIST" or v1 != v2:
@@ -3,7 +3,7 @@ import json
 from dataclasses import dataclass
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Point:
     x: int
     y: int
@@ -2,7 +2,7 @@ import dataclasses
 import json
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GUIPosition:
     isRelativePosition: bool
     x: int